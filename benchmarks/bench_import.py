@@ -0,0 +1,136 @@
+"""Import-time cost of the integration on top of what Home Assistant loads.
+
+Runs `python -X importtime` in a fresh interpreter that first imports the
+Home Assistant modules bootstrap has already loaded by the time an
+integration is imported (core, config entries, the sensor/weather/http
+components...), then imports the integration package and, separately,
+each platform on top of the previous targets. Only what the integration
+adds is counted.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 10 --json import.json
+
+Reports the median cumulative import time per target and the slowest
+modules it pulled in. The integration is byte-compiled first, so stale or
+missing .pyc files do not count. Requires Home Assistant.
+"""
+from __future__ import annotations
+
+import argparse
+import compileall
+import json
+import statistics
+import subprocess
+import sys
+
+from common import INTEGRATION_DIR, REPO_ROOT
+
+DEFAULT_RUNS = 5
+TOP_MODULES = 15
+
+# Already imported by Home Assistant before any custom integration loads
+PRELUDE = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.dispatcher",
+    "homeassistant.components.http",
+    "homeassistant.components.sensor",
+    "homeassistant.components.weather",
+)
+
+# What HA imports, in order: the package when the entry is set up, then
+# the platforms it forwards to, then the config flow when one is opened
+TARGETS = (
+    "accuweather",
+    "accuweather.sensor",
+    "accuweather.weather",
+    "accuweather.config_flow",
+)
+
+
+def measure(target: str, preloaded: tuple[str, ...]) -> tuple[float, dict[str, float]]:
+    """Return (cumulative ms, {module: self ms}) for importing `target` once.
+
+    Only what `target` adds after PRELUDE and `preloaded` counts.
+    """
+    code = (
+        "import sys; "
+        f"sys.path.insert(0, {str(REPO_ROOT / 'custom_components')!r}); "
+        + "".join(f"import {module}; " for module in (*PRELUDE, *preloaded))
+        + "print('--mark--', file=sys.stderr, flush=True); "
+        + f"import {target}"
+    )
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=False,
+    )
+    if child.returncode:
+        sys.stderr.write(child.stderr)
+        sys.exit(f"Importing {target} failed")
+    lines = child.stderr.split("--mark--", 1)[1].splitlines()
+    modules: dict[str, float] = {}
+    total_us = 0
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[12:].split("|")
+        if not own.strip().isdigit():
+            continue  # header line
+        modules[name.strip()] = int(own) / 1000
+        # Top-level entries are indented by one space only; their cumulative
+        # times add up to the total
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    """Measure every target and print/save the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    # Measure imports, not compiling sources to bytecode, as HA would
+    compileall.compile_dir(INTEGRATION_DIR, quiet=1)
+
+    report = {}
+    for index, target in enumerate(TARGETS):
+        totals = []
+        own: dict[str, list[float]] = {}
+        for _ in range(args.runs):
+            total, modules = measure(target, TARGETS[:index])
+            totals.append(total)
+            for name, ms in modules.items():
+                own.setdefault(name, []).append(ms)
+        slowest = sorted(
+            ((statistics.median(times), name) for name, times in own.items()),
+            reverse=True,
+        )[:TOP_MODULES]
+        report[target] = {
+            "median_ms": round(statistics.median(totals), 1),
+            "modules": len(own),
+            "third_party": sorted(
+                {name.split(".", 1)[0] for name in own if not name.startswith("accuweather")}
+            ),
+            "slowest": {name: round(ms, 2) for ms, name in slowest},
+        }
+
+    for target, result in report.items():
+        print(f"{target}: {result['median_ms']} ms, {result['modules']} modules")
+        print(f"  also imports: {', '.join(result['third_party']) or '-'}")
+        for name, ms in result["slowest"].items():
+            print(f"  {ms:8.2f} ms  {name}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Offline benchmark and golden-output check for the AccuWeather parsers.
+
+Runs every parse_*_html function over the stored page corpus in
+benchmarks/corpus (plus map_condition_to_ha over every known phrase) and
+reports latency percentiles, peak traced memory and blocks retained by the
+result. Each output is compared with benchmarks/golden/<case>.json and each
+median latency with benchmarks/baseline.json, and each embedded-payload
+case with its DOM-only counterpart (PARITY). Each page is also read
+through the integration's streamed fetch from a local server, and must
+parse the same as the whole page: a page whose data the end-marker cut-off
+drops fails. No network access is needed.
+
+Usage, from the repository root:
+
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --runs 200 --threshold 0.25
+    python benchmarks/bench_parsers.py --update-golden --update-baseline
+    python benchmarks/bench_parsers.py --json report.json
+
+Exits with status 1 when an output differs from its golden file, its DOM
+counterpart or its streamed read, or a median exceeds baseline *
+(1 + threshold) by more than --min-delta-ms.
+Baselines are machine-specific; regenerate them with --update-baseline on
+the machine that runs the check.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from array import array
+import dataclasses
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from common import BENCH_DIR, GOLDEN_DIR, corpus_pages, load_module
+
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+DEFAULT_RUNS = 50
+DEFAULT_THRESHOLD = 0.25
+# Regressions smaller than this are timer noise on sub-millisecond cases
+DEFAULT_MIN_DELTA_MS = 0.25
+
+# Case -> case with the same data that the DOM parser reads: the embedded
+# extractors must return what the DOM parsers return for the same page
+PARITY = {
+    "current_embedded": "current",
+    "current_late": "current",
+    "daily_embedded": "daily",
+    "hourly_embedded": "hourly",
+}
+
+PARSERS = {
+    "current": ("parse_weather_html", ()),
+    "daily": ("parse_daily_html", ()),
+    "hourly": ("parse_hourly_html", ()),
+    "air": ("parse_air_html", ()),
+    "health": ("parse_health_html", ("health",)),
+    "minutecast": ("parse_minutecast_html", ()),
+}
+
+
+def normalize(value: Any) -> Any:
+    """Convert a parser result to plain JSON types for golden comparison."""
+    if dataclasses.is_dataclass(value):
+        return normalize(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, array)):
+        return [normalize(v) for v in value]
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of an already sorted list."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def measure(call, runs: int) -> dict[str, Any]:
+    """Time call() `runs` times, then trace memory for one extra run."""
+    for _ in range(3):
+        call()
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            started = time.perf_counter_ns()
+            call()
+            timings.append((time.perf_counter_ns() - started) / 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    timings.sort()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "runs": runs,
+        "min_ms": round(timings[0], 3),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p90_ms": round(percentile(timings, 90), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "max_ms": round(timings[-1], 3),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_blocks": retained,
+        "result": result,
+    }
+
+
+async def read_streamed(utils, pages: dict[str, tuple[str, str]]) -> dict[str, str | None]:
+    """Return each page as _fetch_with_retry reads it from a local server.
+
+    That is the body up to where reading stops for the page type, which is
+    all the parsers get in production.
+    """
+
+    async def page(request: web.Request) -> web.Response:
+        _, html = pages[request.match_info["case"]]
+        return web.Response(text=html, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{case}", page)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    bodies = {}
+    try:
+        async with aiohttp.ClientSession() as session:
+            for case, (page_type, _) in pages.items():
+                # Each page on its own: no memory of earlier pages lacking a payload
+                utils._payload_missing.clear()  # noqa: SLF001
+                bodies[case] = await utils._fetch_with_retry(  # noqa: SLF001
+                    session, f"http://127.0.0.1:{port}/{case}",
+                    utils.get_headers(), page_type,
+                )
+    finally:
+        await runner.cleanup()
+    return bodies
+
+
+def main() -> int:
+    """Run the benchmark and return the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative p50 regression (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="ignore regressions smaller than this many ms")
+    parser.add_argument("--only", help="comma-separated case names to run")
+    parser.add_argument("--update-golden", action="store_true")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    utils = load_module("utils")
+    css_selectors = load_module("css_selectors")
+    const = load_module("const")
+    loop = asyncio.new_event_loop()
+
+    pages = corpus_pages()
+    cases: dict[str, Any] = {}
+    for case, (page_type, html) in pages.items():
+        name, extra = PARSERS[page_type]
+        func = getattr(utils, name)
+        cases[case] = (
+            lambda func=func, html=html, extra=extra:
+            loop.run_until_complete(func(html, *extra))
+        )
+    phrases = [*const.CONDITION_MAP_VI, *const.CONDITION_MAP, "không rõ", "unknown sky"]
+    cases["map_condition_to_ha"] = lambda: [utils.map_condition_to_ha(p) for p in phrases]
+    if args.only:
+        wanted = set(args.only.split(","))
+        cases = {k: v for k, v in cases.items() if k in wanted}
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    report: dict[str, Any] = {}
+    outputs: dict[str, Any] = {}
+    failures = []
+
+    header = (
+        f"{'case':22} {'min':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} "
+        f"{'peakKiB':>8} {'blocks':>7}  golden  baseline"
+    )
+    print(header)
+    print("-" * len(header))
+    for case, call in cases.items():
+        stats = measure(call, args.runs)
+        output = normalize(stats.pop("result"))
+        outputs[case] = output
+
+        golden_path = GOLDEN_DIR / f"{case}.json"
+        if args.update_golden:
+            golden_path.write_text(
+                json.dumps(output, ensure_ascii=False, indent=1, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+            golden = "written"
+        elif not golden_path.exists():
+            golden = "missing"
+        elif json.loads(golden_path.read_text(encoding="utf-8")) == output:
+            golden = "ok"
+        else:
+            golden = "DIFF"
+            failures.append(f"{case}: output differs from {golden_path.name}")
+
+        base = baseline.get(case, {}).get("p50_ms")
+        if base is None or args.update_baseline:
+            regression = "-"
+        else:
+            ratio = stats["p50_ms"] / base
+            regression = f"{ratio:.2f}x"
+            if (
+                ratio > 1 + args.threshold
+                and stats["p50_ms"] - base > args.min_delta_ms
+            ):
+                regression += " FAIL"
+                failures.append(
+                    f"{case}: p50 {stats['p50_ms']} ms > {base} ms "
+                    f"+{args.threshold:.0%}"
+                )
+        stats["golden"] = golden
+        stats["baseline_ratio"] = regression
+        report[case] = stats
+        print(
+            f"{case:22} {stats['min_ms']:8.3f} {stats['p50_ms']:8.3f} "
+            f"{stats['p90_ms']:8.3f} {stats['p99_ms']:8.3f} {stats['max_ms']:8.3f} "
+            f"{stats['peak_kib']:8.1f} {stats['retained_blocks']:7d}  "
+            f"{golden:6}  {regression}"
+        )
+
+    for case, dom_case in PARITY.items():
+        if case in outputs and dom_case in outputs and outputs[case] != outputs[dom_case]:
+            failures.append(f"{case}: output differs from the DOM parse of {dom_case}")
+
+    pages = {case: page for case, page in pages.items() if case in cases}
+    print(f"\n{'streamed read':22} {'KiB read':>8} {'of KiB':>8}  output")
+    for case, body in loop.run_until_complete(read_streamed(utils, pages)).items():
+        page_type, html = pages[case]
+        name, extra = PARSERS[page_type]
+        if body is None:
+            streamed = "FETCH FAILED"
+        else:
+            result = loop.run_until_complete(getattr(utils, name)(body, *extra))
+            streamed = "ok" if normalize(result) == outputs[case] else "DIFF"
+        if streamed != "ok":
+            failures.append(f"{case}: streamed read parses differently ({streamed})")
+        read_kib = len(body or "") / 1024
+        print(f"{case:22} {read_kib:8.1f} {len(html) / 1024:8.1f}  {streamed}")
+        report[case]["streamed"] = streamed
+
+    compile_stats = css_selectors.compile_stats()
+    print(
+        f"\nCSS selectors: {compile_stats['compiled']}/{compile_stats['registered']} "
+        f"compiled in {compile_stats['compile_ms']} ms (once, outside the timings above)"
+    )
+    report["_css_compile"] = compile_stats
+
+    if args.update_baseline:
+        BASELINE_FILE.write_text(
+            json.dumps(
+                {case: {"p50_ms": report[case]["p50_ms"]} for case in cases},
+                indent=1, sort_keys=True,
+            ) + "\n"
+        )
+        print(f"Baseline written to {BASELINE_FILE}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=1)
+
+    loop.close()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Simulated refresh scheduling: observation alignment and fleet phases.
+
+A simulated location publishes a current-conditions observation every
+--cadence minutes, --lag minutes after its clock time (with up to
+--jitter minutes of noise), in a UTC+--tz time zone. The same refresh
+loop runs twice over --refreshes refreshes: once at the plain interval
+with a random phase, once with each delay moved by ObservationClock.align.
+
+    python benchmarks/bench_polling.py
+    python benchmarks/bench_polling.py --cadence 60 --lag 12 --interval 1800
+    python benchmarks/bench_polling.py --fleet 1,10,50,200
+
+Reports redundant fetches (same observation as the previous refresh) and
+the mean staleness of new observations when first fetched.
+
+With --fleet, that many locations set up together refresh every
+--interval seconds for --hours, once as before (same start, same
+interval) and once on FleetPlanner phases, and the peak number of
+refreshes in flight and of refresh starts per minute after the first
+interval (setup refreshes everything at once) are reported.
+No network or Home Assistant needed.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+
+from common import load_module
+
+REFRESH_SECONDS = 6  # a refresh's own duration, before the next delay starts
+
+
+def simulate(args: argparse.Namespace, aligned: bool) -> dict[str, float]:
+    """Run one refresh loop and return its redundant fetches and staleness."""
+    polling = load_module("polling")
+    rng = random.Random(args.seed)
+    clock = polling.ObservationClock()
+    now = 1_700_000_000 + rng.random() * 3600
+    seen: set[float] = set()
+    staleness = []
+    redundant = 0
+    for _ in range(args.refreshes):
+        jitter = rng.uniform(-args.jitter, args.jitter)
+        local = now / 60 + args.tz * 60
+        observation = ((local - args.lag - jitter) // args.cadence) * args.cadence
+        published = (observation + args.lag + jitter - args.tz * 60) * 60
+        if observation in seen:
+            redundant += 1
+        else:
+            seen.add(observation)
+            staleness.append((now - published) / 60)
+        minute = int(observation % 1440)
+        clock.observe(f"{minute // 60}:{minute % 60:02d}", now)
+        now += REFRESH_SECONDS
+        delay = clock.align(now, args.interval) if aligned else None
+        now += delay or args.interval
+    return {
+        "redundant": redundant,
+        "staleness_min": round(statistics.mean(staleness), 2),
+        "cadence_learned": clock.cadence,
+    }
+
+
+def simulate_fleet(args: argparse.Namespace, size: int, phased: bool) -> dict[str, int]:
+    """Return peak concurrent refreshes and starts per minute for a fleet."""
+    polling = load_module("polling")
+    rng = random.Random(args.seed)
+    planner = polling.FleetPlanner()
+    keys = [str(rng.randrange(10**5, 10**7)) for _ in range(size)]
+    for key in keys:
+        planner.add(key)
+    start = 1_700_000_000.0
+    refreshes = []  # (start, end)
+    for key in keys:
+        # Like DataUpdateCoordinator: up to 1 s of jitter, next refresh
+        # scheduled `delay` after the previous one ends
+        now = start + rng.random()
+        while now < start + args.hours * 3600:
+            end = now + REFRESH_SECONDS * rng.uniform(0.8, 1.5)
+            refreshes.append((now, end))
+            delay = (
+                polling.phase_delay(end, args.interval, planner.phase(key))
+                if phased else args.interval
+            )
+            now = end + delay
+    events = sorted(
+        [(begin, 1) for begin, _ in refreshes] + [(end, -1) for _, end in refreshes]
+    )
+    # Ignore the first interval: every location refreshes at setup
+    starts = [begin for begin, _ in refreshes if begin >= start + args.interval]
+    per_minute: dict[int, int] = {}
+    for begin in starts:
+        per_minute[int(begin // 60)] = per_minute.get(int(begin // 60), 0) + 1
+    in_flight = peak = 0
+    for when, change in events:
+        in_flight += change
+        if when >= start + args.interval:
+            peak = max(peak, in_flight)
+    return {
+        "peak_in_flight": peak,
+        "peak_starts_per_minute": max(per_minute.values(), default=0),
+    }
+
+
+def main() -> None:
+    """Compare both loops and print the result."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--cadence", type=int, default=20, help="minutes")
+    parser.add_argument("--lag", type=float, default=6, help="minutes")
+    parser.add_argument("--jitter", type=float, default=0.5, help="minutes")
+    parser.add_argument("--tz", type=float, default=7, help="UTC offset, hours")
+    parser.add_argument("--interval", type=float, default=1200, help="seconds")
+    parser.add_argument("--refreshes", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--fleet", help="comma-separated location counts")
+    parser.add_argument("--hours", type=float, default=6)
+    args = parser.parse_args()
+
+    if args.fleet:
+        print(f"{'locations':>9}  {'in flight':>17}  {'starts/min':>17}")
+        print(f"{'':9}  {'before':>8} {'phased':>8}  {'before':>8} {'phased':>8}")
+        for size in (int(n) for n in args.fleet.split(",")):
+            before = simulate_fleet(args, size, phased=False)
+            phased = simulate_fleet(args, size, phased=True)
+            print(
+                f"{size:9d}  {before['peak_in_flight']:8d} {phased['peak_in_flight']:8d}  "
+                f"{before['peak_starts_per_minute']:8d} "
+                f"{phased['peak_starts_per_minute']:8d}"
+            )
+        return
+
+    for name, aligned in (("fixed phase", False), ("aligned", True)):
+        result = simulate(args, aligned)
+        print(
+            f"{name:12} redundant {result['redundant']:4d}/{args.refreshes}  "
+            f"staleness {result['staleness_min']:5.2f} min  "
+            f"cadence learned {result['cadence_learned']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
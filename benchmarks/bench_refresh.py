@@ -0,0 +1,254 @@
+"""End-to-end refresh benchmark against the local AccuWeather stub.
+
+Starts benchmarks/stub_server.py in a subprocess, points the integration at
+it through ACCUWEATHER_BASE_URL and runs N AccuWeatherDataUpdateCoordinator
+instances (each with its own session, as in async_setup_entry) for a number
+of refresh rounds. Reports refresh latency, requests per refresh, body bytes
+read (from the integration's own STREAM_STATS), failures and event-loop lag. Requires Home Assistant to be installed.
+
+    python benchmarks/bench_refresh.py --locations 10 --rounds 3 \\
+        --latency-ms 120 --errors 429=0.05 --retry-after 1 --json refresh.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import os
+import signal
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from common import BENCH_DIR, REPO_ROOT
+from stub_server import add_stub_arguments
+
+LAG_INTERVAL = 0.05  # seconds between event-loop lag probes
+
+
+@dataclass
+class RequestCounter:
+    """Requests started on one session."""
+
+    requests: int = 0
+
+
+def _trace_config(counter: RequestCounter):
+    """Return an aiohttp TraceConfig that feeds a RequestCounter."""
+    import aiohttp
+
+    async def on_request_start(session, context, params) -> None:
+        counter.requests += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(on_request_start)
+    return trace
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    """Return min/p50/p90/p99/max of a list of numbers."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        p50 = p90 = p99 = ordered[0]
+    else:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    return {
+        "min": round(ordered[0], 2),
+        "p50": round(p50, 2),
+        "p90": round(p90, 2),
+        "p99": round(p99, 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+async def spawn_stub(stub_args: list[str]) -> tuple[asyncio.subprocess.Process, str]:
+    """Start the stub server on a free port and return (process, base URL)."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(BENCH_DIR / "stub_server.py"), "--port", "0", *stub_args,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    line = (await process.stdout.readline()).decode()
+    return process, line.rsplit(" ", 1)[-1].strip()
+
+
+async def stop_stub(process: asyncio.subprocess.Process) -> dict[str, Any]:
+    """Stop the stub and return the counters it printed on exit."""
+    # SIGINT rather than SIGTERM so the stub's finally block prints its stats
+    process.send_signal(signal.SIGINT)
+    output, _ = await process.communicate()
+    try:
+        return json.loads(output.decode().strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {}
+
+
+class LagMonitor:
+    """Sample event-loop lag as the overshoot of a short periodic sleep."""
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LAG_INTERVAL)
+            self.samples.append((loop.time() - started - LAG_INTERVAL) * 1000)
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+async def setup_fleet(hass, count: int) -> list[tuple[Any, RequestCounter]]:
+    """Create `count` coordinators, each on its own counted session."""
+    from accuweather import _get_accuweather_session, _get_fetch_metrics
+    from accuweather.coordinator import AccuWeatherDataUpdateCoordinator
+
+    fleet = []
+    for index in range(count):
+        location_key = str(353412 + index)
+        counter = RequestCounter()
+        session = await _get_accuweather_session(
+            hass, location_key, trace_configs=[_trace_config(counter)]
+        )
+        coordinator = AccuWeatherDataUpdateCoordinator(
+            hass, session, location_key, f"Hà Nội {index}", None,
+            fetch_metrics=_get_fetch_metrics(location_key),
+        )
+        fleet.append((coordinator, counter))
+    return fleet
+
+
+async def refresh_round(fleet) -> list[dict[str, Any]]:
+    """Refresh every coordinator concurrently and return per-refresh samples."""
+
+    async def one(coordinator, counter: RequestCounter) -> dict[str, Any]:
+        requests = counter.requests
+        started = time.perf_counter()
+        await coordinator.async_refresh()
+        return {
+            "seconds": time.perf_counter() - started,
+            "requests": counter.requests - requests,
+            "ok": coordinator.last_update_success,
+        }
+
+    return await asyncio.gather(*(one(c, counter) for c, counter in fleet))
+
+
+def summarize(
+    samples: list[dict[str, Any]], lag: list[float], stream_stats: dict
+) -> dict[str, Any]:
+    """Aggregate refresh, lag and stream samples into a report."""
+    refreshes = max(len(samples), 1)
+    return {
+        "refreshes": len(samples),
+        "failures": sum(1 for s in samples if not s["ok"]),
+        "refresh_seconds": _distribution([s["seconds"] for s in samples]),
+        "requests_per_refresh": _distribution([s["requests"] for s in samples]),
+        "kib_read_per_refresh": round(
+            sum(s.bytes_read for s in stream_stats.values()) / 1024 / refreshes, 1
+        ),
+        "kib_skipped_per_refresh": round(
+            sum(s.bytes_skipped for s in stream_stats.values()) / 1024 / refreshes, 1
+        ),
+        "kib_drained_per_refresh": round(
+            sum(s.bytes_drained for s in stream_stats.values()) / 1024 / refreshes, 1
+        ),
+        "loop_lag_ms": _distribution(lag),
+    }
+
+
+async def close_fleet(hass) -> None:
+    """Close the per-location sessions created by setup_fleet."""
+    from accuweather import _sessions
+
+    for session in list(_sessions.values()):
+        await session.close()
+    _sessions.clear()
+    await hass.async_stop(force=True)
+
+
+async def run(args: argparse.Namespace, stub_args: list[str]) -> dict[str, Any]:
+    """Run the benchmark and return the report."""
+    process, base_url = await spawn_stub(stub_args)
+    # Must be set before the integration's const module is imported
+    os.environ["ACCUWEATHER_BASE_URL"] = base_url
+    sys.path.insert(0, str(REPO_ROOT / "custom_components"))
+    from homeassistant.core import HomeAssistant
+
+    monitor = LagMonitor()
+    samples: list[dict[str, Any]] = []
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            fleet = await setup_fleet(hass, args.locations)
+            monitor.start()
+            for _ in range(args.rounds):
+                samples.extend(await refresh_round(fleet))
+            await monitor.stop()
+            await close_fleet(hass)
+    finally:
+        stub_stats = await stop_stub(process)
+
+    from accuweather.utils import STREAM_STATS
+
+    report = summarize(samples, monitor.samples, STREAM_STATS)
+    report["locations"] = args.locations
+    report["stub"] = stub_stats
+    return report
+
+
+def stub_argv(args: argparse.Namespace) -> list[str]:
+    """Rebuild the stub_server.py command line from parsed stub options."""
+    argv = [
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--bandwidth-kbps", str(args.bandwidth_kbps),
+        "--reset-rate", str(args.reset_rate),
+        "--variant", args.variant,
+    ]
+    if args.errors:
+        argv += ["--errors", args.errors]
+    if args.retry_after is not None:
+        argv += ["--retry-after", str(args.retry_after)]
+    if args.seed is not None:
+        argv += ["--seed", str(args.seed)]
+    return argv
+
+
+def main() -> None:
+    """Parse arguments, run, print and optionally save the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--locations", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--json", help="also write the report to this file")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args, stub_argv(args)))
+    print(json.dumps(report, indent=1))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Scale test: event-loop lag, CPU, memory and state writes vs. location count.
+
+For each scale (1, 10, 50 and 200 locations by default) a fresh process
+starts the local stub, sets up that many coordinators with their real
+weather and sensor entities (via the platforms' async_setup_entry and a
+Home Assistant EntityPlatform) and runs a number of refresh cycles. Each
+scale reports:
+
+- event-loop lag percentiles while refreshing
+- CPU seconds per refresh cycle (all locations) and per location refresh
+- RSS before setup, after setup and after the cycles
+- entity state writes per cycle and per second, and how many of them
+  actually changed a state (state_changed events)
+
+    python benchmarks/bench_scale.py --json scale-2024.10.json
+    python benchmarks/bench_scale.py --scales 1,10 --compare scale-2024.10.json
+
+Requires Home Assistant. Stub options (--latency-ms, --errors, ...) are
+passed through to benchmarks/stub_server.py.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from bench_refresh import (
+    LagMonitor,
+    _distribution,
+    close_fleet,
+    setup_fleet,
+    spawn_stub,
+    stop_stub,
+    stub_argv,
+)
+from common import BENCH_DIR, REPO_ROOT
+from stub_server import add_stub_arguments
+
+DEFAULT_SCALES = "1,10,50,200"
+DEFAULT_CYCLES = 3
+
+# Report keys compared by --compare, lower is better for all of them
+COMPARED = (
+    ("loop_lag_ms", "p99"),
+    ("loop_lag_ms", "max"),
+    ("cpu_seconds_per_cycle", None),
+    ("rss_growth_mib", None),
+    ("state_writes_per_cycle", None),
+)
+
+
+def rss_mib() -> float:
+    """Return the current resident set size in MiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        # Not Linux: fall back to the peak, which is all getrusage offers
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+async def add_entities(hass, fleet) -> int:
+    """Create every coordinator's weather and sensor entities; return the count."""
+    from homeassistant import loader
+    from homeassistant.helpers import (
+        device_registry as dr,
+        entity,
+        entity_registry as er,
+    )
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    from accuweather import sensor, weather
+    from accuweather.const import DOMAIN
+
+    # What bootstrap does before any platform is set up
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    platforms = {
+        module: EntityPlatform(
+            hass=hass,
+            logger=module._LOGGER,  # noqa: SLF001
+            domain=module.__name__.rsplit(".", 1)[-1],
+            platform_name=DOMAIN,
+            platform=None,
+            # Coordinator entities are not polled; the interval is unused
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        for module in (weather, sensor)
+    }
+
+    added = 0
+    for coordinator, _ in fleet:
+        entry = SimpleNamespace(entry_id=coordinator.location_key)
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        for module, entity_platform in platforms.items():
+            entities: list = []
+            await module.async_setup_entry(
+                hass, entry, lambda new, update=False: entities.extend(new)
+            )
+            await entity_platform.async_add_entities(entities)
+            added += len(entities)
+    return added
+
+
+async def run_scale(locations: int, cycles: int, stub_args: list[str]) -> dict[str, Any]:
+    """Measure one scale in this process and return its report."""
+    process, base_url = await spawn_stub(stub_args)
+    os.environ["ACCUWEATHER_BASE_URL"] = base_url
+    sys.path.insert(0, str(REPO_ROOT / "custom_components"))
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity
+
+    report: dict[str, Any] = {"locations": locations, "cycles": cycles}
+    counts = {"writes": 0, "changes": 0}
+    write_state = Entity.async_write_ha_state
+
+    def counted_write(entity) -> None:
+        counts["writes"] += 1
+        write_state(entity)
+
+    def count_change(event) -> None:
+        counts["changes"] += 1
+
+    Entity.async_write_ha_state = counted_write
+
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            report["rss_start_mib"] = round(rss_mib(), 1)
+            hass = HomeAssistant(config_dir)
+            fleet = await setup_fleet(hass, locations)
+            # One refresh first so health activity sensors exist, as at setup
+            await asyncio.gather(*(c.async_refresh() for c, _ in fleet))
+            report["entities"] = await add_entities(hass, fleet)
+            hass.bus.async_listen(EVENT_STATE_CHANGED, count_change)
+            await hass.async_block_till_done()
+            report["rss_after_setup_mib"] = round(rss_mib(), 1)
+
+            monitor = LagMonitor()
+            monitor.start()
+            cpu_cycles, wall_cycles, failures = [], [], 0
+            counts.update(writes=0, changes=0)
+            for _ in range(cycles):
+                cpu, wall = time.process_time(), time.perf_counter()
+                await asyncio.gather(*(c.async_refresh() for c, _ in fleet))
+                await hass.async_block_till_done()
+                cpu_cycles.append(time.process_time() - cpu)
+                wall_cycles.append(time.perf_counter() - wall)
+                failures += sum(1 for c, _ in fleet if not c.last_update_success)
+            await monitor.stop()
+
+            report["rss_end_mib"] = round(rss_mib(), 1)
+            report["rss_growth_mib"] = round(
+                report["rss_end_mib"] - report["rss_start_mib"], 1
+            )
+            report["loop_lag_ms"] = _distribution(monitor.samples)
+            report["cpu_seconds_per_cycle"] = round(sum(cpu_cycles) / cycles, 3)
+            report["cpu_ms_per_location_refresh"] = round(
+                sum(cpu_cycles) / cycles / locations * 1000, 2
+            )
+            report["wall_seconds_per_cycle"] = round(sum(wall_cycles) / cycles, 2)
+            report["state_writes_per_cycle"] = round(counts["writes"] / cycles, 1)
+            report["state_writes_per_second"] = round(
+                counts["writes"] / max(sum(wall_cycles), 1e-9), 1
+            )
+            report["state_changes_per_cycle"] = round(counts["changes"] / cycles, 1)
+            report["failed_refreshes"] = failures
+            await close_fleet(hass)
+    finally:
+        Entity.async_write_ha_state = write_state
+        report["stub"] = await stop_stub(process)
+    return report
+
+
+def _metadata() -> dict[str, Any]:
+    """Describe what was measured, so reports can be compared across releases."""
+    try:
+        revision = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=False,
+        ).stdout.strip()
+    except OSError:
+        revision = ""
+    manifest = json.loads(
+        (REPO_ROOT / "custom_components" / "accuweather" / "manifest.json").read_text()
+    )
+    try:
+        from homeassistant.const import __version__ as ha_version
+    except ImportError:
+        ha_version = None
+    return {
+        "integration_version": manifest.get("version"),
+        "revision": revision,
+        "home_assistant": ha_version,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _lookup(result: dict[str, Any], key: str, sub: str | None) -> float | None:
+    value = result.get(key)
+    if sub is not None:
+        value = (value or {}).get(sub)
+    return value
+
+
+def print_table(results: list[dict[str, Any]], previous: dict[int, dict] | None) -> None:
+    """Print one row per scale, with the ratio to a previous report if given."""
+    header = (
+        f"{'locations':>9} {'entities':>8} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} "
+        f"{'cpu/cyc s':>9} {'cpu/loc ms':>10} {'rss +MiB':>8} {'writes/cyc':>10} "
+        f"{'writes/s':>8} {'changes/cyc':>11} {'failed':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        lag = result["loop_lag_ms"]
+        print(
+            f"{result['locations']:9d} {result['entities']:8d} {lag.get('p50', 0):8.2f} "
+            f"{lag.get('p99', 0):8.2f} {lag.get('max', 0):8.2f} "
+            f"{result['cpu_seconds_per_cycle']:9.3f} "
+            f"{result['cpu_ms_per_location_refresh']:10.2f} "
+            f"{result['rss_growth_mib']:8.1f} {result['state_writes_per_cycle']:10.1f} "
+            f"{result['state_writes_per_second']:8.1f} "
+            f"{result['state_changes_per_cycle']:11.1f} {result['failed_refreshes']:6d}"
+        )
+        old = (previous or {}).get(result["locations"])
+        if old is None:
+            continue
+        for key, sub in COMPARED:
+            new_value, old_value = _lookup(result, key, sub), _lookup(old, key, sub)
+            if new_value is not None and old_value:
+                label = f"{key}.{sub}" if sub else key
+                print(f"{'':9}   {label:28} {old_value:>10} -> {new_value:<10} "
+                      f"({new_value / old_value:.2f}x)")
+
+
+def main() -> None:
+    """Run each scale in a fresh subprocess and print/save the combined report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help="comma-separated location counts")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--compare", help="previous --json report to compare with")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        # Child process: measure one scale and hand the result to the parent
+        result = asyncio.run(run_scale(args.single, args.cycles, stub_argv(args)))
+        print(json.dumps(result))
+        return
+
+    results = []
+    for scale in (int(s) for s in args.scales.split(",")):
+        print(f"Measuring {scale} location(s)...", file=sys.stderr, flush=True)
+        child = subprocess.run(
+            [sys.executable, str(BENCH_DIR / "bench_scale.py"), "--single", str(scale),
+             "--cycles", str(args.cycles), *stub_argv(args)],
+            capture_output=True, text=True, check=False,
+        )
+        if child.returncode:
+            sys.stderr.write(child.stderr)
+            sys.exit(f"Scale {scale} failed")
+        results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            previous = {r["locations"]: r for r in json.load(handle)["results"]}
+    print_table(results, previous)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"metadata": _metadata(), "stub_args": stub_argv(args),
+                       "results": results}, handle, indent=1)
+
+
+if __name__ == "__main__":
+    main()
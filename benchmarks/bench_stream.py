@@ -0,0 +1,182 @@
+"""Close or drain: what to do with the rest of a page after its end marker.
+
+Fetches one page type repeatedly, one request at a time on one session,
+through the integration's _fetch_with_retry, once per strategy:
+
+    close  - close the response, dropping the keep-alive connection
+    drain  - read and discard the rest, keeping the connection
+    auto   - the integration's default (drain up to STREAM_DRAIN_MAX_BYTES)
+
+The stub runs in a subprocess; a TCP proxy in front of it delays every
+segment by half of --rtt-ms each way, so new connections pay their TCP and
+TLS handshakes in round trips as they would against the real site. Only
+needs aiohttp and bs4 (plus cryptography for --tls).
+
+    python benchmarks/bench_stream.py --rtt-ms 80 --tls --gzip --tail-kb 380 \\
+        --bandwidth-kbps 2000 --fetches 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from bench_refresh import spawn_stub, stop_stub
+from common import load_module
+from stub_server import add_stub_arguments
+
+STRATEGIES = ("close", "drain", "auto")
+
+
+async def _pipe(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float
+) -> None:
+    """Forward reader to writer, every segment `delay` seconds later."""
+    queue: asyncio.Queue[tuple[float, bytes]] = asyncio.Queue()
+
+    async def send() -> None:
+        while True:
+            due, data = await queue.get()
+            if not data:
+                break
+            if (wait := due - time.monotonic()) > 0:
+                await asyncio.sleep(wait)
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    sender = asyncio.ensure_future(send())
+    try:
+        while data := await reader.read(64 * 1024):
+            queue.put_nowait((time.monotonic() + delay, data))
+    except ConnectionError:
+        pass
+    queue.put_nowait((time.monotonic() + delay, b""))
+    try:
+        await sender
+    except ConnectionError:
+        pass
+
+
+async def start_delay_proxy(target: str, rtt_ms: float) -> tuple[asyncio.Server, str]:
+    """Proxy to target's host:port adding rtt_ms per round trip; return its base URL."""
+    parts = urlsplit(target)
+    delay = rtt_ms / 2000
+
+    async def handle(client_reader, client_writer) -> None:
+        upstream_reader, upstream_writer = await asyncio.open_connection(
+            parts.hostname, parts.port
+        )
+        await asyncio.gather(
+            _pipe(client_reader, upstream_writer, delay),
+            _pipe(upstream_reader, client_writer, delay),
+        )
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"{parts.scheme}://127.0.0.1:{port}"
+
+
+async def run_strategy(
+    utils, base_url: str, strategy: str, page_type: str, fetches: int
+) -> dict:
+    """Fetch a page `fetches` times with one strategy; return timings and bytes."""
+    default_drain = utils.STREAM_DRAIN_MAX_BYTES
+    utils.STREAM_DRAIN_MAX_BYTES = {
+        "close": -1, "drain": float("inf"), "auto": default_drain,
+    }[strategy]
+    utils.STREAM_STATS.clear()
+    connections = 0
+
+    async def on_connection_create_end(session, context, params) -> None:
+        nonlocal connections
+        connections += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_end.append(on_connection_create_end)
+    endpoint = load_module("canonical_urls").PAGE_PATHS[page_type]
+    url = f"{base_url}/vi/vn/ha-noi/353412/{endpoint}/353412"
+    durations = []
+    try:
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=False), trace_configs=[trace]
+        ) as session:
+            for _ in range(fetches):
+                started = time.perf_counter()
+                html = await utils._fetch_with_retry(  # noqa: SLF001
+                    session, url, utils.get_headers(), page_type
+                )
+                durations.append((time.perf_counter() - started) * 1000)
+                if not html:
+                    raise RuntimeError(f"fetch of {url} failed")
+    finally:
+        utils.STREAM_DRAIN_MAX_BYTES = default_drain
+    stats = utils.STREAM_STATS[page_type]
+    return {
+        "strategy": strategy,
+        "fetch_ms_mean": round(statistics.mean(durations), 1),
+        "fetch_ms_p50": round(statistics.median(durations), 1),
+        # The first fetch always connects; the rest show the strategy
+        "fetch_ms_mean_after_first": round(statistics.mean(durations[1:]), 1)
+        if len(durations) > 1 else None,
+        "connections": connections,
+        "early_stops": stats.early_stops,
+        "wire_kb_read": round(stats.bytes_read / 1024 / fetches, 1),
+        "decoded_kb": round(stats.bytes_decoded / 1024 / fetches, 1),
+        "drained_kb": round(stats.bytes_drained / 1024 / fetches, 1),
+        "skipped_kb": round(stats.bytes_skipped / 1024 / fetches, 1),
+    }
+
+
+async def main(args: argparse.Namespace, stub_args: list[str]) -> list[dict]:
+    """Run every strategy against one stub and proxy."""
+    utils = load_module("utils")
+    process, stub_url = await spawn_stub(stub_args)
+    proxy, base_url = await start_delay_proxy(stub_url, args.rtt_ms)
+    try:
+        return [
+            await run_strategy(utils, base_url, strategy, args.page, args.fetches)
+            for strategy in STRATEGIES
+        ]
+    finally:
+        proxy.close()
+        await stop_stub(process)
+
+
+def _stub_args(argv: list[str]) -> list[str]:
+    """Return the command-line options meant for the stub server."""
+    own = {"--rtt-ms", "--fetches", "--page", "--json"}
+    out, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        name = arg.split("=", 1)[0]
+        if name in own:
+            skip = "=" not in arg
+            continue
+        out.append(arg)
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--rtt-ms", type=float, default=80.0)
+    parser.add_argument("--fetches", type=int, default=20)
+    parser.add_argument("--page", default="current",
+                        choices=("current", "daily", "hourly", "air"))
+    parser.add_argument("--json", help="also write the results to this file")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    results = asyncio.run(main(args, _stub_args(sys.argv[1:])))
+    for result in results:
+        print(json.dumps(result))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
@@ -0,0 +1,51 @@
+"""Capture live AccuWeather pages into the benchmark corpus.
+
+The committed corpus is a set of synthetic pages that mirror the markup and
+embedded payloads the parsers rely on. Run this with network access to
+replace them with real captures for a location, then regenerate the golden
+outputs and baseline:
+
+    python benchmarks/capture.py 353412 "Hà Nội"
+    python benchmarks/bench_parsers.py --update-golden --update-baseline
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import aiohttp
+
+from common import CORPUS_DIR, load_module
+
+ENDPOINTS = {
+    "current": "current-weather",
+    "daily": "daily-weather-forecast",
+    "hourly": "hourly-weather-forecast",
+    "air": "air-quality-index",
+    "health": "health-activities",
+    "minutecast": "minute-weather-forecast",
+}
+
+
+async def capture(location_key: str, location_name: str) -> None:
+    """Fetch every page type once and write it to the corpus directory."""
+    utils = load_module("utils")
+    const = load_module("const")
+    slug = utils.slugify(location_name)
+    async with aiohttp.ClientSession() as session:
+        for page_type, path in ENDPOINTS.items():
+            url = f"{const.BASE_URL}/vi/vn/{slug}/{location_key}/{path}/{location_key}"
+            # Full bodies: no early termination at the end marker
+            html = await utils._fetch_with_retry(session, url, utils.get_headers())
+            if html is None:
+                print(f"{page_type}: fetch failed ({url})")
+                continue
+            (CORPUS_DIR / f"{page_type}.html").write_text(html, encoding="utf-8")
+            print(f"{page_type}: {len(html)} characters")
+            await asyncio.sleep(1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    asyncio.run(capture(sys.argv[1], sys.argv[2]))
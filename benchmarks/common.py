@@ -0,0 +1,41 @@
+"""Shared helpers for the offline AccuWeather benchmarks."""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+from types import ModuleType
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+INTEGRATION_DIR = REPO_ROOT / "custom_components" / "accuweather"
+CORPUS_DIR = BENCH_DIR / "corpus"
+GOLDEN_DIR = BENCH_DIR / "golden"
+
+# Corpus file stem prefix -> page type, e.g. "hourly_embedded.html" -> "hourly"
+PAGE_TYPES = ("current", "daily", "hourly", "air", "health", "minutecast")
+
+
+def load_module(name: str) -> ModuleType:
+    """Import an integration submodule (e.g. "utils") without Home Assistant.
+
+    The parser modules only need bs4/aiohttp, so a bare package object is
+    registered for the integration directory instead of running its
+    __init__.py, which imports Home Assistant.
+    """
+    if "accuweather" not in sys.modules:
+        package = types.ModuleType("accuweather")
+        package.__path__ = [str(INTEGRATION_DIR)]
+        sys.modules["accuweather"] = package
+    return importlib.import_module(f"accuweather.{name}")
+
+
+def corpus_pages() -> dict[str, tuple[str, str]]:
+    """Return {case name: (page type, html)} for every corpus file."""
+    pages = {}
+    for path in sorted(CORPUS_DIR.glob("*.html")):
+        page_type = path.stem.split("_", 1)[0]
+        if page_type in PAGE_TYPES:
+            pages[path.stem] = (page_type, path.read_text(encoding="utf-8"))
+    return pages
@@ -0,0 +1,340 @@
+"""Local stand-in for www.accuweather.com serving the benchmark corpus.
+
+Serves the six scraped page types for any location key/slug, plus the
+autocomplete endpoint, from benchmarks/corpus. Latency, bandwidth, error
+responses (with optional Retry-After), mid-body connection resets and
+redirects to a canonical location path can be injected. Pages can be
+served gzip-compressed, over TLS (self-signed), and padded below the
+footer to a real page's size. Point the integration at it with
+ACCUWEATHER_BASE_URL.
+
+    python benchmarks/stub_server.py --port 8899 --latency-ms 120 \\
+        --bandwidth-kbps 4000 --errors 429=0.05,503=0.02 --retry-after 1 \\
+        --reset-rate 0.01 --gzip --tail-kb 380 --tls
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import datetime
+import gzip
+import json
+from pathlib import Path
+import random
+import ssl
+import tempfile
+
+from aiohttp import web
+
+from common import CORPUS_DIR
+
+# URL path segment -> page type
+ENDPOINT_PAGES = {
+    "current-weather": "current",
+    "daily-weather-forecast": "daily",
+    "hourly-weather-forecast": "hourly",
+    "air-quality-index": "air",
+    "health-activities": "health",
+    "minute-weather-forecast": "minutecast",
+}
+CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class StubConfig:
+    """Fault and network shaping settings for the stub server."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Response body bandwidth in bytes per second; 0 means unthrottled
+    bandwidth: float = 0.0
+    # HTTP status -> probability of answering with it instead of the page
+    error_rates: dict[int, float] = field(default_factory=dict)
+    retry_after: float | None = None
+    # Probability of aborting the connection halfway through the body
+    reset_rate: float = 0.0
+    # Corpus variant: "embedded" serves <page>_embedded.html when present
+    variant: str = "embedded"
+    # "lang/country/slug" every page lives under; requests for any other
+    # prefix are redirected there (301), like a mismatched location slug
+    canonical_prefix: str | None = None
+    # Serve gzip-compressed bodies (with their compressed Content-Length)
+    # to clients accepting gzip
+    gzip: bool = False
+    # Pseudo-random markup added below the footer, in KiB: the corpus pages
+    # are trimmed and compress far better than real ones
+    tail_kb: int = 0
+    tls: bool = False
+    seed: int | None = None
+
+
+@dataclass
+class StubStats:
+    """What the stub served, for cross-checking client-side counters."""
+
+    requests: int = 0
+    statuses: Counter = field(default_factory=Counter)
+    bytes_sent: int = 0
+    resets: int = 0
+
+    def as_dict(self) -> dict:
+        """Return the counters as plain JSON types."""
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "bytes_sent": self.bytes_sent,
+            "resets": self.resets,
+        }
+
+
+def _tail(size: int, seed: int | None) -> bytes:
+    """Return about `size` bytes of ad/tracker-like markup, compressing ~5x."""
+    rng = random.Random(seed)
+    words = ["weather", "forecast", "promo", "slot", "banner", "track", "video",
+             "news", "radar", "local", "sponsored", "story", "click", "view"]
+    parts, length = [], 0
+    while length < size:
+        part = (
+            f'<div class="{rng.choice(words)}-{rng.choice(words)}" '
+            f'data-id="{rng.getrandbits(48):012x}">'
+            f'{" ".join(rng.choice(words) for _ in range(rng.randint(3, 12)))}</div>\n'
+        )
+        parts.append(part)
+        length += len(part)
+    return "".join(parts).encode()
+
+
+def _load_pages(variant: str, tail_kb: int = 0, seed: int | None = None) -> dict[str, bytes]:
+    """Load one corpus page per page type, preferring the chosen variant."""
+    pages = {}
+    tail = _tail(tail_kb * 1024, seed) if tail_kb else b""
+    for page_type in ENDPOINT_PAGES.values():
+        preferred = CORPUS_DIR / f"{page_type}_{variant}.html"
+        path = preferred if preferred.exists() else CORPUS_DIR / f"{page_type}.html"
+        body = path.read_bytes()
+        if tail:
+            # Inside <body>, after the footer and any data scripts
+            body = body.replace(b"</body>", tail + b"</body>", 1)
+        pages[page_type] = body
+    return pages
+
+
+def _ssl_context() -> ssl.SSLContext:
+    """Return a server context with a fresh self-signed certificate for 127.0.0.1."""
+    from ipaddress import IPv4Address
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(IPv4Address("127.0.0.1"))]),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path, key_path = Path(tmp, "cert.pem"), Path(tmp, "key.pem")
+        cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+def create_app(config: StubConfig) -> web.Application:
+    """Build the stub application; its StubStats is stored under app["stats"]."""
+    pages = _load_pages(config.variant, config.tail_kb, config.seed)
+    gzipped = {
+        page_type: gzip.compress(body, compresslevel=6) for page_type, body in pages.items()
+    } if config.gzip else {}
+    rng = random.Random(config.seed)
+    stats = StubStats()
+
+    async def _delay() -> None:
+        delay = config.latency_ms + rng.uniform(0, config.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+    def _error_status() -> int | None:
+        roll = rng.random()
+        for status, rate in config.error_rates.items():
+            if roll < rate:
+                return status
+            roll -= rate
+        return None
+
+    async def page(request: web.Request) -> web.StreamResponse:
+        stats.requests += 1
+        page_type = ENDPOINT_PAGES.get(request.match_info["endpoint"])
+        await _delay()
+        if page_type is None:
+            stats.statuses[404] += 1
+            raise web.HTTPNotFound()
+        prefix = "/".join(request.match_info[part] for part in ("lang", "country", "slug"))
+        if config.canonical_prefix and prefix != config.canonical_prefix:
+            stats.statuses[301] += 1
+            raise web.HTTPMovedPermanently(
+                request.path.replace(f"/{prefix}/", f"/{config.canonical_prefix}/", 1)
+            )
+        if (status := _error_status()) is not None:
+            stats.statuses[status] += 1
+            headers = {}
+            if config.retry_after is not None and status in (429, 503):
+                headers["Retry-After"] = f"{config.retry_after:g}"
+            return web.Response(status=status, headers=headers, text="stub error")
+
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        if gzipped and "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = gzipped[page_type]
+            headers["Content-Encoding"] = "gzip"
+        else:
+            body = pages[page_type]
+        reset_at = len(body) // 2 if rng.random() < config.reset_rate else None
+        response = web.StreamResponse(headers=headers)
+        response.content_length = len(body)
+        await response.prepare(request)
+        stats.statuses[200] += 1
+        try:
+            for offset in range(0, len(body), CHUNK_SIZE):
+                if reset_at is not None and offset >= reset_at:
+                    stats.resets += 1
+                    request.transport.abort()
+                    return response
+                chunk = body[offset:offset + CHUNK_SIZE]
+                await response.write(chunk)
+                stats.bytes_sent += len(chunk)
+                if config.bandwidth:
+                    await asyncio.sleep(len(chunk) / config.bandwidth)
+            await response.write_eof()
+        except (ConnectionResetError, RuntimeError):
+            # Client closed early (end-marker streaming) or went away
+            pass
+        return response
+
+    async def autocomplete(request: web.Request) -> web.Response:
+        stats.requests += 1
+        stats.statuses[200] += 1
+        await _delay()
+        query = request.query.get("query", "")
+        return web.json_response([
+            {"key": str(353412 + i), "localizedName": f"{query} {i}",
+             "longName": f"{query} {i}, Việt Nam"}
+            for i in range(3)
+        ])
+
+    app = web.Application()
+    app["stats"] = stats
+    app.router.add_get("/web-api/autocomplete", autocomplete)
+    app.router.add_get("/{lang}/{country}/{slug}/{key}/{endpoint}/{key2}", page)
+    return app
+
+
+async def start_stub(
+    config: StubConfig, host: str = "127.0.0.1", port: int = 0
+) -> tuple[web.AppRunner, str, StubStats]:
+    """Start the stub on host:port (0 = any free port) and return its base URL."""
+    app = create_app(config)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(
+        runner, host, port, ssl_context=_ssl_context() if config.tls else None
+    )
+    await site.start()
+    bound_port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    scheme = "https" if config.tls else "http"
+    return runner, f"{scheme}://{host}:{bound_port}", app["stats"]
+
+
+def parse_error_rates(spec: str | None) -> dict[int, float]:
+    """Parse "429=0.05,503=0.02" into {429: 0.05, 503: 0.02}."""
+    if not spec:
+        return {}
+    rates = {}
+    for part in spec.split(","):
+        status, rate = part.split("=")
+        rates[int(status)] = float(rate)
+    return rates
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the StubConfig command-line options to a parser."""
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0,
+                        help="response bandwidth in kilobytes/s (0 = unlimited)")
+    parser.add_argument("--errors", help="status=probability list, e.g. 429=0.05,503=0.02")
+    parser.add_argument("--retry-after", type=float)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--variant", default="embedded", choices=("embedded", "dom"))
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--canonical-prefix",
+                        help="redirect pages not under this lang/country/slug, "
+                             "e.g. en/us/new-york")
+    parser.add_argument("--gzip", action="store_true",
+                        help="serve gzip-compressed pages to clients accepting gzip")
+    parser.add_argument("--tail-kb", type=int, default=0,
+                        help="pad pages below the footer with this much markup")
+    parser.add_argument("--tls", action="store_true",
+                        help="serve https with a self-signed certificate")
+
+
+def stub_config_from_args(args: argparse.Namespace) -> StubConfig:
+    """Build a StubConfig from parsed add_stub_arguments() options."""
+    return StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        bandwidth=args.bandwidth_kbps * 1024,
+        error_rates=parse_error_rates(args.errors),
+        retry_after=args.retry_after,
+        reset_rate=args.reset_rate,
+        variant=args.variant,
+        seed=args.seed,
+        canonical_prefix=args.canonical_prefix,
+        gzip=args.gzip,
+        tail_kb=args.tail_kb,
+        tls=args.tls,
+    )
+
+
+async def _serve(config: StubConfig, host: str, port: int) -> None:
+    """Run the stub until interrupted, then print what it served."""
+    runner, base_url, stats = await start_stub(config, host, port)
+    print(f"AccuWeather stub listening on {base_url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(json.dumps(stats.as_dict()), flush=True)
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(stub_config_from_args(args), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -7,25 +7,51 @@ import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+from .const import (
+    DOMAIN, CONF_ADAPTIVE_POLLING, CONF_UPDATE_INTERVAL, DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_UPDATE_INTERVAL,
+)
 from .coordinator import AccuWeatherDataUpdateCoordinator
+from .fetch_metrics import FetchMetrics
+from .load_monitor import LOAD_MONITOR
+from .polling import FLEET_PLANNER
+from .prometheus import AccuWeatherMetricsView
+from .services import async_setup_services
+from .utils import load_html_parser
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.WEATHER, Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Singleton session per location_key to avoid cross-contamination of cookies/connections
 _sessions: dict[str, aiohttp.ClientSession] = {}
+# Fetch metrics per location_key; traced by that location's session
+_fetch_metrics: dict[str, FetchMetrics] = {}
+
+
+def _get_fetch_metrics(location_key: str) -> FetchMetrics:
+    """Get or create the fetch metrics for a location."""
+    if location_key not in _fetch_metrics:
+        _fetch_metrics[location_key] = FetchMetrics()
+    return _fetch_metrics[location_key]
 
 
 async def _get_accuweather_session(
-    hass: HomeAssistant, location_key: str
+    hass: HomeAssistant,
+    location_key: str,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
 ) -> aiohttp.ClientSession:
     """Get or create a dedicated aiohttp session for a location.
 
     Each location gets its own session so that connection issues for one
     location do not affect others, and to allow per-session tuning.
+    The session is traced into the location's FetchMetrics; extra
+    trace_configs let benchmarks observe requests on the real session.
     """
     if location_key in _sessions:
         return _sessions[location_key]
@@ -40,6 +66,9 @@ async def _get_accuweather_session(
     )
     session = aiohttp.ClientSession(
         connector=connector,
+        trace_configs=[
+            _get_fetch_metrics(location_key).trace_config(), *(trace_configs or ())
+        ],
         headers={
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -54,6 +83,13 @@ async def _get_accuweather_session(
     return session
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the AccuWeather services and metrics endpoint."""
+    async_setup_services(hass)
+    hass.http.register_view(AccuWeatherMetricsView(hass))
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up AccuWeather from a config entry."""
     _LOGGER.debug("Setting up AccuWeather integration")
@@ -64,10 +100,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     session = await _get_accuweather_session(hass, location_key)
     coordinator = AccuWeatherDataUpdateCoordinator(
-        hass, session, location_key, location_name, entry, update_interval
+        hass, session, location_key, location_name, entry, update_interval,
+        fetch_metrics=_get_fetch_metrics(location_key),
+        adaptive_polling=entry.data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # The first refresh already schedules the next one on the fleet phase
+    FLEET_PLANNER.add(location_key)
+    try:
+        # bs4 is imported lazily; do it off the event loop before the first parse
+        await hass.async_add_import_executor_job(load_html_parser)
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Not set up (ConfigEntryNotReady is retried from scratch): leave the fleet
+        FLEET_PLANNER.remove(location_key)
+        raise
+    # Only loaded entries read it (the first refresh has nothing to shed), and
+    # unloading the last one stops it
+    LOAD_MONITOR.async_start(hass)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -81,5 +131,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        FLEET_PLANNER.remove(entry.data["location_key"])
+        if not hass.data[DOMAIN]:
+            LOAD_MONITOR.async_stop()
     
     return unload_ok
@@ -0,0 +1,122 @@
+"""Location search for the config flow, cached across flows.
+
+Queries are keyed by their slugify()'d form, so "Hà Nội", "ha noi" and
+"HA NOI " share one entry. Results are kept for AUTOCOMPLETE_CACHE_TTL
+seconds in an LRU of AUTOCOMPLETE_CACHE_SIZE queries. A query extending a
+cached one whose result list was complete (shorter than the endpoint's
+AUTOCOMPLETE_MAX_RESULTS) is answered by filtering that list. Identical
+searches in flight share one request, and requests to the endpoint are
+spaced AUTOCOMPLETE_MIN_SPACING seconds apart.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+
+import aiohttp
+
+from .const import (
+    AUTOCOMPLETE_CACHE_SIZE,
+    AUTOCOMPLETE_CACHE_TTL,
+    AUTOCOMPLETE_MAX_RESULTS,
+    AUTOCOMPLETE_MIN_SPACING,
+)
+from .fetch_metrics import CACHE_STATS
+from .utils import get_location_keys, slugify
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_NAME = "autocomplete"
+
+Location = tuple[str, str, str]  # (key, name, long name)
+
+
+def _matches(location: Location, key: str) -> bool:
+    """Return whether a word of the location's name starts with `key`."""
+    _, name, long_name = location
+    return any(f"-{key}" in f"-{slugify(text or '')}" for text in (name, long_name))
+
+
+class AutocompleteCache:
+    """Cached and coalesced AccuWeather location search."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        # Normalized query -> (monotonic expiry, results), least recent first
+        self._entries: OrderedDict[str, tuple[float, list[Location]]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[list[Location] | None]] = {}
+        self._next_request = 0.0
+
+    def _get(self, key: str) -> list[Location] | None:
+        """Return unexpired cached results for a normalized query."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _from_prefix(self, key: str) -> list[Location] | None:
+        """Answer a query by filtering a complete result list of a prefix of it."""
+        for length in range(len(key) - 1, 0, -1):
+            results = self._get(key[:length])
+            if results is None or len(results) >= AUTOCOMPLETE_MAX_RESULTS:
+                continue
+            # An empty filter is left to the endpoint, which may match
+            # differently (e.g. alternate names)
+            return [location for location in results if _matches(location, key)] or None
+        return None
+
+    def _store(self, key: str, results: list[Location]) -> None:
+        self._entries[key] = (time.monotonic() + AUTOCOMPLETE_CACHE_TTL, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > AUTOCOMPLETE_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, query: str, key: str
+    ) -> list[Location] | None:
+        """Query the endpoint, no sooner than AUTOCOMPLETE_MIN_SPACING after the last."""
+        now = time.monotonic()
+        start = max(now, self._next_request)
+        self._next_request = start + AUTOCOMPLETE_MIN_SPACING
+        if start > now:
+            await asyncio.sleep(start - now)
+        results = await get_location_keys(session, query)
+        if results is not None:
+            self._store(key, results)
+        return results
+
+    async def async_search(
+        self, session: aiohttp.ClientSession, query: str
+    ) -> list[Location] | None:
+        """Return the locations matching `query`, or None if the search failed."""
+        key = slugify(query)
+        if not key:
+            return []
+        stats = CACHE_STATS[CACHE_NAME]
+        results = self._get(key)
+        if results is None:
+            results = self._from_prefix(key)
+        if results is not None:
+            stats.hits += 1
+            return list(results)
+        stats.misses += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(session, query.strip(), key))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        else:
+            _LOGGER.debug("Joining the location search in flight for %r", query)
+        # Shielded so a flow that goes away does not cancel others' search
+        results = await asyncio.shield(pending)
+        return list(results) if results is not None else None
+
+
+# Shared by every config flow
+AUTOCOMPLETE_CACHE = AutocompleteCache()
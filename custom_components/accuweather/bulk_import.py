@@ -0,0 +1,194 @@
+"""Bulk onboarding: set up many locations from one service call.
+
+Each item is a search query ("Hà Nội") or a location key with its name
+("353412|Hà Nội"); a bare key is rejected, as its entities would be named
+after the number. Queries take the first autocomplete result; keys are
+validated by fetching their current conditions. Both run
+concurrently through a RateLimiter. Valid locations are then created as
+config entries BULK_IMPORT_BATCH_SIZE at a time, each batch after the
+previous one's setups (and so first refreshes) finished plus
+BULK_IMPORT_BATCH_DELAY, instead of all at once. Every item gets a result,
+so one failure does not stop the rest.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+import re
+import time
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .autocomplete import AUTOCOMPLETE_CACHE
+from .const import (
+    BULK_IMPORT_BATCH_DELAY,
+    BULK_IMPORT_BATCH_SIZE,
+    BULK_IMPORT_CONCURRENCY,
+    BULK_IMPORT_SPACING,
+    CONF_ADAPTIVE_POLLING,
+    CONF_LOCATION_KEY,
+    CONF_LOCATION_NAME,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+)
+from .rate_limit import RateLimiter
+from .utils import get_current_weather, slugify
+
+_LOGGER = logging.getLogger(__name__)
+
+_KEY_ITEM = re.compile(r"^(\d+)\s*(?:\|\s*(.*))?$")
+
+STATUS_CREATED = "created"
+STATUS_VALID = "valid"  # dry run: would be created
+STATUS_ALREADY_CONFIGURED = "already_configured"
+STATUS_DUPLICATE = "duplicate"  # same location as an earlier item
+STATUS_NOT_FOUND = "not_found"
+STATUS_NAME_REQUIRED = "name_required"  # a location key without key|name
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class ImportResult:
+    """What happened to one item."""
+
+    item: str
+    status: str = STATUS_VALID
+    location_key: str | None = None
+    location_name: str | None = None
+    long_name: str | None = None
+    entry_id: str | None = None
+    entry_state: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class ImportReport:
+    """Results of one bulk import, in item order."""
+
+    dry_run: bool
+    wall_s: float = 0.0
+    counts: dict[str, int] = field(default_factory=dict)
+    results: list[ImportResult] = field(default_factory=list)
+
+
+def split_items(items: list[str]) -> list[str]:
+    """Return the non-empty lines of every item, so pasted lists work too."""
+    return [line.strip() for item in items for line in item.splitlines() if line.strip()]
+
+
+async def _resolve(
+    hass: HomeAssistant, result: ImportResult, limiter: RateLimiter
+) -> None:
+    """Fill in a result's location, or mark it not found / failed."""
+    session = async_get_clientsession(hass)
+    if match := _KEY_ITEM.match(result.item):
+        key, name = match.group(1), (match.group(2) or "").strip()
+        if not name:
+            result.status = STATUS_NAME_REQUIRED
+            result.error = f"give the location's name as {key}|name"
+            return
+        async with limiter:
+            current = await get_current_weather(session, key, slugify(name))
+        if not current:
+            result.status = STATUS_NOT_FOUND
+            result.error = "no current conditions for this location key"
+            return
+        result.location_key, result.location_name = key, name
+        return
+    async with limiter:
+        locations = await AUTOCOMPLETE_CACHE.async_search(session, result.item)
+    if locations is None:
+        result.status = STATUS_FAILED
+        result.error = "location search failed"
+    elif not locations:
+        result.status = STATUS_NOT_FOUND
+        result.error = "no matching location"
+    else:
+        result.location_key, result.location_name, result.long_name = locations[0]
+
+
+async def _create_entry(
+    hass: HomeAssistant, result: ImportResult, update_interval: int, adaptive_polling: bool
+) -> None:
+    """Create (and so set up) the config entry of a resolved location."""
+    try:
+        flow_result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data={
+                CONF_LOCATION_KEY: result.location_key,
+                CONF_LOCATION_NAME: result.location_name,
+                CONF_UPDATE_INTERVAL: update_interval,
+                CONF_ADAPTIVE_POLLING: adaptive_polling,
+            },
+        )
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Importing %s failed: %s: %s", result.item, type(err).__name__, err)
+        result.status = STATUS_FAILED
+        result.error = f"{type(err).__name__}: {err}"
+        return
+    if flow_result["type"] == FlowResultType.CREATE_ENTRY:
+        entry = flow_result["result"]
+        result.status = STATUS_CREATED
+        result.entry_id = entry.entry_id
+        result.entry_state = entry.state.value
+    elif flow_result.get("reason") == "already_configured":
+        result.status = STATUS_ALREADY_CONFIGURED
+    else:
+        result.status = STATUS_FAILED
+        result.error = str(flow_result.get("reason"))
+
+
+async def async_import_locations(
+    hass: HomeAssistant,
+    items: list[str],
+    update_interval: int,
+    adaptive_polling: bool,
+    dry_run: bool = False,
+) -> ImportReport:
+    """Resolve, validate and (unless dry_run) set up every item's location."""
+    started = time.monotonic()
+    report = ImportReport(dry_run=dry_run)
+    report.results = [ImportResult(item=item) for item in split_items(items)]
+
+    limiter = RateLimiter(BULK_IMPORT_CONCURRENCY, BULK_IMPORT_SPACING)
+    await asyncio.gather(*(_resolve(hass, result, limiter) for result in report.results))
+
+    configured = {entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)}
+    seen: set[str] = set()
+    to_create = []
+    for result in report.results:
+        if result.status != STATUS_VALID:
+            continue
+        if result.location_key in configured:
+            result.status = STATUS_ALREADY_CONFIGURED
+        elif result.location_key in seen:
+            result.status = STATUS_DUPLICATE
+        else:
+            seen.add(result.location_key)
+            to_create.append(result)
+
+    if not dry_run:
+        for index in range(0, len(to_create), BULK_IMPORT_BATCH_SIZE):
+            if index:
+                await asyncio.sleep(BULK_IMPORT_BATCH_DELAY)
+            batch = to_create[index:index + BULK_IMPORT_BATCH_SIZE]
+            _LOGGER.debug(
+                "Bulk import: setting up locations %d-%d of %d",
+                index + 1, index + len(batch), len(to_create),
+            )
+            await asyncio.gather(
+                *(
+                    _create_entry(hass, result, update_interval, adaptive_polling)
+                    for result in batch
+                )
+            )
+
+    report.counts = dict(Counter(result.status for result in report.results))
+    report.wall_s = round(time.monotonic() - started, 2)
+    return report
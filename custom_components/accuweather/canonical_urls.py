@@ -0,0 +1,119 @@
+"""Canonical page URLs per location, learned from redirects.
+
+Page URLs are built as /vi/vn/{slug}/{key}/{endpoint}/{key} from the
+slugified location name. Where AccuWeather's own URL differs (locations
+outside Vietnam, names it slugifies differently) every fetch of that page
+is redirected, an extra round trip each time. The final URL of the first
+redirect is kept per page type, and persisted in the config entry by the
+coordinator, so later fetches go straight to it. It is only replaced when
+fetching it redirects again, and dropped if it stops existing.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .const import (
+    BASE_URL,
+    PAGE_AIR, PAGE_CURRENT, PAGE_DAILY, PAGE_HEALTH, PAGE_HOURLY, PAGE_MINUTECAST,
+)
+from .fetch_metrics import CACHE_STATS
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_NAME = "canonical_url"
+
+# Page type -> endpoint segment of its URL
+PAGE_PATHS = {
+    PAGE_CURRENT: "current-weather",
+    PAGE_DAILY: "daily-weather-forecast",
+    PAGE_HOURLY: "hourly-weather-forecast",
+    PAGE_AIR: "air-quality-index",
+    PAGE_HEALTH: "health-activities",
+    PAGE_MINUTECAST: "minute-weather-forecast",
+}
+
+# A stored URL answering with one of these no longer exists
+_GONE_STATUSES = {404, 410}
+
+
+def default_url(location_key: str, location_slug: str, page_type: str) -> str:
+    """Return the URL built from the slugified location name."""
+    path = PAGE_PATHS[page_type]
+    return f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/{path}/{location_key}"
+
+
+class CanonicalUrls:
+    """Resolves a location's page URLs, preferring ones learned from redirects."""
+
+    def __init__(
+        self,
+        location_key: str,
+        location_slug: str,
+        stored: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize from the URLs stored in the config entry, if any.
+
+        Stored URLs for unknown page types, other hosts or another location
+        key are ignored.
+        """
+        self.location_key = location_key
+        self.location_slug = location_slug
+        self._urls = {
+            page_type: url
+            for page_type, url in (stored or {}).items()
+            if page_type in PAGE_PATHS and self._acceptable(url)
+        }
+        # Set when _urls changed and should be persisted again
+        self.changed = False
+        self.redirects = 0
+
+    def _acceptable(self, url: str) -> bool:
+        """Return whether `url` can be this location's page on AccuWeather."""
+        return (
+            urlsplit(url).netloc == urlsplit(BASE_URL).netloc
+            and f"/{self.location_key}/" in urlsplit(url).path
+        )
+
+    def url(self, page_type: str) -> str:
+        """Return the URL to fetch a page type from."""
+        stats = CACHE_STATS[CACHE_NAME]
+        if (url := self._urls.get(page_type)) is not None:
+            stats.hits += 1
+            return url
+        stats.misses += 1
+        return default_url(self.location_key, self.location_slug, page_type)
+
+    def record_response(
+        self, page_type: str, url: str, response: aiohttp.ClientResponse
+    ) -> None:
+        """Learn from the response to a request for `url` (redirects followed)."""
+        if response.history:
+            self.redirects += 1
+            final = str(response.url)
+            if (
+                response.status == 200
+                and self._acceptable(final)
+                and final != self._urls.get(page_type)
+            ):
+                _LOGGER.debug(
+                    "AccuWeather %s: %s page redirected from %s to %s; fetching "
+                    "the latter from now on",
+                    self.location_key, page_type, url, final,
+                )
+                self._urls[page_type] = final
+                self.changed = True
+        elif response.status in _GONE_STATUSES and self._urls.get(page_type) == url:
+            _LOGGER.debug(
+                "AccuWeather %s: canonical %s URL %s answered HTTP %d; dropping it",
+                self.location_key, page_type, url, response.status,
+            )
+            del self._urls[page_type]
+            self.changed = True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned URLs, as stored in the config entry."""
+        return dict(self._urls)
@@ -18,11 +18,13 @@ from .const import (
     CONF_LOCATION_KEY, 
     CONF_LOCATION_NAME,
     CONF_UPDATE_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
     MIN_UPDATE_INTERVAL,
     MAX_UPDATE_INTERVAL
 )
-from .utils import get_location_keys
+from .autocomplete import AUTOCOMPLETE_CACHE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,8 +57,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 session = async_get_clientsession(self.hass)
                 location_query = user_input["location"]
                 
-                # Get location keys from AccuWeather
-                self._locations = await get_location_keys(session, location_query)
+                # Get location keys from AccuWeather (cached across flows)
+                locations = await AUTOCOMPLETE_CACHE.async_search(session, location_query)
+                if locations is None:
+                    raise CannotConnect
+                self._locations = locations
                 
                 if not self._locations:
                     errors["base"] = "no_locations"
@@ -74,6 +79,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a location resolved by the import_locations service."""
+        await self.async_set_unique_id(import_data[CONF_LOCATION_KEY])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=import_data[CONF_LOCATION_NAME], data=import_data
+        )
+
     async def async_step_select_location(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -125,6 +138,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_LOCATION_KEY: self._selected_location_key,
                     CONF_LOCATION_NAME: self._selected_location_name,
                     CONF_UPDATE_INTERVAL: update_interval,
+                    CONF_ADAPTIVE_POLLING: user_input.get(
+                        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                    ),
                 }
             )
         
@@ -133,7 +149,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(
                 "update_interval", 
                 default=DEFAULT_UPDATE_INTERVAL
-            ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL))
+            ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=DEFAULT_ADAPTIVE_POLLING
+            ): bool,
         })
         
         return self.async_show_form(
@@ -165,6 +185,9 @@ class OptionsFlow(config_entries.OptionsFlow):
             # Update the config entry data with new update interval
             new_data = dict(self.config_entry.data)
             new_data[CONF_UPDATE_INTERVAL] = user_input.get("update_interval", DEFAULT_UPDATE_INTERVAL)
+            new_data[CONF_ADAPTIVE_POLLING] = user_input.get(
+                CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+            )
             
             self.hass.config_entries.async_update_entry(
                 self.config_entry, data=new_data
@@ -176,6 +199,9 @@ class OptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data={})
 
         current_interval = self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        adaptive_polling = self.config_entry.data.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
         
         return self.async_show_form(
             step_id="init",
@@ -183,7 +209,11 @@ class OptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     "update_interval", 
                     default=current_interval
-                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL))
+                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=adaptive_polling
+                ): bool,
             }),
             description_placeholders={
                 "current_interval": str(current_interval // 60),
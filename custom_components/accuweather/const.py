@@ -1,4 +1,5 @@
 """Constants for AccuWeather integration."""
+import os
 
 DOMAIN = "accuweather"
 
@@ -6,16 +7,133 @@ DOMAIN = "accuweather"
 CONF_LOCATION_KEY = "location_key"
 CONF_LOCATION_NAME = "location_name"
 CONF_UPDATE_INTERVAL = "update_interval"
+# Page URLs learned from redirects (see canonical_urls.py), kept in entry data
+CONF_CANONICAL_URLS = "canonical_urls"
 
 # Update intervals
 DEFAULT_UPDATE_INTERVAL = 600  # 10 minutes
 MIN_UPDATE_INTERVAL = 300     # 5 minutes
 MAX_UPDATE_INTERVAL = 3600    # 60 minutes
 
-# API URLs
-BASE_URL = "https://www.accuweather.com"
+# Adaptive polling (see polling.py): poll at MIN_UPDATE_INTERVAL while
+# precipitation is expected within PRECIPITATION_HORIZON, back off towards
+# MAX_UPDATE_INTERVAL while the forecast stays dry.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = True
+PRECIPITATION_HORIZON = 3600  # seconds
+PRECIPITATION_PROBABILITY_THRESHOLD = 40  # percent, hourly forecast
+ADAPTIVE_BACKOFF_FACTOR = 1.5  # interval growth per dry refresh
+# Observation alignment: refresh this long after a new current-conditions
+# observation is expected; steps outside the bounds are ignored as gaps.
+OBSERVATION_MARGIN = 90  # seconds
+MIN_OBSERVATION_CADENCE = 5  # minutes
+MAX_OBSERVATION_CADENCE = 180  # minutes
+# Refreshes aligned to the same observation publish are spread over this
+# window by their fleet phase (capped at half the observation cadence)
+ALIGNED_STAGGER_WINDOW = 300  # seconds
+
+# API URLs (ACCUWEATHER_BASE_URL points the integration at a local
+# stand-in server, e.g. benchmarks/stub_server.py)
+BASE_URL = os.environ.get(
+    "ACCUWEATHER_BASE_URL", "https://www.accuweather.com"
+).rstrip("/")
 AUTOCOMPLETE_URL = f"{BASE_URL}/web-api/autocomplete"
 
+# Location search in the config flow (see autocomplete.py)
+AUTOCOMPLETE_TIMEOUT = 10  # seconds, whole request
+AUTOCOMPLETE_CACHE_TTL = 3600  # seconds
+AUTOCOMPLETE_CACHE_SIZE = 128  # queries kept, least recently used dropped
+AUTOCOMPLETE_MIN_SPACING = 0.5  # seconds between requests to the endpoint
+# The endpoint returns at most this many results; a shorter list is every
+# match for its query, so longer queries can be answered by filtering it.
+AUTOCOMPLETE_MAX_RESULTS = 10
+
+# Page types (one per scraped AccuWeather endpoint)
+PAGE_CURRENT = "current"
+PAGE_DAILY = "daily"
+PAGE_HOURLY = "hourly"
+PAGE_AIR = "air"
+PAGE_HEALTH = "health"
+PAGE_MINUTECAST = "minutecast"
+
+# Parser health: once a page's HTML structure no longer matches the parser,
+# that page is only re-fetched (probed) at this slower cadence.
+STRUCTURE_PROBE_INTERVAL = 2 * MAX_UPDATE_INTERVAL  # 2 hours
+# Responses smaller than this are treated as error/challenge pages rather
+# than a redesigned page, so they never trigger probe mode on their own.
+MIN_STRUCTURAL_PAGE_SIZE = 20_000  # characters
+
+# Load shedding (see load_monitor.py): while the event loop lags or the CPU
+# is saturated, refreshes skip the daily, air quality and health pages and
+# keep their previous data, unless it is older than SHED_MAX_AGE.
+LOAD_SAMPLE_INTERVAL = 1.0  # seconds between loop lag / CPU samples
+LOAD_WINDOW = 30  # samples considered
+LOOP_LAG_THRESHOLD_MS = 100  # p90 loop lag over the window
+CPU_PRESSURE_THRESHOLD = 0.9  # process CPU use, 1.0 = one core
+SYSTEM_LOAD_THRESHOLD = 1.5  # 1-minute load average per CPU
+SHED_MAX_AGE = 2 * MAX_UPDATE_INTERVAL  # seconds
+
+# Forecast pages on demand: the daily and hourly pages are fetched every
+# refresh only while a forecast subscriber (e.g. a dashboard card) listens.
+# Otherwise they are fetched when read, and kept for an update interval; the
+# hourly page is still fetched hourly for adaptive polling.
+UNSUBSCRIBED_HOURLY_MAX_AGE = 3600  # seconds
+# Further daily pages (?page=2...) extend the daily horizon. They are only
+# loaded when the daily forecast is read, and kept this long.
+DAILY_EXTRA_PAGES = 1
+DAILY_EXTRA_PAGE_TTL = 6 * 3600  # seconds
+# Hourly horizon: the hourly page covers 24 hours; the further ?day=N pages
+# extend it. They are fetched concurrently through rate_limit.PAGE_LIMITER
+# and reused for HOURLY_EXTRA_PAGE_TTL, as AccuWeather updates them hourly.
+HOURLY_FORECAST_DAYS = 3
+HOURLY_EXTRA_PAGE_TTL = 3600  # seconds
+EXTRA_PAGE_CONCURRENCY = 3  # pages in flight, shared by every location
+EXTRA_PAGE_SPACING = 0.5  # seconds between their starts
+
+# Sub-hourly interpolation of the hourly forecast (see interpolation.py).
+# The interpolated sensors read a grid computed once per hourly forecast
+# change; the service interpolates to any times, up to the point limit.
+INTERPOLATION_SENSOR_RESOLUTION = 300  # seconds between grid points
+INTERPOLATION_DEFAULT_RESOLUTION = 15  # minutes, service
+INTERPOLATION_MAX_POINTS = 2000
+# Interpolated field -> its key in the hourly forecast items
+INTERPOLATED_FIELDS = {
+    "temperature": "native_temperature",
+    "apparent_temperature": "native_apparent_temperature",
+    "precipitation_probability": "precipitation_probability",
+    "humidity": "humidity",
+    "wind_speed": "wind_speed",
+}
+
+# Dispatcher signal sent after every refresh, formatted with the location key
+SIGNAL_REFRESH_FINISHED = "accuweather_refresh_finished_{}"
+
+# Services
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PROFILER = "profiler"
+ATTR_TOP_N = "top_n"
+ATTR_TRACE_MEMORY = "trace_memory"
+SERVICE_IMPORT_LOCATIONS = "import_locations"
+ATTR_LOCATIONS = "locations"
+ATTR_DRY_RUN = "dry_run"
+SERVICE_INTERPOLATE_FORECAST = "interpolate_forecast"
+ATTR_TIMES = "times"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_RESOLUTION = "resolution"
+ATTR_FIELDS = "fields"
+
+# Bulk import (see bulk_import.py): locations are resolved and validated
+# BULK_IMPORT_CONCURRENCY at a time, started BULK_IMPORT_SPACING apart, then
+# set up BULK_IMPORT_BATCH_SIZE at a time so first refreshes do not all
+# hit AccuWeather at once.
+BULK_IMPORT_MAX_ITEMS = 200
+BULK_IMPORT_CONCURRENCY = 4
+BULK_IMPORT_SPACING = 0.5  # seconds
+BULK_IMPORT_BATCH_SIZE = 5
+BULK_IMPORT_BATCH_DELAY = 10  # seconds between batches
+
 # Weather conditions mapping to Home Assistant
 CONDITION_MAP = {
     "sunny": "sunny",
@@ -2,26 +2,72 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+from collections import Counter
+from datetime import date, timedelta
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL
+from .canonical_urls import CanonicalUrls
+from .const import (
+    CONF_CANONICAL_URLS, DAILY_EXTRA_PAGES, DAILY_EXTRA_PAGE_TTL, DOMAIN,
+    DEFAULT_ADAPTIVE_POLLING, DEFAULT_UPDATE_INTERVAL, HOURLY_EXTRA_PAGE_TTL,
+    HOURLY_FORECAST_DAYS, SHED_MAX_AGE,
+    SIGNAL_REFRESH_FINISHED, STRUCTURE_PROBE_INTERVAL, UNSUBSCRIBED_HOURLY_MAX_AGE,
+    PAGE_AIR, PAGE_CURRENT, PAGE_DAILY, PAGE_HEALTH, PAGE_HOURLY, PAGE_MINUTECAST,
+)
+from .fetch_metrics import FetchMetrics
+from .load_monitor import LOAD_MONITOR
+from .parser_monitor import PARSER_MONITOR
+from .rate_limit import PAGE_LIMITER
+from .polling import (
+    FLEET_PLANNER, OUTLOOK_WET, ObservationClock, adaptive_interval, phase_delay,
+    precipitation_outlook,
+)
 from .utils import (
     get_current_weather, get_daily_forecast, get_hourly_forecast,
     get_air_quality, crawl_all_health_activities, get_minutecast_data,
-    slugify,
+    merge_daily_forecasts, merge_hourly_forecasts, slugify,
 )
 
+if TYPE_CHECKING:
+    from .interpolation import HourlySeries
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _load_hourly_series() -> type[HourlySeries]:
+    """Import the interpolation module, and so NumPy; run in the import executor."""
+    from .interpolation import HourlySeries
+
+    return HourlySeries
+
+# Pages skipped while the host is busy, with their key in the data
+SHEDDABLE_PAGES = {
+    PAGE_DAILY: "daily_forecast",
+    PAGE_AIR: "air_quality",
+    PAGE_HEALTH: "health_activities",
+}
+
+# Pages fetched every refresh only while a forecast subscriber listens,
+# with their key in the data
+FORECAST_PAGES = {
+    PAGE_DAILY: "daily_forecast",
+    PAGE_HOURLY: "hourly_forecast",
+}
+# Forecast data read this long after its interval is still current: the
+# refresh that replaces it may not have finished yet
+FORECAST_READ_GRACE = 60  # seconds
+
+
 class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching AccuWeather data."""
 
@@ -33,12 +79,52 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
         location_name: str,
         config_entry: ConfigEntry,
         update_interval: int = DEFAULT_UPDATE_INTERVAL,
+        fetch_metrics: FetchMetrics | None = None,
+        adaptive_polling: bool = DEFAULT_ADAPTIVE_POLLING,
     ) -> None:
         """Initialize."""
         self.location_key = location_key
         self.location_name = location_name
         self.location_slug = slugify(location_name)
         self.session = session
+        self._entry = config_entry
+        # Page URLs learned from redirects, persisted in the entry's data
+        self.canonical_urls = CanonicalUrls(
+            location_key,
+            self.location_slug,
+            config_entry.data.get(CONF_CANONICAL_URLS) if config_entry else None,
+        )
+        # Should be the object whose trace_config() is on `session`, so
+        # network timings and body/parse timings land in the same place.
+        self.fetch_metrics = fetch_metrics or FetchMetrics()
+        self._normal_interval = timedelta(seconds=update_interval)
+        # Adapt update_interval to the precipitation outlook after each refresh
+        self.adaptive_polling = adaptive_polling
+        # The adaptive interval, before alignment and phase moved it
+        self._adaptive_interval = float(update_interval)
+        self.precipitation_outlook: str | None = None
+        # Learns when new current-conditions observations are published
+        self.observation_clock = ObservationClock()
+        # True while the current-weather page no longer parses; the coordinator
+        # then only probes that page every STRUCTURE_PROBE_INTERVAL seconds.
+        self.structure_probe = False
+        # Monotonic time of the last fetch per page type
+        self._last_fetch: dict[str, float] = {}
+        # Forecast subscribers per page type (see async_add_forecast_listener)
+        self._forecast_listeners: Counter[str] = Counter()
+        self._forecast_locks = {page_type: asyncio.Lock() for page_type in FORECAST_PAGES}
+        # Further daily pages, loaded when the daily forecast is read
+        self._extra_daily: list[dict[str, Any]] = []
+        self._extra_daily_fetched: float | None = None
+        # Hourly ?day=N pages: day -> (monotonic fetch time, local date, items)
+        self._hourly_days: dict[int, tuple[float, date, list[dict[str, Any]]]] = {}
+        # Day -> (body digest, items) of the last parse, see get_hourly_forecast
+        self._hourly_parsed: dict[int, tuple[bytes, list[dict[str, Any]]]] = {}
+        # Interpolation arrays of the hourly data they were built from, once
+        # the interpolation module is loaded (see async_load_interpolation)
+        self._hourly_series_type: type[HourlySeries] | None = None
+        self._hourly_series: HourlySeries | None = None
+        self._hourly_series_source: list[dict[str, Any]] | None = None
 
         super().__init__(
             hass,
@@ -46,16 +132,293 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
             config_entry=config_entry,
+            # Entities are only written when a refresh returns different data
+            always_update=False,
+        )
+
+    def _should_fetch(self, page_type: str) -> bool:
+        """Return False while a page's structure is broken and no probe is due."""
+        now = time.monotonic()
+        if PARSER_MONITOR.structure_changed(page_type):
+            last = self._last_fetch.get(page_type)
+            if last is not None and now - last < STRUCTURE_PROBE_INTERVAL:
+                _LOGGER.debug(
+                    "Skipping %s page for %s: structure changed, next probe in %.0fs",
+                    page_type, self.location_key,
+                    STRUCTURE_PROBE_INTERVAL - (now - last),
+                )
+                return False
+        self._last_fetch[page_type] = now
+        return True
+
+    def _shed_reason(self, page_type: str) -> str | None:
+        """Return why a low-priority page should be skipped now, or None.
+
+        The page's previous data is kept instead; it is fetched regardless
+        once that data is older than SHED_MAX_AGE.
+        """
+        key = SHEDDABLE_PAGES.get(page_type)
+        if key is None or not self.data or key not in self.data:
+            return None
+        last = self._last_fetch.get(page_type)
+        if last is None or time.monotonic() - last >= SHED_MAX_AGE:
+            return None
+        return LOAD_MONITOR.pressure()
+
+    def _shed(self, page_type: str) -> bool:
+        """Return True, and count the shed page, to skip it in this refresh."""
+        if (reason := self._shed_reason(page_type)) is None:
+            return False
+        _LOGGER.debug(
+            "AccuWeather %s: host busy (%s), keeping previous %s data",
+            self.location_key, reason, page_type,
         )
+        self.fetch_metrics.record_shed(page_type, reason)
+        return True
+
+    @callback
+    def async_add_forecast_listener(self, page_type: str) -> CALLBACK_TYPE:
+        """Fetch a forecast page every refresh until the returned callback is called."""
+        self._forecast_listeners[page_type] += 1
+
+        @callback
+        def remove_listener() -> None:
+            self._forecast_listeners[page_type] -= 1
+
+        return remove_listener
+
+    def _forecast_wanted(self, page_type: str) -> bool:
+        """Return whether this refresh should fetch a forecast page.
+
+        Without subscribers the hourly page is still fetched every
+        UNSUBSCRIBED_HOURLY_MAX_AGE for the adaptive polling outlook.
+        """
+        if self._forecast_listeners[page_type] > 0:
+            return True
+        if page_type == PAGE_HOURLY and self.adaptive_polling:
+            last = self._last_fetch.get(page_type)
+            return last is None or time.monotonic() - last >= UNSUBSCRIBED_HOURLY_MAX_AGE
+        return False
+
+    def _kept_forecast(self, page_type: str) -> list[dict[str, Any]]:
+        """Return the forecast page data of the previous refresh, if any."""
+        return (self.data or {}).get(FORECAST_PAGES[page_type]) or []
+
+    def _forecast_current(self, page_type: str) -> bool:
+        """Return whether a forecast page was fetched within the update interval."""
+        last = self._last_fetch.get(page_type)
+        if last is None or FORECAST_PAGES[page_type] not in (self.data or {}):
+            return False
+        interval = (self.update_interval or self._normal_interval).total_seconds()
+        return time.monotonic() - last < interval + FORECAST_READ_GRACE
+
+    async def async_forecast(self, page_type: str) -> list[dict[str, Any]]:
+        """Return a forecast page's data for a reader, fetching it if not current.
+
+        Subscribed pages are fetched by every refresh; others are fetched
+        here when read and then kept for an update interval. While the host
+        is busy a sheddable page is not fetched here either (see
+        _shed_reason), nor counted as shed: no refresh skipped it. The daily
+        forecast is extended with the further daily pages.
+        """
+        key = FORECAST_PAGES[page_type]
+        async with self._forecast_locks[page_type]:
+            if (
+                not self._forecast_current(page_type)
+                and self._shed_reason(page_type) is None
+                and self._should_fetch(page_type)
+            ):
+                if page_type == PAGE_DAILY:
+                    forecast = await get_daily_forecast(
+                        self.session, self.location_key, self.location_slug,
+                        self.fetch_metrics, self.canonical_urls,
+                    )
+                else:
+                    forecast = await self._fetch_hourly()
+                if self.data is not None:
+                    # Not a refresh: no listener update and no rescheduling
+                    self.data = {**self.data, key: forecast}
+            forecast = self._kept_forecast(page_type)
+            if page_type == PAGE_DAILY and forecast:
+                forecast = merge_daily_forecasts(forecast, await self._extended_daily())
+        return forecast
+
+    async def async_load_interpolation(self) -> None:
+        """Load the interpolation module (and NumPy) off the event loop."""
+        if self._hourly_series_type is None:
+            self._hourly_series_type = await self.hass.async_add_import_executor_job(
+                _load_hourly_series
+            )
+
+    @property
+    def hourly_series(self) -> HourlySeries | None:
+        """Return the hourly forecast as interpolation arrays, rebuilt when it changes.
+
+        None until async_load_interpolation has run: this never imports.
+        """
+        hourly = (self.data or {}).get(FORECAST_PAGES[PAGE_HOURLY])
+        if not hourly or self._hourly_series_type is None:
+            return None
+        if hourly is not self._hourly_series_source:
+            self._hourly_series = self._hourly_series_type.from_forecast(
+                hourly, dt_util.now()
+            )
+            self._hourly_series_source = hourly
+        return self._hourly_series
+
+    async def _extended_daily(self) -> list[dict[str, Any]]:
+        """Return the further daily pages, fetched at most every DAILY_EXTRA_PAGE_TTL."""
+        now = time.monotonic()
+        if (
+            self._extra_daily_fetched is not None
+            and now - self._extra_daily_fetched < DAILY_EXTRA_PAGE_TTL
+        ):
+            return self._extra_daily
+        if self._extra_daily and LOAD_MONITOR.pressure() is not None:
+            # Host busy: keep the stale pages, as _shed does for the first
+            return self._extra_daily
+        self._extra_daily_fetched = now
+
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            async with PAGE_LIMITER:
+                return await get_daily_forecast(
+                    self.session, self.location_key, self.location_slug,
+                    self.fetch_metrics, self.canonical_urls, page=page,
+                )
+
+        pages = await asyncio.gather(
+            *(fetch_page(page) for page in range(2, 2 + DAILY_EXTRA_PAGES))
+        )
+        self._extra_daily = merge_daily_forecasts(*pages)
+        _LOGGER.debug(
+            "AccuWeather %s: %d days from further daily pages",
+            self.location_key, len(self._extra_daily),
+        )
+        return self._extra_daily
+
+    async def _fetch_hourly(self) -> list[dict[str, Any]]:
+        """Fetch the hourly forecast over HOURLY_FORECAST_DAYS pages.
+
+        The first page is fetched every time. The further ?day=N pages are
+        reused for HOURLY_EXTRA_PAGE_TTL (and never across local midnight,
+        when their day numbers shift); stale ones are fetched concurrently
+        through the shared PAGE_LIMITER.
+        """
+        now = time.monotonic()
+        today = dt_util.now().date()
+
+        async def fetch_day(day: int) -> list[dict[str, Any]]:
+            cached = self._hourly_days.get(day)
+            if (
+                day > 1
+                and cached is not None
+                and now - cached[0] < HOURLY_EXTRA_PAGE_TTL
+                and cached[1] == today
+            ):
+                return cached[2]
+            fetch = get_hourly_forecast(
+                self.session, self.location_key, self.location_slug,
+                self.fetch_metrics, self.canonical_urls,
+                day=day, parsed=self._hourly_parsed,
+            )
+            if day == 1:
+                items = await fetch
+            else:
+                async with PAGE_LIMITER:
+                    items = await fetch
+            if items:
+                self._hourly_days[day] = (now, today, items)
+            return items
+
+        # The first page on its own: it also learns the canonical hourly URL
+        # the further pages are built from
+        first = await fetch_day(1)
+        further = await asyncio.gather(
+            *(fetch_day(day) for day in range(2, HOURLY_FORECAST_DAYS + 1))
+        ) if first else []
+        return merge_hourly_forecasts([first, *further])
+
+    def _store_canonical_urls(self) -> None:
+        """Persist newly learned canonical URLs in the config entry."""
+        if not self.canonical_urls.changed or self._entry is None:
+            return
+        self.canonical_urls.changed = False
+        self.hass.config_entries.async_update_entry(
+            self._entry,
+            data={**self._entry.data, CONF_CANONICAL_URLS: self.canonical_urls.as_dict()},
+        )
+
+    def _set_structure_probe(self, enabled: bool) -> None:
+        """Switch between the configured cadence and the slow probe cadence."""
+        if enabled == self.structure_probe:
+            return
+        self.structure_probe = enabled
+        if enabled:
+            self.update_interval = timedelta(seconds=STRUCTURE_PROBE_INTERVAL)
+            _LOGGER.warning(
+                "AccuWeather %s: current weather page no longer parses, "
+                "probing every %d s until it does",
+                self.location_key, STRUCTURE_PROBE_INTERVAL,
+            )
+        else:
+            self.update_interval = self._normal_interval
+            _LOGGER.info(
+                "AccuWeather %s: current weather page parses again, "
+                "resuming %d s update interval",
+                self.location_key, self._normal_interval.total_seconds(),
+            )
+
+    def _plan_next_refresh(self, data: dict[str, Any] | None) -> None:
+        """Set update_interval for the next refresh.
+
+        With adaptive polling the interval follows the refresh's precipitation
+        outlook (after a failed refresh, data None, a backed-off interval is
+        reset to the configured one so the retry is not an hour away). Unless
+        precipitation is imminent it is then moved to just after an expected
+        new observation, staggered by the location's fleet phase; otherwise
+        the refresh is put on the location's phase of the interval so that
+        locations do not refresh in one burst.
+        """
+        if self.structure_probe:
+            return
+        configured = self._normal_interval.total_seconds()
+        phase = FLEET_PLANNER.phase(self.location_key)
+        now = time.time()
+        if not self.adaptive_polling:
+            delay = phase_delay(now, configured, phase)
+        elif data is None:
+            self._adaptive_interval = min(self._adaptive_interval, configured)
+            delay = phase_delay(now, self._adaptive_interval, phase)
+        else:
+            self.precipitation_outlook = precipitation_outlook(data)
+            self._adaptive_interval = adaptive_interval(
+                self.precipitation_outlook, self._adaptive_interval, configured
+            )
+            delay = None
+            if self.precipitation_outlook != OUTLOOK_WET:
+                delay = self.observation_clock.align(now, self._adaptive_interval, phase)
+            if delay is None:
+                delay = phase_delay(now, self._adaptive_interval, phase)
+        _LOGGER.debug(
+            "AccuWeather %s: outlook %s, interval %d s, next refresh in %d s (phase %.2f)",
+            self.location_key, self.precipitation_outlook,
+            self._adaptive_interval if self.adaptive_polling else configured, delay, phase,
+        )
+        self.update_interval = timedelta(seconds=round(delay))
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
+        self.fetch_metrics.start_refresh()
         try:
             # Run requests sequentially with delays to avoid triggering bot detection.
             # Sending many concurrent requests is a strong bot signal.
             await asyncio.sleep(0.5)
 
-            current_weather = await get_current_weather(self.session, self.location_key, self.location_slug)
+            self._last_fetch[PAGE_CURRENT] = time.monotonic()
+            current_weather = await get_current_weather(
+                self.session, self.location_key, self.location_slug, self.fetch_metrics,
+                self.canonical_urls,
+            )
             if isinstance(current_weather, Exception):
                 _LOGGER.debug(
                     "Exception getting current weather: %s: %s",
@@ -69,66 +432,111 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                     "or page unavailable for %s)",
                     self.location_key,
                 )
+                if PARSER_MONITOR.structure_changed(PAGE_CURRENT):
+                    # Every other page is useless without current conditions;
+                    # stop here and poll at the probe cadence.
+                    self._set_structure_probe(True)
+                    raise UpdateFailed(
+                        "AccuWeather page structure changed; "
+                        f"probing every {STRUCTURE_PROBE_INTERVAL} s"
+                    )
+            if current_weather:
+                self._set_structure_probe(False)
+                self.observation_clock.observe(current_weather.get("time"), time.time())
 
-            await asyncio.sleep(0.5)
+            daily_forecast = []
+            if not self._forecast_wanted(PAGE_DAILY):
+                daily_forecast = self._kept_forecast(PAGE_DAILY)
+            elif self._shed(PAGE_DAILY):
+                daily_forecast = self.data["daily_forecast"]
+            elif self._should_fetch(PAGE_DAILY):
+                await asyncio.sleep(0.5)
 
-            daily_forecast = await get_daily_forecast(self.session, self.location_key, self.location_slug)
-            if isinstance(daily_forecast, Exception):
-                _LOGGER.debug(
-                    "Exception getting daily forecast: %s: %s",
-                    type(daily_forecast).__name__,
-                    daily_forecast,
+                daily_forecast = await get_daily_forecast(
+                    self.session, self.location_key, self.location_slug, self.fetch_metrics,
+                    self.canonical_urls,
                 )
-                daily_forecast = []
+                if isinstance(daily_forecast, Exception):
+                    _LOGGER.debug(
+                        "Exception getting daily forecast: %s: %s",
+                        type(daily_forecast).__name__,
+                        daily_forecast,
+                    )
+                    daily_forecast = []
+            else:
+                # Structure probe back-off: keep the last good data
+                daily_forecast = self._kept_forecast(PAGE_DAILY)
 
-            await asyncio.sleep(0.5)
+            if not self._forecast_wanted(PAGE_HOURLY):
+                hourly_forecast = self._kept_forecast(PAGE_HOURLY)
+            elif self._should_fetch(PAGE_HOURLY):
+                await asyncio.sleep(0.5)
 
-            hourly_forecast = await get_hourly_forecast(self.session, self.location_key, self.location_slug)
-            if isinstance(hourly_forecast, Exception):
-                _LOGGER.debug(
-                    "Exception getting hourly forecast: %s: %s",
-                    type(hourly_forecast).__name__,
-                    hourly_forecast,
-                )
-                hourly_forecast = []
+                hourly_forecast = await self._fetch_hourly()
+            else:
+                hourly_forecast = self._kept_forecast(PAGE_HOURLY)
 
-            await asyncio.sleep(0.5)
+            air_quality = {"category": None, "description": None, "pollutants": {}}
+            if self._shed(PAGE_AIR):
+                air_quality = self.data["air_quality"]
+            elif self._should_fetch(PAGE_AIR):
+                await asyncio.sleep(0.5)
 
-            air_quality = await get_air_quality(self.session, self.location_key, self.location_slug)
-            if isinstance(air_quality, Exception):
-                _LOGGER.debug(
-                    "Exception getting air quality: %s: %s",
-                    type(air_quality).__name__,
-                    air_quality,
+                air_quality = await get_air_quality(
+                    self.session, self.location_key, self.location_slug, self.fetch_metrics,
+                    self.canonical_urls,
                 )
-                air_quality = {"category": None, "description": None, "pollutants": {}}
+                if isinstance(air_quality, Exception):
+                    _LOGGER.debug(
+                        "Exception getting air quality: %s: %s",
+                        type(air_quality).__name__,
+                        air_quality,
+                    )
+                    air_quality = {"category": None, "description": None, "pollutants": {}}
+            else:
+                air_quality = (self.data or {}).get("air_quality", air_quality)
 
-            await asyncio.sleep(0.5)
+            health_activities = {}
+            if self._shed(PAGE_HEALTH):
+                health_activities = self.data["health_activities"]
+            elif self._should_fetch(PAGE_HEALTH):
+                await asyncio.sleep(0.5)
 
-            health_activities = await crawl_all_health_activities(self.session, self.location_key, self.location_slug)
-            if isinstance(health_activities, Exception):
-                _LOGGER.debug(
-                    "Exception getting health activities: %s: %s",
-                    type(health_activities).__name__,
-                    health_activities,
+                health_activities = await crawl_all_health_activities(
+                    self.session, self.location_key, self.location_slug, self.fetch_metrics,
+                    self.canonical_urls,
                 )
-                health_activities = {}
+                if isinstance(health_activities, Exception):
+                    _LOGGER.debug(
+                        "Exception getting health activities: %s: %s",
+                        type(health_activities).__name__,
+                        health_activities,
+                    )
+                    health_activities = {}
+            else:
+                health_activities = (self.data or {}).get("health_activities", health_activities)
 
-            await asyncio.sleep(0.5)
+            minutecast = None
+            if self._should_fetch(PAGE_MINUTECAST):
+                await asyncio.sleep(0.5)
 
-            minutecast = await get_minutecast_data(self.session, self.location_key, self.location_slug)
-            if isinstance(minutecast, Exception):
-                _LOGGER.debug(
-                    "Exception getting MinuteCast: %s: %s",
-                    type(minutecast).__name__,
-                    minutecast,
+                minutecast = await get_minutecast_data(
+                    self.session, self.location_key, self.location_slug, self.fetch_metrics,
+                    self.canonical_urls,
                 )
-                minutecast = None
+                if isinstance(minutecast, Exception):
+                    _LOGGER.debug(
+                        "Exception getting MinuteCast: %s: %s",
+                        type(minutecast).__name__,
+                        minutecast,
+                    )
+                    minutecast = None
 
             if not current_weather:
+                self._plan_next_refresh(None)
                 raise UpdateFailed("Failed to get current weather data")
 
-            return {
+            data = {
                 "current": current_weather,
                 "daily_forecast": daily_forecast or [],
                 "hourly_forecast": hourly_forecast or [],
@@ -139,6 +547,11 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                 "location_key": self.location_key,
                 "location_name": self.location_name,
             }
+            if self.last_update_success and data == self.data:
+                # always_update=False: listeners will not be called
+                self.fetch_metrics.skipped_state_writes += len(self._listeners)
+            self._plan_next_refresh(data)
+            return data
 
         except UpdateFailed:
             # Re-raise UpdateFailed without wrapping
@@ -150,4 +563,11 @@ class AccuWeatherDataUpdateCoordinator(DataUpdateCoordinator):
                 exception,
                 exc_info=True,
             )
+            self._plan_next_refresh(None)
             raise UpdateFailed(f"Unexpected error: {exception}") from exception
+        finally:
+            self.fetch_metrics.finish_refresh()
+            self._store_canonical_urls()
+            async_dispatcher_send(
+                self.hass, SIGNAL_REFRESH_FINISHED.format(self.location_key)
+            )
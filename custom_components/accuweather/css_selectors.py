@@ -0,0 +1,124 @@
+"""Compiled CSS selectors used by the HTML parsers.
+
+Tag.select()/select_one() with a string selector go through bs4's CSS
+wrapper and soupsieve's compile cache on every call, for every row. Each
+selector here is compiled exactly once, on first use, and the compiled
+pattern is reused afterwards. Compilation time is tracked separately so it
+can be confirmed that it is no longer part of the parse hot path.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import soupsieve
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CssSelector:
+    """A CSS selector compiled lazily on first use."""
+
+    __slots__ = ("pattern", "_compiled")
+
+    def __init__(self, pattern: str) -> None:
+        """Register the selector; compilation is deferred."""
+        self.pattern = pattern
+        self._compiled: soupsieve.SoupSieve | None = None
+        _REGISTRY.append(self)
+
+    @property
+    def compiled(self) -> soupsieve.SoupSieve:
+        """Return the compiled selector, compiling it on first access."""
+        if self._compiled is None:
+            import soupsieve
+
+            started = time.perf_counter()
+            self._compiled = soupsieve.compile(self.pattern)
+            elapsed = time.perf_counter() - started
+            _COMPILE_STATS["selectors"] += 1
+            _COMPILE_STATS["seconds"] += elapsed
+            _LOGGER.debug(
+                "Compiled CSS selector %r in %.3f ms", self.pattern, elapsed * 1000
+            )
+        return self._compiled
+
+    def select_one(self, tag: Any) -> Any:
+        """Return the first match under tag, like Tag.select_one()."""
+        return self.compiled.select_one(tag)
+
+    def select(self, tag: Any) -> list[Any]:
+        """Return all matches under tag, like Tag.select()."""
+        return self.compiled.select(tag)
+
+
+_REGISTRY: list[CssSelector] = []
+_COMPILE_STATS: dict[str, float] = {"selectors": 0, "seconds": 0.0}
+
+
+def compile_all() -> None:
+    """Compile every registered selector now (e.g. from a benchmark warm-up)."""
+    for selector in _REGISTRY:
+        selector.compiled  # noqa: B018 - property access compiles
+
+
+def compile_stats() -> dict[str, float]:
+    """Return how many selectors were compiled and the total time it took."""
+    return {
+        "registered": len(_REGISTRY),
+        "compiled": int(_COMPILE_STATS["selectors"]),
+        "compile_ms": round(_COMPILE_STATS["seconds"] * 1000, 3),
+    }
+
+
+# Current weather
+CURRENT_CARD = CssSelector(".current-weather-card")
+CURRENT_TIME = CssSelector(".card-header .sub")
+CURRENT_TEMP = CssSelector(".display-temp")
+PHRASE = CssSelector(".phrase")
+CURRENT_EXTRA = CssSelector(".current-weather-extra")
+CURRENT_DETAIL_ITEMS = CssSelector(".current-weather-details .detail-item")
+FIRST_DIV = CssSelector("div:nth-child(1)")
+SECOND_DIV = CssSelector("div:nth-child(2)")
+
+# Daily forecast
+DAILY_WRAPPERS = CssSelector(".daily-wrapper")
+DAILY_CARD = CssSelector(".daily-forecast-card")
+DAILY_CONTENT = CssSelector(".half-day-card-content")
+DAILY_DATE_H2 = CssSelector(".info h2.date")
+DATE = CssSelector(".date")
+PRECIP = CssSelector(".precip")
+TEMP = CssSelector(".temp")
+HIGH = CssSelector(".high")
+LOW = CssSelector(".low")
+DAILY_PANELS = CssSelector(".panels .left, .panels .right")
+PANEL_ITEMS = CssSelector("p.panel-item")
+VALUE = CssSelector(".value")
+
+# Hourly forecast
+HOURLY_ITEMS = CssSelector(".accordion-item.hour")
+
+# Air quality
+AIR_CATEGORY = CssSelector(".air-quality-card .category")
+AIR_STATEMENT = CssSelector(".air-quality-card .statement")
+AIR_POLLUTANTS = CssSelector(".air-quality-pollutant")
+AIR_POLLUTANT_AQI = CssSelector("h3.column")
+
+# MinuteCast (tried in order)
+MINUTECAST_SUMMARIES = (
+    CssSelector(".minute-cast-chart .summary"),
+    CssSelector(".minute-cast-chart"),
+    CssSelector(".minutecast-summary"),
+    CssSelector(".chart-summary"),
+)
+MINUTECAST_CURRENT_SECTIONS = (
+    CssSelector(".current-weather"),
+    CssSelector(".minute-cast-current"),
+    CssSelector(".current-conditions"),
+)
+MINUTECAST_TEMP = CssSelector(".temp, .temperature")
+MINUTECAST_CONDITION = CssSelector(".phrase, .condition, .weather-phrase")
+MINUTECAST_REALFEEL = CssSelector(".realfeel, .real-feel")
+MINUTECAST_TIME = CssSelector(".time, .current-time")
@@ -0,0 +1,116 @@
+"""Diagnostics support for AccuWeather."""
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import css_selectors
+from .const import DOMAIN
+from .coordinator import AccuWeatherDataUpdateCoordinator
+from .load_monitor import LOAD_MONITOR
+from .parser_monitor import PARSER_MONITOR
+from .polling import FLEET_PLANNER
+from .utils import STREAM_STATS
+
+
+def _json_size(value: Any) -> int:
+    """Return the size in bytes of value serialised as JSON."""
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode())
+
+
+def _payload_summary(data: dict[str, Any] | None) -> dict[str, Any]:
+    """Return the JSON size and item count of each coordinator dataset."""
+    if not data:
+        return {"total_bytes": 0, "datasets": {}}
+    datasets = {
+        key: {
+            "bytes": _json_size(value),
+            "items": len(value) if isinstance(value, (list, dict)) else None,
+        }
+        for key, value in data.items()
+    }
+    return {"total_bytes": _json_size(data), "datasets": datasets}
+
+
+def _connector_summary(session: aiohttp.ClientSession) -> dict[str, Any]:
+    """Return the pool limits and how many connections are in use or idle."""
+    connector = session.connector
+    if connector is None:
+        return {"closed": True}
+    # aiohttp has no public pool counters; these attributes have been stable
+    # since 3.0 and are read defensively.
+    acquired = getattr(connector, "_acquired", ())
+    idle = getattr(connector, "_conns", {})
+    return {
+        "closed": session.closed,
+        "limit": connector.limit,
+        "limit_per_host": connector.limit_per_host,
+        "in_use": len(acquired),
+        "idle": sum(len(conns) for conns in idle.values()),
+        "hosts_with_idle": len(idle),
+    }
+
+
+def _dataset_ages(coordinator: AccuWeatherDataUpdateCoordinator) -> dict[str, Any]:
+    """Return seconds since each page type was last fetched."""
+    now = time.monotonic()
+    ages = {
+        page_type: round(now - fetched, 1)
+        for page_type, fetched in coordinator._last_fetch.items()  # noqa: SLF001
+    }
+    current = (coordinator.data or {}).get("current") or {}
+    return {"last_fetch_age_s": ages, "observation_time": current.get("time")}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AccuWeatherDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    metrics = coordinator.fetch_metrics
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception else None,
+            "update_interval_s": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval else None,
+            "structure_probe": coordinator.structure_probe,
+            "adaptive_polling": coordinator.adaptive_polling,
+            "precipitation_outlook": coordinator.precipitation_outlook,
+            "observation_clock": coordinator.observation_clock.as_dict(),
+            "redirects": coordinator.canonical_urls.redirects,
+            "forecast_listeners": dict(coordinator._forecast_listeners),  # noqa: SLF001
+            "fleet_phase": round(FLEET_PLANNER.phase(coordinator.location_key), 4),
+            "fleet_size": len(FLEET_PLANNER.as_dict()),
+        },
+        "dataset_ages": _dataset_ages(coordinator),
+        "last_refresh": {
+            **metrics.last_refresh.as_dict(),
+            "timeline": metrics.last_timeline,
+        },
+        "fetch_metrics": metrics.as_dict(),
+        "session": _connector_summary(coordinator.session),
+        "load": LOAD_MONITOR.as_dict(),
+        "caches": {
+            # Shared by every location
+            "parser_monitor": PARSER_MONITOR.as_dict(),
+            "stream_stats": {
+                page_type: vars(stats) for page_type, stats in STREAM_STATS.items()
+            },
+            "css_selectors": css_selectors.compile_stats(),
+        },
+        "payload": _payload_summary(coordinator.data),
+    }
@@ -0,0 +1,443 @@
+"""Structured-data extraction from script-embedded JSON on AccuWeather pages.
+
+AccuWeather pages embed the API objects they render (current conditions,
+hourly and daily forecasts, MinuteCast) as JSON in <script> blocks and in
+HTML-escaped component attributes. Decoding those is much cheaper than
+building a DOM tree and does not depend on the markup. Each extract_*
+function returns what the matching parse_*_html DOM parser would: the same
+schema, strings and values, rounded as the page displays them. It returns
+None, and the caller falls back to the DOM, when there is no payload or the
+payload lacks a detail the page shows. MinuteCast has its own extractor in
+minutecast.py.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from datetime import datetime
+import html as html_lib
+import json
+import logging
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+_DECODER = json.JSONDecoder()
+
+_SCRIPT_OPEN_RE = re.compile(r"<script\b([^>]*)>", re.IGNORECASE)
+_SCRIPT_CLOSE_RE = re.compile(r"</script\s*>", re.IGNORECASE)
+# Start of a JSON object/array assigned in a script: `x = {`, `x = [`
+_ASSIGNMENT_RE = re.compile(r"=\s*([\[{])")
+# `= ` between an assigned name and its value
+_ASSIGN_OP_RE = re.compile(r"\s*=\s*")
+# Component attributes carrying HTML-escaped JSON: attr="{&quot;Key&quot;:...}"
+_ESCAPED_ATTR_RE = re.compile(r'="([^"]*?&quot;[^"]*)"')
+
+ConditionMapper = Callable[[str | None], str]
+
+# Text found in a page only when it carries the payload an extractor reads;
+# streamed reads also look for it (utils.PAGE_PAYLOAD_NEEDLES)
+CURRENT_NEEDLE = "WeatherText"
+HOURLY_NEEDLE = "IconPhrase"
+DAILY_NEEDLE = "Maximum"
+
+# Vietnamese weekday abbreviations as shown on the daily page ("Th 5 18/9")
+_WEEKDAYS_VI = ("Th 2", "Th 3", "Th 4", "Th 5", "Th 6", "Th 7", "CN")
+# PressureTendency code -> arrow shown before the pressure
+_PRESSURE_ARROWS = {"R": "↑", "F": "↓"}
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a complete JSON document with the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode_escaped_attribute(value: str) -> Any:
+    """Decode an HTML-escaped attribute that holds JSON (possibly JSON-in-a-string)."""
+    text = html_lib.unescape(value).strip()
+    if not text.startswith(("{", "[", '"')):
+        return None
+    try:
+        payload = loads(text)
+    except ValueError:
+        # JSON serialised into a JS string literal: {\"Phrase\":...}
+        payload = loads(f'"{text}"')
+    if isinstance(payload, str):
+        payload = loads(payload)
+    return payload
+
+
+def iter_payloads(html: str) -> Iterator[Any]:
+    """Yield every JSON payload embedded in the page.
+
+    Covers <script type="application/json"> bodies, `name = {...}` /
+    `name = [...]` assignments inside scripts (decoded in place with
+    raw_decode from the match offset) and HTML-escaped JSON attributes.
+    Payloads that fail to decode are skipped.
+    """
+    pos = 0
+    while True:
+        opening = _SCRIPT_OPEN_RE.search(html, pos)
+        if opening is None:
+            break
+        start = opening.end()
+        closing = _SCRIPT_CLOSE_RE.search(html, start)
+        end = closing.start() if closing else len(html)
+        pos = closing.end() if closing else len(html)
+
+        if "json" in opening.group(1).lower():
+            try:
+                yield loads(html[start:end].strip())
+            except ValueError:
+                pass
+            continue
+
+        scan = start
+        while True:
+            match = _ASSIGNMENT_RE.search(html, scan, end)
+            if match is None:
+                break
+            try:
+                payload, scan = _DECODER.raw_decode(html, match.start(1))
+            except ValueError:
+                scan = match.end()
+                continue
+            yield payload
+
+    for match in _ESCAPED_ATTR_RE.finditer(html):
+        try:
+            payload = _decode_escaped_attribute(match.group(1))
+        except ValueError:
+            continue
+        if payload is not None:
+            yield payload
+
+
+def iter_assigned_json(html: str, name: str) -> Iterator[Any]:
+    """Yield each JSON value assigned to `name` in the page, in page order.
+
+    One forward pass: str.find locates the next occurrence of the name and
+    raw_decode parses the value in place from that offset, so no substring
+    is copied and scanning resumes where the decoded value ended. Cost is
+    linear in page size regardless of how large the scripts are.
+    """
+    pos = 0
+    while (pos := html.find(name, pos)) != -1:
+        pos += len(name)
+        operator = _ASSIGN_OP_RE.match(html, pos)
+        if operator is None or operator.end() == pos:
+            # A plain reference (e.g. `indexListData.length`), not an assignment
+            continue
+        try:
+            value, pos = _DECODER.raw_decode(html, operator.end())
+        except ValueError:
+            _LOGGER.debug("iter_assigned_json: undecodable %s value at %d", name, pos)
+            continue
+        yield value
+
+
+def find_objects(payload: Any, keys: frozenset[str]) -> Iterator[dict[str, Any]]:
+    """Yield every dict inside payload (depth-first) that has all given keys."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if keys <= node.keys():
+                yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _find_first(html: str, needle: str, keys: frozenset[str]) -> dict[str, Any] | None:
+    """Return the first embedded object with the given keys, if any."""
+    if needle not in html:
+        return None
+    for payload in iter_payloads(html):
+        for obj in find_objects(payload, keys):
+            return obj
+    return None
+
+
+def _find_series(html: str, needle: str, keys: frozenset[str]) -> list[dict[str, Any]]:
+    """Return the longest embedded list whose items all have the given keys."""
+    if needle not in html:
+        return []
+    best: list[dict[str, Any]] = []
+    for payload in iter_payloads(html):
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                if (
+                    len(node) > len(best)
+                    and all(isinstance(i, dict) and keys <= i.keys() for i in node)
+                ):
+                    best = node
+                else:
+                    stack.extend(node)
+    return best
+
+
+def metric_value(node: Any, *path: str) -> float | None:
+    """Return a numeric value following path, unwrapping {"Metric": {...}}."""
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    if isinstance(node, dict):
+        node = (node.get("Metric") or node).get("Value")
+    if isinstance(node, (int, float)) and not isinstance(node, bool):
+        return float(node)
+    return None
+
+
+def round_display(value: float | None) -> float | None:
+    """Round like the page does for displayed values: halves up (30.5 -> 31)."""
+    return float(math.floor(value + 0.5)) if value is not None else None
+
+
+def _clock(when: datetime) -> str:
+    """Format a time as the current-weather page does: "11:40 SA", "2:05 CH"."""
+    return f"{when.hour % 12 or 12}:{when.minute:02d} {'SA' if when.hour < 12 else 'CH'}"
+
+
+def parse_iso_datetime(value: Any) -> datetime | None:
+    """Parse an ISO-8601 timestamp as used in AccuWeather payloads."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _wind(obj: dict[str, Any]) -> tuple[float | None, str | None]:
+    """Return (displayed speed km/h, localized direction) from a Wind object."""
+    wind = obj.get("Wind") or {}
+    direction = wind.get("Direction") or {}
+    return (
+        round_display(metric_value(wind, "Speed")),
+        direction.get("Localized") or direction.get("English"),
+    )
+
+
+def _wind_text(speed: float | None, bearing: str | None) -> str | None:
+    """Format wind as the "Gió" detail row: "ĐB 11 km/h"."""
+    if speed is None:
+        return None
+    return f"{bearing or ''} {_fmt(speed, ' km/h')}".strip()
+
+
+def _with_category(value: Any, category: str | None) -> str | None:
+    """Format an index and its category: "5 Trung bình"."""
+    if value is None:
+        return None
+    return f"{_fmt(value, '')} {category or ''}".strip()
+
+
+def _air_and_pollen(obj: dict[str, Any], name: str) -> dict[str, Any]:
+    """Return the AirAndPollen entry with the given Name, or {}."""
+    return next(
+        (item for item in obj.get("AirAndPollen") or [] if item.get("Name") == name), {}
+    )
+
+
+def _fmt(value: float | None, suffix: str) -> str | None:
+    """Format a number the way the page prints it in detail rows."""
+    if value is None:
+        return None
+    number = int(value) if float(value).is_integer() else value
+    return f"{number}{suffix}"
+
+
+def _details(pairs: dict[str, str | None]) -> dict[str, str]:
+    """Drop missing values from a label -> text mapping."""
+    return {label: text for label, text in pairs.items() if text is not None}
+
+
+def _shows_missing(html: str, rows: list[dict[str, str | None]]) -> bool:
+    """Return whether the page shows a detail label the payload left empty.
+
+    The DOM parser would return that detail, so the extractor returns None
+    rather than fewer details than the page has.
+    """
+    missing = {label for row in rows for label, text in row.items() if text is None}
+    shown = [label for label in missing if f">{label}<" in html]
+    if shown:
+        _LOGGER.debug("Embedded payload lacks details the page shows: %s", shown)
+    return bool(shown)
+
+
+def extract_current(html: str, map_condition: ConditionMapper) -> dict[str, Any] | None:
+    """Return current conditions in parse_weather_html's schema, or None."""
+    obj = _find_first(
+        html, CURRENT_NEEDLE, frozenset(("WeatherText", "Temperature"))
+    )
+    if obj is None:
+        return None
+    temperature = round_display(metric_value(obj, "Temperature"))
+    if temperature is None:
+        return None
+
+    phrase = obj.get("WeatherText")
+    observed = parse_iso_datetime(obj.get("LocalObservationDateTime"))
+    realfeel = round_display(metric_value(obj, "RealFeelTemperature"))
+    realfeel_shade = round_display(metric_value(obj, "RealFeelTemperatureShade"))
+    wind_speed, wind_bearing = _wind(obj)
+    humidity = obj.get("RelativeHumidity")
+    cloud_cover = obj.get("CloudCover")
+    uv_index = obj.get("UVIndex")
+    pressure = round_display(metric_value(obj, "Pressure"))
+    visibility = round_display(metric_value(obj, "Visibility"))
+    arrow = _PRESSURE_ARROWS.get((obj.get("PressureTendency") or {}).get("Code"), "")
+
+    pairs = {
+        "Độ ẩm": _fmt(humidity, "%"),
+        "Điểm sương": _fmt(round_display(metric_value(obj, "DewPoint")), "° C"),
+        "Khí áp": f"{arrow} {_fmt(pressure, ' mb')}".strip() if pressure is not None else None,
+        "Gió": _wind_text(wind_speed, wind_bearing),
+        "Gió giật mạnh": _fmt(round_display(metric_value(obj, "WindGust", "Speed")), " km/h"),
+        "Tầm nhìn": _fmt(visibility, " km"),
+        "Mật độ mây": _fmt(cloud_cover, "%"),
+        "Trần mây": _fmt(round_display(metric_value(obj, "Ceiling")), " m"),
+        "Chỉ số UV tối đa": _with_category(uv_index, obj.get("UVIndexText")),
+    }
+    if _shows_missing(html, [pairs]):
+        return None
+
+    return {
+        "time": _clock(observed) if observed else None,
+        "temperature": temperature,
+        "temperature_unit": "°C",
+        "condition": map_condition(phrase),
+        "phrase": phrase,
+        "realfeel": f"RealFeel® {_fmt(realfeel, '°')}" if realfeel is not None else None,
+        "realfeel_shade": (
+            f"RealFeel Shade™ {_fmt(realfeel_shade, '°')}"
+            if realfeel_shade is not None else None
+        ),
+        "humidity": float(humidity) if humidity is not None else None,
+        "pressure": pressure,
+        "wind_speed": wind_speed,
+        "wind_bearing": wind_bearing,
+        "visibility": visibility,
+        "cloud_coverage": float(cloud_cover) if cloud_cover is not None else None,
+        "uv_index": float(uv_index) if uv_index is not None else None,
+        "details": _details(pairs),
+    }
+
+
+def extract_hourly(html: str, map_condition: ConditionMapper) -> list[dict[str, Any]] | None:
+    """Return the hourly forecast in parse_hourly_html's schema, or None."""
+    series = _find_series(
+        html, HOURLY_NEEDLE, frozenset(("DateTime", "IconPhrase", "Temperature"))
+    )
+    if not series:
+        return None
+
+    hourly = []
+    rows = []
+    for hour in series:
+        when = parse_iso_datetime(hour.get("DateTime"))
+        phrase = hour.get("IconPhrase")
+        wind_speed, wind_bearing = _wind(hour)
+        humidity = hour.get("RelativeHumidity")
+        cloud_cover = hour.get("CloudCover")
+        uv_index = hour.get("UVIndex")
+        visibility = round_display(metric_value(hour, "Visibility"))
+        precip = hour.get("PrecipitationProbability")
+        pairs = {
+            "Độ ẩm": _fmt(humidity, "%"),
+            "Điểm sương": _fmt(round_display(metric_value(hour, "DewPoint")), "° C"),
+            "Gió": _wind_text(wind_speed, wind_bearing),
+            "Gió giật": _fmt(round_display(metric_value(hour, "WindGust", "Speed")), " km/h"),
+            "Mật độ mây": _fmt(cloud_cover, "%"),
+            "Trần mây": _fmt(round_display(metric_value(hour, "Ceiling")), " m"),
+            "Chỉ số UV tối đa": _with_category(uv_index, hour.get("UVIndexText")),
+            "Tầm nhìn": _fmt(visibility, " km"),
+            "Chất lượng không khí": _air_and_pollen(hour, "AirQuality").get("Category"),
+        }
+        rows.append(pairs)
+        hourly.append({
+            # Unpadded hour, as the page shows it: "0:00", "13:00"
+            "datetime": f"{when.hour}:{when.minute:02d}" if when else None,
+            "native_temperature": round_display(metric_value(hour, "Temperature")),
+            "condition": map_condition(phrase),
+            "phrase": phrase,
+            "native_apparent_temperature": round_display(metric_value(hour, "RealFeelTemperature")),
+            "precipitation_probability": float(precip) if precip is not None else None,
+            "humidity": float(humidity) if humidity is not None else None,
+            "wind_speed": wind_speed,
+            "wind_bearing": wind_bearing,
+            "cloud_coverage": float(cloud_cover) if cloud_cover is not None else None,
+            "uv_index": float(uv_index) if uv_index is not None else None,
+            "visibility": visibility,
+            "details": _details(pairs),
+        })
+    if _shows_missing(html, rows):
+        return None
+    return hourly
+
+
+def extract_daily(html: str, map_condition: ConditionMapper) -> list[dict[str, Any]] | None:
+    """Return the daily forecast in parse_daily_html's schema, or None."""
+    series = _find_series(
+        html, DAILY_NEEDLE, frozenset(("Date", "Temperature", "Day"))
+    )
+    if not series:
+        return None
+
+    daily = []
+    rows = []
+    for day in series:
+        when = parse_iso_datetime(day.get("Date"))
+        half = day.get("Day") or {}
+        phrase = half.get("IconPhrase") or half.get("ShortPhrase")
+        wind_speed, wind_bearing = _wind(half)
+        humidity = (half.get("RelativeHumidity") or {}).get("Average")
+        precip = half.get("PrecipitationProbability")
+        uv = _air_and_pollen(day, "UVIndex")
+        uv_index = uv.get("Value")
+        realfeel = round_display(metric_value(day, "RealFeelTemperature", "Maximum"))
+        realfeel_shade = round_display(metric_value(day, "RealFeelTemperatureShade", "Maximum"))
+        pairs = {
+            "Độ ẩm": _fmt(humidity, "%"),
+            "Gió": _wind_text(wind_speed, wind_bearing),
+            "Gió giật": _fmt(round_display(metric_value(half, "WindGust", "Speed")), " km/h"),
+            "Xác suất giáng thủy": _fmt(precip, "%"),
+            "Chỉ số UV tối đa": _with_category(uv_index, uv.get("Category")),
+            "RealFeel®": _fmt(realfeel, "°"),
+            "RealFeel Shade™": _fmt(realfeel_shade, "°"),
+        }
+        rows.append(pairs)
+        daily.append({
+            "datetime": (
+                f"{_WEEKDAYS_VI[when.weekday()]} {when.day}/{when.month}" if when else None
+            ),
+            "condition": map_condition(phrase),
+            "phrase": half.get("LongPhrase") or phrase,
+            "native_temperature": round_display(metric_value(day, "Temperature", "Maximum")),
+            "native_templow": round_display(metric_value(day, "Temperature", "Minimum")),
+            "precipitation_probability": float(precip) if precip is not None else None,
+            "humidity": float(humidity) if humidity is not None else None,
+            "wind_speed": wind_speed,
+            "wind_bearing": wind_bearing,
+            "uv_index": float(uv_index) if uv_index is not None else None,
+            "realfeel": realfeel,
+            "realfeel_shade": realfeel_shade,
+            "details": _details(pairs),
+        })
+    if _shows_missing(html, rows):
+        return None
+    return daily
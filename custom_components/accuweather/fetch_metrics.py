@@ -0,0 +1,344 @@
+"""Per-endpoint fetch and parse timing for one AccuWeather location.
+
+Network phases (DNS, connect, time to first byte) come from aiohttp trace
+hooks on the location's session; the endpoint is passed to them through
+trace_request_ctx. Download time, body bytes, retries and parse time are
+recorded by utils around the read and the parse. The last ROLLING_WINDOW
+samples of each timing are kept for percentiles, lifetime bucket counts
+for Prometheus histograms, and every step of the last refresh as a
+timeline for diagnostics.
+
+Everything is updated from the event loop only, so counters are plain
+attributes: no locks on the hot path.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+import aiohttp
+
+ROLLING_WINDOW = 50  # samples kept per histogram
+MAX_TIMELINE_EVENTS = 100  # bounds the timeline if a refresh keeps retrying
+
+# Histogram bucket upper bounds, in the unit of the samples
+FETCH_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+PARSE_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+REFRESH_BUCKETS_S = (1, 2, 5, 10, 20, 30, 60, 120, 300)
+
+
+class RollingHistogram:
+    """The last `window` samples of one timing, with lifetime count and sum.
+
+    With `buckets`, lifetime per-bucket counts are kept as well (the last
+    slot counts samples above the highest bound).
+    """
+
+    __slots__ = ("_samples", "count", "total", "buckets", "bucket_counts")
+
+    def __init__(
+        self, buckets: tuple[float, ...] = (), window: int = ROLLING_WINDOW
+    ) -> None:
+        """Initialize an empty histogram."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+
+    def add(self, value: float) -> None:
+        """Record one sample."""
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Return (upper bound, samples <= bound) pairs, ending with +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.bucket_counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent sample."""
+        return self._samples[-1] if self._samples else None
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile of the rolling window."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return last/p50/p90/p99/max over the window plus lifetime count."""
+        if not self._samples:
+            return {"count": self.count}
+        return {
+            "count": self.count,
+            "last": round(self._samples[-1], 2),
+            "p50": round(self.percentile(50), 2),
+            "p90": round(self.percentile(90), 2),
+            "p99": round(self.percentile(99), 2),
+            "max": round(max(self._samples), 2),
+        }
+
+
+def _histogram(buckets: tuple[float, ...] = ()) -> Any:
+    return field(default_factory=lambda: RollingHistogram(buckets))
+
+
+@dataclass
+class EndpointMetrics:
+    """Timings (ms) and counters for one page type."""
+
+    dns_ms: RollingHistogram = _histogram()
+    connect_ms: RollingHistogram = _histogram()
+    ttfb_ms: RollingHistogram = _histogram(FETCH_BUCKETS_MS)
+    download_ms: RollingHistogram = _histogram(FETCH_BUCKETS_MS)
+    parse_ms: RollingHistogram = _histogram(PARSE_BUCKETS_MS)
+    # HTTP status (or "error" for a failed request) -> responses
+    statuses: Counter = field(default_factory=Counter)
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    bytes: int = 0
+    # Refreshes that skipped this page because the host was busy
+    shed: int = 0
+    # len() of the last parse result (items, pollutants, fields...)
+    result_size: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as plain JSON types."""
+        return {
+            "requests": self.requests,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "shed": self.shed,
+            "result_size": self.result_size,
+            "dns_ms": self.dns_ms.as_dict(),
+            "connect_ms": self.connect_ms.as_dict(),
+            "ttfb_ms": self.ttfb_ms.as_dict(),
+            "download_ms": self.download_ms.as_dict(),
+            "parse_ms": self.parse_ms.as_dict(),
+        }
+
+
+@dataclass
+class RefreshTotals:
+    """What one coordinator refresh cost, summed over its endpoints."""
+
+    duration_s: float = 0.0
+    requests: int = 0
+    bytes: int = 0
+    parse_ms: float = 0.0
+    # Pages skipped by load shedding, and why
+    shed: list[str] = field(default_factory=list)
+    shed_reason: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals as plain JSON types."""
+        return {
+            "duration_s": round(self.duration_s, 3),
+            "requests": self.requests,
+            "bytes": self.bytes,
+            "parse_ms": round(self.parse_ms, 2),
+            "shed": self.shed,
+            "shed_reason": self.shed_reason,
+        }
+
+
+class FetchMetrics:
+    """Fetch and parse metrics for one location's session and coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self.endpoints: defaultdict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+        self.refresh_s = RollingHistogram(REFRESH_BUCKETS_S)
+        self.refreshes = 0
+        # Entity updates not sent because a refresh returned unchanged data
+        self.skipped_state_writes = 0
+        # Refreshes that shed at least one page
+        self.shed_refreshes = 0
+        # Totals of the last completed refresh, and of the one in progress
+        self.last_refresh = RefreshTotals()
+        self._current = RefreshTotals()
+        # Lifetime totals of fetches made between refreshes (forecast reads,
+        # services), which belong to no refresh
+        self.outside_refresh = RefreshTotals()
+        self._refresh_started: float | None = None
+        self.last_timeline: list[dict[str, Any]] = []
+        self._timeline: list[dict[str, Any]] = []
+
+    def _mark(self, page_type: str, event: str, **values: Any) -> None:
+        """Append an event to the timeline of the refresh in progress."""
+        if self._refresh_started is None or len(self._timeline) >= MAX_TIMELINE_EVENTS:
+            return
+        self._timeline.append({
+            "t_ms": round((time.perf_counter() - self._refresh_started) * 1000, 1),
+            "page": page_type,
+            "event": event,
+            **values,
+        })
+
+    @property
+    def _totals(self) -> RefreshTotals:
+        """Return the totals a fetch made now is added to."""
+        if self._refresh_started is None:
+            return self.outside_refresh
+        return self._current
+
+    def start_refresh(self) -> None:
+        """Start accumulating a new refresh."""
+        self._current = RefreshTotals()
+        self._timeline = []
+        self._refresh_started = time.perf_counter()
+
+    def finish_refresh(self) -> None:
+        """Close the refresh in progress and make it the last refresh."""
+        if self._refresh_started is None:
+            return
+        self._current.duration_s = time.perf_counter() - self._refresh_started
+        self._refresh_started = None
+        self.refresh_s.add(self._current.duration_s)
+        self.refreshes += 1
+        if self._current.shed:
+            self.shed_refreshes += 1
+        self.last_refresh = self._current
+        self.last_timeline = self._timeline
+        self._current = RefreshTotals()
+        self._timeline = []
+
+    def record_retry(self, page_type: str) -> None:
+        """Count a retried request."""
+        self.endpoints[page_type].retries += 1
+        self._mark(page_type, "retry")
+
+    def record_shed(self, page_type: str, reason: str) -> None:
+        """Count a page skipped because the host was busy."""
+        self.endpoints[page_type].shed += 1
+        if self._refresh_started is None:
+            return
+        self._current.shed.append(page_type)
+        self._current.shed_reason = reason
+        self._mark(page_type, "shed", reason=reason)
+
+    def record_download(self, page_type: str, seconds: float, nbytes: int) -> None:
+        """Record reading one response body."""
+        endpoint = self.endpoints[page_type]
+        endpoint.download_ms.add(seconds * 1000)
+        endpoint.bytes += nbytes
+        self._totals.bytes += nbytes
+        self._mark(page_type, "downloaded", ms=round(seconds * 1000, 2), bytes=nbytes)
+
+    def record_parse(self, page_type: str, started: float, result: Any) -> None:
+        """Record a parse that began at perf_counter() value `started`."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        endpoint = self.endpoints[page_type]
+        endpoint.parse_ms.add(elapsed_ms)
+        endpoint.result_size = len(result) if hasattr(result, "__len__") else None
+        self._totals.parse_ms += elapsed_ms
+        self._mark(
+            page_type, "parsed", ms=round(elapsed_ms, 2), size=endpoint.result_size
+        )
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a TraceConfig that feeds this object from a ClientSession.
+
+        Requests are attributed to trace_request_ctx["page_type"] ("other"
+        when the request was made without one).
+        """
+
+        async def on_request_start(session, context, params) -> None:
+            request_ctx = context.trace_request_ctx or {}
+            context.page_type = request_ctx.get("page_type") or "other"
+            context.started = time.perf_counter()
+            self.endpoints[context.page_type].requests += 1
+            self._totals.requests += 1
+            self._mark(context.page_type, "request")
+
+        async def on_dns_start(session, context, params) -> None:
+            context.dns_started = time.perf_counter()
+
+        async def on_dns_end(session, context, params) -> None:
+            self.endpoints[context.page_type].dns_ms.add(
+                (time.perf_counter() - context.dns_started) * 1000
+            )
+
+        async def on_connect_start(session, context, params) -> None:
+            context.connect_started = time.perf_counter()
+
+        async def on_connect_end(session, context, params) -> None:
+            self.endpoints[context.page_type].connect_ms.add(
+                (time.perf_counter() - context.connect_started) * 1000
+            )
+
+        async def on_request_end(session, context, params) -> None:
+            # Fired once the response headers are in
+            ttfb_ms = (time.perf_counter() - context.started) * 1000
+            endpoint = self.endpoints[context.page_type]
+            endpoint.ttfb_ms.add(ttfb_ms)
+            endpoint.statuses[params.response.status] += 1
+            self._mark(
+                context.page_type, "headers",
+                status=params.response.status, ttfb_ms=round(ttfb_ms, 2),
+            )
+
+        async def on_request_exception(session, context, params) -> None:
+            endpoint = self.endpoints[context.page_type]
+            endpoint.errors += 1
+            endpoint.statuses["error"] += 1
+            self._mark(
+                context.page_type, "error", error=type(params.exception).__name__
+            )
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every metric as plain JSON types."""
+        return {
+            "refreshes": self.refreshes,
+            "skipped_state_writes": self.skipped_state_writes,
+            "shed_refreshes": self.shed_refreshes,
+            "refresh_s": self.refresh_s.as_dict(),
+            "last_refresh": self.last_refresh.as_dict(),
+            "outside_refresh": {
+                "requests": self.outside_refresh.requests,
+                "bytes": self.outside_refresh.bytes,
+                "parse_ms": round(self.outside_refresh.parse_ms, 2),
+            },
+            "endpoints": {
+                page_type: endpoint.as_dict()
+                for page_type, endpoint in sorted(self.endpoints.items())
+            },
+        }
+
+
+@dataclass
+class CacheStats:
+    """Hits and misses of one of the integration's caches."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+# Shared by every location; keyed by cache name
+CACHE_STATS: defaultdict[str, CacheStats] = defaultdict(CacheStats)
@@ -0,0 +1,136 @@
+"""Sub-hourly values from the hourly forecast, interpolated with NumPy.
+
+An HourlySeries turns the coordinator's hourly items into one timestamp
+array and one float array per field, once per change of the hourly data.
+Values at any timestamps are then a single np.interp call per field over
+every requested time, instead of a template walking the forecast list for
+each one. Missing values are skipped (interpolated across); times outside
+the forecast get None. The series also keeps a grid at
+INTERPOLATION_SENSOR_RESOLUTION, which the interpolated sensors read from.
+
+NumPy is only imported with this module, which the coordinator loads in
+the import executor when interpolation is first needed
+(async_load_interpolation).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+from homeassistant.util import dt as dt_util
+
+from .const import INTERPOLATED_FIELDS, INTERPOLATION_SENSOR_RESOLUTION
+from .utils import hourly_times
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class HourlySeries:
+    """The hourly forecast as arrays, for interpolation at any time."""
+
+    def __init__(self, times: np.ndarray, values: dict[str, np.ndarray]) -> None:
+        """Initialize from epoch seconds (ascending) and a value array per field."""
+        self.times = times
+        self.values = values
+        self._valid = {field: ~np.isnan(array) for field, array in values.items()}
+        self.grid_times = np.arange(
+            times[0], times[-1] + 1, INTERPOLATION_SENSOR_RESOLUTION, dtype=float
+        )
+        self.grid = self.at(self.grid_times)
+
+    @classmethod
+    def from_forecast(
+        cls, hourly: list[dict[str, Any]], now: datetime
+    ) -> HourlySeries | None:
+        """Build the series from hourly items, or None without two timed hours."""
+        rows = [
+            (when.timestamp(), item)
+            for item, when in zip(hourly, hourly_times(hourly, now))
+            if when is not None
+        ]
+        rows.sort(key=lambda row: row[0])
+        if len(rows) < 2:
+            return None
+        times = np.fromiter((row[0] for row in rows), dtype=float, count=len(rows))
+        values = {
+            field: np.fromiter(
+                (_to_float(row[1].get(key)) for row in rows), dtype=float, count=len(rows)
+            )
+            for field, key in INTERPOLATED_FIELDS.items()
+        }
+        return cls(times, values)
+
+    @property
+    def start(self) -> datetime:
+        """Return the time of the first hour."""
+        return dt_util.as_local(dt_util.utc_from_timestamp(self.times[0]))
+
+    @property
+    def end(self) -> datetime:
+        """Return the time of the last hour."""
+        return dt_util.as_local(dt_util.utc_from_timestamp(self.times[-1]))
+
+    def at(
+        self, timestamps: np.ndarray, fields: list[str] | None = None
+    ) -> dict[str, np.ndarray]:
+        """Return each field at epoch-second timestamps (NaN outside the forecast)."""
+        result = {}
+        for field in fields or INTERPOLATED_FIELDS:
+            valid = self._valid[field]
+            if not valid.any():
+                result[field] = np.full(len(timestamps), np.nan)
+                continue
+            result[field] = np.interp(
+                timestamps, self.times[valid], self.values[field][valid],
+                left=np.nan, right=np.nan,
+            )
+        return result
+
+    @staticmethod
+    def timestamps(times: list[datetime]) -> np.ndarray:
+        """Return epoch-second timestamps of datetimes, for at()."""
+        return np.array([when.timestamp() for when in times], dtype=float)
+
+    def sample(
+        self, start: datetime, end: datetime, resolution: timedelta
+    ) -> np.ndarray:
+        """Return epoch-second timestamps from start to end (inclusive) every resolution."""
+        step = resolution.total_seconds()
+        return np.arange(start.timestamp(), end.timestamp() + step / 2, step)
+
+    def grid_value(self, field: str, when: datetime) -> float | None:
+        """Return a field from the precomputed grid slot containing `when`."""
+        index = int((when.timestamp() - self.grid_times[0]) // INTERPOLATION_SENSOR_RESOLUTION)
+        if not 0 <= index < len(self.grid_times):
+            return None
+        value = self.grid[field][index]
+        return None if np.isnan(value) else round(float(value), 1)
+
+    @staticmethod
+    def as_rows(
+        timestamps: np.ndarray, values: dict[str, np.ndarray]
+    ) -> list[dict[str, Any]]:
+        """Return one dict per timestamp, rounded to 0.1 and with None for NaN."""
+        columns = {
+            field: [
+                None if value != value else value  # NaN
+                for value in np.round(array, 1).tolist()
+            ]
+            for field, array in values.items()
+        }
+        return [
+            {
+                "datetime": dt_util.as_local(
+                    dt_util.utc_from_timestamp(timestamp)
+                ).isoformat(),
+                **{field: column[index] for field, column in columns.items()},
+            }
+            for index, timestamp in enumerate(timestamps.tolist())
+        ]
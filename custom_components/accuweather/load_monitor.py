@@ -0,0 +1,118 @@
+"""Event-loop lag and CPU pressure, to shed low-priority work when busy.
+
+A timer on the event loop fires every LOAD_SAMPLE_INTERVAL seconds and
+records how late it ran (loop lag) and the share of one CPU the process
+used since the previous tick. The host's load average per CPU is read
+where the platform has one. The coordinators ask pressure() before each
+low-priority page and skip it while any of them is over its threshold.
+"""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CPU_PRESSURE_THRESHOLD,
+    LOAD_SAMPLE_INTERVAL,
+    LOAD_WINDOW,
+    LOOP_LAG_THRESHOLD_MS,
+    SYSTEM_LOAD_THRESHOLD,
+)
+from .fetch_metrics import RollingHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+PRESSURE_LOOP_LAG = "loop_lag"
+PRESSURE_CPU = "cpu"
+PRESSURE_SYSTEM_LOAD = "system_load"
+
+
+class LoadMonitor:
+    """Samples event-loop lag and CPU use while any location is set up."""
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self.lag_ms = RollingHistogram(window=LOAD_WINDOW)
+        self._cpu: deque[float] = deque(maxlen=LOAD_WINDOW)
+        self._hass: HomeAssistant | None = None
+        self._cancel: Any = None
+        self._expected = 0.0
+        self._cpu_time = 0.0
+        self._wall_time = 0.0
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start sampling, unless already running."""
+        if self._cancel is not None:
+            return
+        self._hass = hass
+        self._cpu_time, self._wall_time = time.process_time(), time.monotonic()
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and forget the samples."""
+        if self._cancel is not None:
+            self._cancel()
+            self._cancel = None
+        self.lag_ms = RollingHistogram(window=LOAD_WINDOW)
+        self._cpu.clear()
+
+    def _schedule(self) -> None:
+        loop = self._hass.loop
+        self._expected = loop.time() + LOAD_SAMPLE_INTERVAL
+        self._cancel = loop.call_at(self._expected, self._tick).cancel
+
+    def _tick(self) -> None:
+        self.lag_ms.add(max(0.0, self._hass.loop.time() - self._expected) * 1000)
+        cpu_time, wall_time = time.process_time(), time.monotonic()
+        if wall_time > self._wall_time:
+            self._cpu.append((cpu_time - self._cpu_time) / (wall_time - self._wall_time))
+        self._cpu_time, self._wall_time = cpu_time, wall_time
+        self._schedule()
+
+    @property
+    def cpu_ratio(self) -> float | None:
+        """Return the process's mean CPU use over the window (1.0 = one core)."""
+        return sum(self._cpu) / len(self._cpu) if self._cpu else None
+
+    @staticmethod
+    def system_load() -> float | None:
+        """Return the 1-minute load average per CPU, where available."""
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+        except (AttributeError, OSError):
+            return None
+
+    def pressure(self) -> str | None:
+        """Return why the host counts as busy right now, or None."""
+        lag_p90 = self.lag_ms.percentile(90)
+        if lag_p90 is not None and lag_p90 > LOOP_LAG_THRESHOLD_MS:
+            return PRESSURE_LOOP_LAG
+        cpu = self.cpu_ratio
+        if cpu is not None and cpu > CPU_PRESSURE_THRESHOLD:
+            return PRESSURE_CPU
+        load = self.system_load()
+        if load is not None and load > SYSTEM_LOAD_THRESHOLD:
+            return PRESSURE_SYSTEM_LOAD
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current readings, for diagnostics."""
+        cpu, load = self.cpu_ratio, self.system_load()
+        return {
+            "running": self._cancel is not None,
+            "loop_lag_ms": self.lag_ms.as_dict(),
+            "cpu_ratio": round(cpu, 3) if cpu is not None else None,
+            "system_load_per_cpu": round(load, 2) if load is not None else None,
+            "pressure": self.pressure(),
+        }
+
+
+# Shared by every config entry
+LOAD_MONITOR = LoadMonitor()
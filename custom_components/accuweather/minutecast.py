@@ -0,0 +1,172 @@
+"""MinuteCast extraction from the page's embedded forecast data.
+
+The MinuteCast page embeds the minute-by-minute forecast (one interval per
+minute with radar reflectivity and precipitation type) plus a summary
+phrase. Reading that payload directly avoids the DOM tree and any
+whole-document get_text() pass; the series is kept in compact typed arrays.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from .embedded import (
+    find_objects,
+    iter_payloads,
+    metric_value,
+    parse_iso_datetime,
+    round_display,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+MINUTECAST_NO_DATA = "Không có dữ liệu MinuteCast"
+
+# Precipitation type codes stored in MinuteCastSeries.precipitation
+PRECIP_NONE = 0
+PRECIP_RAIN = 1
+PRECIP_SNOW = 2
+PRECIP_ICE = 3
+PRECIP_MIXED = 4
+_PRECIP_CODES = {
+    "rain": PRECIP_RAIN,
+    "snow": PRECIP_SNOW,
+    "ice": PRECIP_ICE,
+    "mixed": PRECIP_MIXED,
+}
+# Reflectivity at or above this counts as precipitation when an interval
+# carries no explicit PrecipitationType (roughly light rain).
+PRECIP_MIN_DBZ = 20.0
+
+_INTERVAL_KEYS = frozenset(("Intervals",))
+_SUMMARY_KEYS = frozenset(("Summary",))
+_CURRENT_KEYS = frozenset(("WeatherText", "Temperature"))
+
+
+@dataclass
+class MinuteCastSeries:
+    """Minute-by-minute precipitation forecast in typed arrays."""
+
+    start: datetime | None = None
+    minute: array = field(default_factory=lambda: array("H"))
+    dbz: array = field(default_factory=lambda: array("f"))
+    precipitation: array = field(default_factory=lambda: array("B"))
+
+    def __len__(self) -> int:
+        """Return the number of minutes covered."""
+        return len(self.minute)
+
+    def precipitation_window(self) -> tuple[int | None, int | None]:
+        """Return (first wet minute, first dry minute after it).
+
+        Either value is None when there is no precipitation in the series or
+        it does not stop within the forecast horizon.
+        """
+        start_index = next(
+            (i for i, code in enumerate(self.precipitation) if code), None
+        )
+        if start_index is None:
+            return None, None
+        end_index = next(
+            (
+                i
+                for i in range(start_index + 1, len(self.precipitation))
+                if not self.precipitation[i]
+            ),
+            None,
+        )
+        return (
+            self.minute[start_index],
+            self.minute[end_index] if end_index is not None else None,
+        )
+
+    def at_minute(self, minute: int | None) -> str | None:
+        """Return the ISO timestamp of a minute offset, if the start is known."""
+        if minute is None or self.start is None:
+            return None
+        return (self.start + timedelta(minutes=minute)).isoformat()
+
+
+def _build_series(intervals: list[Any]) -> MinuteCastSeries:
+    """Pack MinuteCast interval objects into a MinuteCastSeries."""
+    series = MinuteCastSeries()
+    for offset, interval in enumerate(intervals):
+        if not isinstance(interval, dict):
+            continue
+        if series.start is None:
+            series.start = parse_iso_datetime(interval.get("StartDateTime"))
+        minute = interval.get("Minute")
+        dbz = interval.get("Dbz")
+        dbz = float(dbz) if isinstance(dbz, (int, float)) else 0.0
+        code = _PRECIP_CODES.get(str(interval.get("PrecipitationType") or "").lower())
+        if code is None:
+            code = PRECIP_RAIN if dbz >= PRECIP_MIN_DBZ else PRECIP_NONE
+        series.minute.append(minute if isinstance(minute, int) and minute >= 0 else offset)
+        series.dbz.append(dbz)
+        series.precipitation.append(code)
+    return series
+
+
+def extract_minutecast(html: str) -> dict[str, Any] | None:
+    """Return MinuteCast data from embedded payloads, or None when absent.
+
+    The result has parse_minutecast_html's schema plus the precipitation
+    window derived from the per-minute series ("series" holds the arrays).
+    """
+    if "Phrase" not in html and "Intervals" not in html:
+        return None
+
+    summary = None
+    series = None
+    current = None
+    for payload in iter_payloads(html):
+        if series is None:
+            for obj in find_objects(payload, _INTERVAL_KEYS):
+                if isinstance(obj["Intervals"], list) and obj["Intervals"]:
+                    series = _build_series(obj["Intervals"])
+                    if summary is None:
+                        summary = (obj.get("Summary") or {}).get("Phrase")
+                    break
+        if summary is None:
+            for obj in find_objects(payload, _SUMMARY_KEYS):
+                summary_obj = obj["Summary"]
+                if isinstance(summary_obj, dict) and summary_obj.get("Phrase"):
+                    summary = summary_obj["Phrase"]
+                    break
+        if current is None:
+            for obj in find_objects(payload, _CURRENT_KEYS):
+                current = obj
+                break
+        if summary is not None and series is not None and current is not None:
+            break
+
+    if summary is None and series is None and current is None:
+        return None
+
+    start_minute = end_minute = None
+    if series is not None:
+        start_minute, end_minute = series.precipitation_window()
+        _LOGGER.debug(
+            "extract_minutecast: %d minutes, precipitation %s-%s",
+            len(series), start_minute, end_minute,
+        )
+
+    observed = parse_iso_datetime(current.get("LocalObservationDateTime")) if current else None
+    temperature = round_display(metric_value(current, "Temperature")) if current else None
+    realfeel = round_display(metric_value(current, "RealFeelTemperature")) if current else None
+    return {
+        "summary": summary or MINUTECAST_NO_DATA,
+        "current_temperature": int(temperature) if temperature is not None else None,
+        "current_condition": current.get("WeatherText") if current else None,
+        "realfeel": int(realfeel) if realfeel is not None else None,
+        "current_time": observed.strftime("%H:%M") if observed else None,
+        "forecast_type": "minutecast",
+        "minutes_until_precipitation": start_minute,
+        "minutes_until_dry": end_minute,
+        "precipitation_start": series.at_minute(start_minute) if series else None,
+        "precipitation_end": series.at_minute(end_minute) if series else None,
+        "series": series,
+    }
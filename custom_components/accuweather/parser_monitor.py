@@ -0,0 +1,186 @@
+"""Parser health tracking for scraped AccuWeather pages.
+
+Every fetched page is checked for the class names / script markers the
+parsers anchor on. That gives per-page-type selector hit rates and a short
+structural fingerprint, so a site redesign is told apart from a network or
+bot-detection failure within a single refresh.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import logging
+from typing import Any
+
+from .const import (
+    MIN_STRUCTURAL_PAGE_SIZE,
+    PAGE_AIR,
+    PAGE_CURRENT,
+    PAGE_DAILY,
+    PAGE_HEALTH,
+    PAGE_HOURLY,
+    PAGE_MINUTECAST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Markers each parser depends on. The FIRST entry is the required anchor:
+# without it the parser cannot produce anything for that page type.
+PAGE_ANCHORS: dict[str, tuple[str, ...]] = {
+    PAGE_CURRENT: (
+        "current-weather-card",
+        "card-header",
+        "display-temp",
+        "phrase",
+        "current-weather-extra",
+        "current-weather-details",
+        "detail-item",
+    ),
+    PAGE_DAILY: (
+        "daily-wrapper",
+        "daily-forecast-card",
+        "half-day-card-content",
+        "precip",
+        "panel-item",
+    ),
+    PAGE_HOURLY: (
+        "accordion-item",
+        "hourly-card-subcontaint",
+        "real-feel__text",
+        "precip",
+        "hourly-content-container",
+    ),
+    PAGE_AIR: (
+        "air-quality-card",
+        "air-quality-pollutant",
+        "statement",
+    ),
+    PAGE_HEALTH: (
+        "indexListData",
+    ),
+    PAGE_MINUTECAST: (
+        "minute-cast",
+        "current-weather",
+        "Phrase",
+    ),
+}
+
+
+@dataclass
+class PageParseStats:
+    """Rolling parse statistics for one page type."""
+
+    pages: int = 0
+    parsed: int = 0
+    anchor_hits: dict[str, int] = field(default_factory=dict)
+    fingerprint: str | None = None
+    good_fingerprint: str | None = None
+    structure_changed: bool = False
+
+    def hit_rates(self) -> dict[str, float]:
+        """Return the fraction of pages on which each anchor was present."""
+        if not self.pages:
+            return {}
+        return {
+            anchor: round(hits / self.pages, 3)
+            for anchor, hits in self.anchor_hits.items()
+        }
+
+
+def page_fingerprint(page_type: str, html: str) -> tuple[str, dict[str, bool]]:
+    """Return (fingerprint, anchor presence) for a page.
+
+    The fingerprint only encodes which parser anchors exist, so it is stable
+    across content changes (new temperatures, ads) and changes on redesigns.
+    """
+    present = {anchor: anchor in html for anchor in PAGE_ANCHORS.get(page_type, ())}
+    signature = "|".join(f"{anchor}={int(hit)}" for anchor, hit in present.items())
+    digest = hashlib.sha1(signature.encode(), usedforsecurity=False).hexdigest()[:12]
+    return digest, present
+
+
+class ParserMonitor:
+    """Track selector hit rates and structural changes per page type."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics for every known page type."""
+        self._pages: dict[str, PageParseStats] = {
+            page_type: PageParseStats() for page_type in PAGE_ANCHORS
+        }
+
+    def record(self, page_type: str, html: str, parsed: bool) -> bool:
+        """Record one fetched page and whether the parser got data from it.
+
+        Returns True when the page is judged to have changed structure: the
+        parse produced nothing, the response looks like a full page, and
+        either the required anchor is gone or the fingerprint differs from
+        the last one that parsed successfully.
+        """
+        stats = self._pages.setdefault(page_type, PageParseStats())
+        fingerprint, present = page_fingerprint(page_type, html)
+
+        stats.pages += 1
+        stats.fingerprint = fingerprint
+        for anchor, hit in present.items():
+            stats.anchor_hits[anchor] = stats.anchor_hits.get(anchor, 0) + int(hit)
+
+        if parsed:
+            stats.parsed += 1
+            stats.good_fingerprint = fingerprint
+            if stats.structure_changed:
+                _LOGGER.info(
+                    "AccuWeather %s page parses again (fingerprint %s)",
+                    page_type, fingerprint,
+                )
+            stats.structure_changed = False
+            return False
+
+        if len(html) < MIN_STRUCTURAL_PAGE_SIZE:
+            # Error, consent or bot-challenge page: not a redesign.
+            _LOGGER.debug(
+                "ParserMonitor: %s page too small (%d chars) to judge structure",
+                page_type, len(html),
+            )
+            return stats.structure_changed
+
+        anchors = PAGE_ANCHORS.get(page_type, ())
+        required_missing = bool(anchors) and not present[anchors[0]]
+        fingerprint_moved = (
+            stats.good_fingerprint is not None
+            and stats.good_fingerprint != fingerprint
+        )
+        if required_missing or fingerprint_moved:
+            if not stats.structure_changed:
+                _LOGGER.warning(
+                    "AccuWeather %s page structure changed (fingerprint %s, "
+                    "last good %s, missing anchors: %s)",
+                    page_type,
+                    fingerprint,
+                    stats.good_fingerprint,
+                    ", ".join(a for a, hit in present.items() if not hit) or "none",
+                )
+            stats.structure_changed = True
+        return stats.structure_changed
+
+    def structure_changed(self, page_type: str) -> bool:
+        """Return True while a page type is known not to parse."""
+        stats = self._pages.get(page_type)
+        return stats.structure_changed if stats else False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of all page statistics."""
+        return {
+            page_type: {
+                "pages": stats.pages,
+                "parsed": stats.parsed,
+                "fingerprint": stats.fingerprint,
+                "good_fingerprint": stats.good_fingerprint,
+                "structure_changed": stats.structure_changed,
+                "anchor_hit_rates": stats.hit_rates(),
+            }
+            for page_type, stats in self._pages.items()
+        }
+
+
+# Page structure is the same for every location, so one monitor is shared.
+PARSER_MONITOR = ParserMonitor()
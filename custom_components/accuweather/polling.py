@@ -0,0 +1,307 @@
+"""Weather-adaptive update interval for the AccuWeather coordinator.
+
+Polls fast while precipitation is imminent or falling, and backs off
+while the forecast is dry: the interval drops to MIN_UPDATE_INTERVAL when
+MinuteCast or the hourly forecast expects precipitation within the next
+hour, returns to the configured interval when it is only possible later
+on, and grows by ADAPTIVE_BACKOFF_FACTOR per dry refresh up to
+MAX_UPDATE_INTERVAL otherwise.
+
+Outside wet spells the interval is then moved to land just after the next
+expected current-conditions observation (ObservationClock), so refreshes
+neither fetch the same observation twice nor wait most of an interval
+after a new one appears.
+
+Every refresh is also put on its location's phase (FLEET_PLANNER), so that
+locations sharing an interval or an observation schedule spread their
+requests over it instead of refreshing in one burst.
+"""
+from __future__ import annotations
+
+from collections import deque
+import hashlib
+import re
+from typing import Any
+
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ALIGNED_STAGGER_WINDOW,
+    MAX_OBSERVATION_CADENCE,
+    MAX_UPDATE_INTERVAL,
+    MIN_OBSERVATION_CADENCE,
+    MIN_UPDATE_INTERVAL,
+    OBSERVATION_MARGIN,
+    PRECIPITATION_HORIZON,
+    PRECIPITATION_PROBABILITY_THRESHOLD,
+)
+
+OUTLOOK_WET = "wet"  # precipitation falling or expected within the horizon
+OUTLOOK_UNSETTLED = "unsettled"  # possible within the next few hours
+OUTLOOK_DRY = "dry"
+
+# Hourly items checked for each outlook; the first item is the current hour
+_WET_HOURS = 2
+_UNSETTLED_HOURS = 4
+
+MINUTES_PER_DAY = 24 * 60
+OBSERVATION_HISTORY = 8  # observation steps kept for the cadence
+
+
+def _minutecast_wet(minutecast: dict[str, Any] | None) -> bool | None:
+    """Return whether MinuteCast expects precipitation within the horizon.
+
+    None when the page gave no minute series (e.g. the DOM fallback was used).
+    """
+    if not minutecast or "minutes_until_precipitation" not in minutecast:
+        return None
+    if minutecast.get("series") is None:
+        return None
+    minutes = minutecast["minutes_until_precipitation"]
+    return minutes is not None and minutes * 60 <= PRECIPITATION_HORIZON
+
+
+def _hourly_wet(hourly: list[dict[str, Any]], hours: int) -> bool:
+    """Return whether any of the next `hours` hourly items is likely wet."""
+    return any(
+        (item.get("precipitation_probability") or 0)
+        >= PRECIPITATION_PROBABILITY_THRESHOLD
+        for item in hourly[:hours]
+    )
+
+
+def precipitation_outlook(data: dict[str, Any]) -> str:
+    """Classify a refresh's data as OUTLOOK_WET, OUTLOOK_UNSETTLED or OUTLOOK_DRY."""
+    hourly = data.get("hourly_forecast") or []
+    if _minutecast_wet(data.get("minutecast")) or _hourly_wet(hourly, _WET_HOURS):
+        return OUTLOOK_WET
+    if _hourly_wet(hourly, _UNSETTLED_HOURS):
+        return OUTLOOK_UNSETTLED
+    return OUTLOOK_DRY
+
+
+def adaptive_interval(outlook: str, current: float, configured: float) -> float:
+    """Return the next update interval in seconds.
+
+    `current` is the interval in use and `configured` the entry's setting.
+    """
+    if outlook == OUTLOOK_WET:
+        return MIN_UPDATE_INTERVAL
+    if outlook == OUTLOOK_UNSETTLED:
+        return configured
+    return min(MAX_UPDATE_INTERVAL, max(configured, current * ADAPTIVE_BACKOFF_FACTOR))
+
+
+def observation_minute(text: str | None) -> int | None:
+    """Return the minute of the day of an observation time.
+
+    Accepts the current-weather page's "11:40", "11:40 SA" / "2:05 CH"
+    (Vietnamese AM/PM) and "2:05 PM".
+    """
+    match = re.match(r"\s*(\d{1,2}):(\d{2})\s*([A-Za-z]{2})?", text or "")
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    suffix = (match.group(3) or "").upper()
+    if suffix in ("CH", "PM") and hour < 12:
+        hour += 12
+    elif suffix in ("SA", "AM") and hour == 12:
+        hour = 0
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
+def _wrap(minutes: float) -> float:
+    """Map a difference of minutes of the day into (-720, 720]."""
+    minutes %= MINUTES_PER_DAY
+    return minutes - MINUTES_PER_DAY if minutes > MINUTES_PER_DAY / 2 else minutes
+
+
+class ObservationClock:
+    """Learns when a location publishes new current-conditions observations.
+
+    Observation times are wall-clock times of the location, without a
+    date or time zone. The clock learns:
+
+    - the cadence: the smallest step between successive distinct
+      observation times;
+    - the publish offset: minutes from an observation's clock time to the
+      UTC minute of the day it becomes available (time zone included).
+      Every fetch bounds it: the observation it returns was published by
+      then (upper bound), the one after it was not (lower bound).
+
+    Refreshes aim at the middle of the bounds, so they bisect towards the
+    actual publish time; a bound that contradicts the other one replaces
+    it, which follows a publisher that shifts its schedule.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing learned."""
+        self._minute: int | None = None
+        self._previous_fetch: float | None = None
+        self._steps: deque[int] = deque(maxlen=OBSERVATION_HISTORY)
+        self._reference: float | None = None
+        self._lower: float | None = None
+        self._upper: float | None = None
+        self.new_observations = 0
+        self.repeated_observations = 0
+
+    @property
+    def cadence(self) -> int | None:
+        """Return the learned minutes between observations."""
+        if len(self._steps) < 2:
+            return None
+        return min(self._steps)
+
+    @property
+    def publish_offset(self) -> float | None:
+        """Return the estimated publish offset in minutes."""
+        if self._lower is None or self._upper is None:
+            return self._upper if self._lower is None else self._lower
+        return (self._lower + self._upper) / 2
+
+    def _offset(self, minute: int, at: float) -> float:
+        """Return minutes from observation clock time `minute` to epoch `at`.
+
+        Kept within 12 hours of the first offset seen, so offsets compare
+        across midnight and whatever the location's time zone.
+        """
+        offset = _wrap(at / 60 - minute)
+        if self._reference is None:
+            self._reference = offset
+        return self._reference + _wrap(offset - self._reference)
+
+    def _lower_bound(self, offset: float) -> None:
+        if self._lower is None or offset > self._lower:
+            self._lower = offset
+            if self._upper is not None and self._upper < offset:
+                self._upper = None
+
+    def _upper_bound(self, offset: float) -> None:
+        if self._upper is None or offset < self._upper:
+            self._upper = offset
+            if self._lower is not None and self._lower > offset:
+                self._lower = None
+
+    def observe(self, text: str | None, now: float) -> None:
+        """Feed the observation time of a fetch made at epoch time `now`."""
+        minute = observation_minute(text)
+        previous_fetch, self._previous_fetch = self._previous_fetch, now
+        if minute is None:
+            return
+        if minute == self._minute:
+            self.repeated_observations += 1
+        else:
+            self.new_observations += 1
+            if self._minute is not None:
+                step = int(_wrap(minute - self._minute))
+                if MIN_OBSERVATION_CADENCE <= step <= MAX_OBSERVATION_CADENCE:
+                    self._steps.append(step)
+                    if previous_fetch is not None:
+                        # The previous fetch still returned the older observation
+                        self._lower_bound(self._offset(minute, previous_fetch))
+            self._minute = minute
+            self._upper_bound(self._offset(minute, now))
+        if (cadence := self.cadence) is not None:
+            self._lower_bound(self._offset(minute + cadence, now))
+
+    def align(self, now: float, interval: float, phase: float = 0.0) -> float | None:
+        """Return the delay nearest to `interval` that lands just after a publish.
+
+        Candidates are OBSERVATION_MARGIN seconds after each expected
+        publish, plus `phase` (0-1) of the stagger window so that locations
+        publishing together do not refresh together, within
+        [MIN_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL] from now. None until the
+        cadence is known.
+        """
+        cadence, offset = self.cadence, self.publish_offset
+        if cadence is None or offset is None or self._minute is None:
+            return None
+        step = cadence * 60
+        after = OBSERVATION_MARGIN + phase * min(ALIGNED_STAGGER_WINDOW, step / 2)
+        # Epoch time the current observation was (or will be) published
+        published = now - _wrap(now / 60 - self._minute - offset) * 60
+        candidates = []
+        publish = published + step
+        while (delay := publish + after - now) <= MAX_UPDATE_INTERVAL:
+            if delay >= MIN_UPDATE_INTERVAL:
+                candidates.append(delay)
+            publish += step
+        if not candidates:
+            return None
+        return min(candidates, key=lambda delay: abs(delay - interval))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return what has been learned, for diagnostics."""
+        offset = self.publish_offset
+        return {
+            "observation_minute": self._minute,
+            "cadence_min": self.cadence,
+            "publish_offset_min": round(offset, 1) if offset is not None else None,
+            "offset_bounds_min": [
+                round(bound, 1) if bound is not None else None
+                for bound in (self._lower, self._upper)
+            ],
+            "new_observations": self.new_observations,
+            "repeated_observations": self.repeated_observations,
+        }
+
+
+def stable_hash(location_key: str) -> float:
+    """Return a position in [0, 1) for a location key, the same in every run."""
+    digest = hashlib.blake2b(location_key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+class FleetPlanner:
+    """Assigns every configured location a phase in [0, 1) of its interval.
+
+    Locations are ordered by stable_hash and spaced evenly, so phases are
+    reproducible across restarts and stay evenly spread as locations are
+    added or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no locations."""
+        self._phases: dict[str, float] = {}
+
+    def add(self, location_key: str) -> None:
+        """Include a location and respace every phase."""
+        self._phases[location_key] = 0.0
+        self._respace()
+
+    def remove(self, location_key: str) -> None:
+        """Drop a location and respace the remaining phases."""
+        if self._phases.pop(location_key, None) is not None:
+            self._respace()
+
+    def _respace(self) -> None:
+        ordered = sorted(self._phases, key=lambda key: (stable_hash(key), key))
+        self._phases = {key: index / len(ordered) for index, key in enumerate(ordered)}
+
+    def phase(self, location_key: str) -> float:
+        """Return a location's phase; its own hash if it was never added."""
+        phase = self._phases.get(location_key)
+        return stable_hash(location_key) if phase is None else phase
+
+    def as_dict(self) -> dict[str, float]:
+        """Return every location's phase."""
+        return {key: round(phase, 4) for key, phase in self._phases.items()}
+
+
+def phase_delay(now: float, interval: float, phase: float) -> float:
+    """Return the delay nearest to `interval` that ends on `phase` of the interval.
+
+    Phases are taken against the epoch, so every location with the same
+    interval shares the grid. The delay is at least MIN_UPDATE_INTERVAL.
+    """
+    offset = phase * interval
+    cycles = round((now + interval - offset) / interval)
+    delay = cycles * interval + offset - now
+    while delay < min(MIN_UPDATE_INTERVAL, interval):
+        delay += interval
+    return delay
+
+
+# Shared by every config entry
+FLEET_PLANNER = FleetPlanner()
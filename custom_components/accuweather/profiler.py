@@ -0,0 +1,307 @@
+"""One-shot refresh profiling for the accuweather.profile_refresh service.
+
+Nothing here is imported or hooked until the service is called: the
+profilers are started around a single coordinator refresh and stopped
+right after it. Both profilers only see time spent running on the event
+loop thread; time spent waiting on the network is in the refresh's
+FetchMetrics timeline instead.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import AccuWeatherDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_SAMPLING = "sampling"
+# Seconds between stack samples: the interpreter's default switch interval,
+# which the sampler cannot beat while the loop thread holds the GIL (and
+# which is process-wide, so it is left alone)
+SAMPLING_INTERVAL = 0.005
+
+# Functions whose time is broken out in the summary
+WATCHED_FUNCTIONS = (
+    "_fetch_with_retry",
+    "parse_weather_html",
+    "parse_daily_html",
+    "parse_hourly_html",
+    "parse_air_html",
+    "parse_health_html",
+    "parse_minutecast_html",
+    "async_write_ha_state",
+)
+
+# The event loop waiting for I/O; left out of the top-N lists
+IDLE_FUNCTIONS = frozenset({"select", "poll", "<method 'poll' of 'select.epoll' objects>"})
+
+# cProfile and sys.setprofile are per-interpreter; one profile at a time
+_PROFILE_LOCK = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+class _StackSampler:
+    """Sample one thread's Python stack at a fixed interval from a helper thread."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLING_INTERVAL) -> None:
+        """Initialize the sampler for `thread_id`."""
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="accuweather_profiler", daemon=True
+        )
+        # "outer;...;inner" collapsed stack -> samples, and -> seconds (a
+        # sample stands for the time since the previous one, as waking up
+        # can take longer than the interval)
+        self.stacks: Counter[str] = Counter()
+        self.stack_seconds: Counter[str] = Counter()
+        self.samples = 0
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self._interval):
+            now = time.perf_counter()
+            frame = sys._current_frames().get(self._thread_id)  # noqa: SLF001
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                )
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.samples += 1
+            self.stacks[key] += 1
+            self.stack_seconds[key] += now - last
+            last = now
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the helper thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def function_seconds(self, name: str) -> float:
+        """Return sampled on-loop time of stacks containing function `name`."""
+        needle = f"{name} ("
+        return sum(
+            seconds for stack, seconds in self.stack_seconds.items()
+            if any(frame.startswith(needle) for frame in stack.split(";"))
+        )
+
+    def top(self, top_n: int) -> list[tuple[str, float]]:
+        """Return the innermost frames with the most samples, in seconds."""
+        leaves: Counter[str] = Counter()
+        for stack, seconds in self.stack_seconds.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            if leaf.split(" (", 1)[0] not in IDLE_FUNCTIONS:
+                leaves[leaf] += seconds
+        return leaves.most_common(top_n)
+
+
+@dataclass
+class ProfileResult:
+    """What one profiled refresh produced."""
+
+    profiler: str
+    location_key: str
+    wall_s: float
+    success: bool
+    watched_s: dict[str, float] = field(default_factory=dict)
+    top: list[str] = field(default_factory=list)
+    memory: dict[str, Any] = field(default_factory=dict)
+    profile_file: str | None = None
+    summary_file: str | None = None
+
+    def summary_text(self, timeline: list[dict[str, Any]]) -> str:
+        """Return the human-readable summary written next to the profile."""
+        lines = [
+            f"AccuWeather refresh profile ({self.profiler}) for {self.location_key}",
+            f"Wall time: {self.wall_s:.3f} s, refresh "
+            f"{'succeeded' if self.success else 'failed'}",
+            "",
+            "On-loop time in watched functions (s):",
+            *(f"  {name:28} {seconds:8.4f}" for name, seconds in self.watched_s.items()),
+            "",
+            "Top entries:",
+            *(f"  {entry}" for entry in self.top),
+        ]
+        if self.memory:
+            lines += [
+                "",
+                f"tracemalloc: peak {self.memory['peak_kib']} KiB, "
+                f"retained {self.memory['retained_kib']} KiB",
+                *(f"  {site}" for site in self.memory["top_sites"]),
+            ]
+        lines += ["", "Refresh timeline (ms since start):"]
+        lines += [
+            f"  {event['t_ms']:9.1f}  {event['page']:10} {event['event']:10} "
+            + " ".join(
+                f"{key}={value}" for key, value in event.items()
+                if key not in ("t_ms", "page", "event")
+            )
+            for event in timeline
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _cprofile_breakdown(profile: Any, top_n: int) -> tuple[dict[str, float], list[str]]:
+    """Return watched-function cumulative times and the top-N by self time."""
+    import pstats
+
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    watched = dict.fromkeys(WATCHED_FUNCTIONS, 0.0)
+    busy = []
+    for (filename, lineno, func_name), (_, calls, own, cumulative, _) in stats.items():
+        if func_name in watched:
+            watched[func_name] += cumulative
+        if func_name not in IDLE_FUNCTIONS:
+            busy.append((own, cumulative, calls, func_name, filename, lineno))
+    busy.sort(reverse=True)
+    top = [
+        f"{own:8.4f}s self {cumulative:8.4f}s cum {calls:6d} calls  "
+        f"{func_name} ({os.path.basename(filename)}:{lineno})"
+        for own, cumulative, calls, func_name, filename, lineno in busy[:top_n]
+    ]
+    return watched, top
+
+
+def _memory_breakdown(before: Any, after: Any, peak: int, top_n: int) -> dict[str, Any]:
+    """Return peak/retained memory and the top allocation sites of a refresh."""
+    import tracemalloc
+
+    # Leave out the sampler's own stack strings and tracemalloc itself
+    own = [
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    ]
+    diff = after.filter_traces(own).compare_to(before.filter_traces(own), "lineno")
+    return {
+        "peak_kib": round(peak / 1024, 1),
+        "retained_kib": round(sum(stat.size_diff for stat in diff) / 1024, 1),
+        "top_sites": [str(stat) for stat in diff[:top_n]],
+    }
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant,
+    coordinator: AccuWeatherDataUpdateCoordinator,
+    profiler: str = PROFILER_CPROFILE,
+    top_n: int = 25,
+    trace_memory: bool = True,
+) -> ProfileResult:
+    """Run one refresh of `coordinator` under a profiler and write the results.
+
+    Writes accuweather_profile_<key>_<timestamp>.prof (cProfile stats) or
+    .collapsed (sampled stacks, flamegraph.pl / speedscope format) and a
+    matching _summary.txt to the config directory.
+    """
+    if not _PROFILE_LOCK.acquire(blocking=False):
+        raise ProfilerBusyError("Another AccuWeather profile is already running")
+    try:
+        return await _async_profile_refresh(
+            hass, coordinator, profiler, top_n, trace_memory
+        )
+    finally:
+        _PROFILE_LOCK.release()
+
+
+async def _async_profile_refresh(
+    hass: HomeAssistant,
+    coordinator: AccuWeatherDataUpdateCoordinator,
+    profiler: str,
+    top_n: int,
+    trace_memory: bool,
+) -> ProfileResult:
+    import tracemalloc
+
+    memory_was_traced = tracemalloc.is_tracing()
+    if trace_memory and not memory_was_traced:
+        tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot() if trace_memory else None
+    if trace_memory:
+        tracemalloc.reset_peak()
+
+    if profiler == PROFILER_SAMPLING:
+        sampler = _StackSampler(threading.get_ident())
+        sampler.start()
+    else:
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+
+    started = time.perf_counter()
+    try:
+        await coordinator.async_refresh()
+    finally:
+        wall_s = time.perf_counter() - started
+        if profiler == PROFILER_SAMPLING:
+            sampler.stop()
+        else:
+            profile.disable()
+
+    memory: dict[str, Any] = {}
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot_after = tracemalloc.take_snapshot()
+        if not memory_was_traced:
+            tracemalloc.stop()
+        memory = await hass.async_add_executor_job(
+            _memory_breakdown, snapshot_before, snapshot_after, peak, top_n
+        )
+
+    result = ProfileResult(
+        profiler=profiler,
+        location_key=coordinator.location_key,
+        wall_s=wall_s,
+        success=coordinator.last_update_success,
+        memory=memory,
+    )
+    stem = hass.config.path(
+        f"accuweather_profile_{coordinator.location_key}_{time.strftime('%Y%m%d_%H%M%S')}"
+    )
+    timeline = coordinator.fetch_metrics.last_timeline
+
+    def _write() -> None:
+        if profiler == PROFILER_SAMPLING:
+            result.watched_s = {
+                name: round(sampler.function_seconds(name), 4) for name in WATCHED_FUNCTIONS
+            }
+            result.top = [f"{seconds:8.4f}s  {frame}" for frame, seconds in sampler.top(top_n)]
+            result.profile_file = f"{stem}.collapsed"
+            with open(result.profile_file, "w", encoding="utf-8") as handle:
+                for stack, count in sampler.stacks.most_common():
+                    handle.write(f"{stack} {count}\n")
+        else:
+            watched, result.top = _cprofile_breakdown(profile, top_n)
+            result.watched_s = {name: round(value, 4) for name, value in watched.items()}
+            result.profile_file = f"{stem}.prof"
+            profile.dump_stats(result.profile_file)
+        result.summary_file = f"{stem}_summary.txt"
+        with open(result.summary_file, "w", encoding="utf-8") as handle:
+            handle.write(result.summary_text(timeline))
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info(
+        "AccuWeather %s: profiled refresh in %.2f s, written to %s",
+        coordinator.location_key, wall_s, result.summary_file,
+    )
+    return result
@@ -0,0 +1,208 @@
+"""Prometheus text-format metrics for the AccuWeather integration.
+
+Served at /api/accuweather/metrics (Home Assistant authentication, e.g. a
+long-lived access token as bearer token). Rendering reads the FetchMetrics
+counters each coordinator already keeps; nothing extra is collected.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .fetch_metrics import CACHE_STATS, RollingHistogram
+from .load_monitor import LOAD_MONITOR
+
+if TYPE_CHECKING:
+    from .coordinator import AccuWeatherDataUpdateCoordinator
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+class _Writer:
+    """Collects samples grouped by metric family, in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> list[str]:
+        if name not in self._families:
+            self._families[name] = (kind, help_text, [])
+        return self._families[name][2]
+
+    def sample(
+        self, name: str, kind: str, help_text: str, value: float, **labels: str
+    ) -> None:
+        """Add one counter or gauge sample."""
+        self._family(name, kind, help_text).append(f"{name}{_labels(**labels)} {value:g}")
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        histogram: RollingHistogram,
+        scale: float,
+        **labels: str,
+    ) -> None:
+        """Add a histogram whose samples are multiplied by `scale` (e.g. ms -> s)."""
+        lines = self._family(name, "histogram", help_text)
+        for bound, count in histogram.cumulative_buckets():
+            le = _format_bound(bound * scale if bound != float("inf") else bound)
+            lines.append(f"{name}_bucket{_labels(**labels, le=le)} {count}")
+        lines.append(f"{name}_sum{_labels(**labels)} {histogram.total * scale:g}")
+        lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+    def render(self) -> str:
+        """Return the exposition text."""
+        out = []
+        for name, (kind, help_text, lines) in self._families.items():
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+        return "\n".join(out) + "\n"
+
+
+def render_metrics(coordinators: Iterable[AccuWeatherDataUpdateCoordinator]) -> str:
+    """Render every coordinator's FetchMetrics plus the shared cache stats."""
+    writer = _Writer()
+    for coordinator in coordinators:
+        metrics = coordinator.fetch_metrics
+        location = coordinator.location_key
+        writer.sample(
+            "accuweather_refreshes_total", "counter", "Coordinator refreshes.",
+            metrics.refreshes, location=location,
+        )
+        writer.histogram(
+            "accuweather_refresh_duration_seconds", "Coordinator refresh wall time.",
+            metrics.refresh_s, 1, location=location,
+        )
+        if coordinator.update_interval is not None:
+            writer.sample(
+                "accuweather_update_interval_seconds", "gauge",
+                "Delay from the last refresh to the next one.",
+                coordinator.update_interval.total_seconds(), location=location,
+            )
+        clock = coordinator.observation_clock
+        for result, count in (
+            ("new", clock.new_observations), ("repeated", clock.repeated_observations)
+        ):
+            writer.sample(
+                "accuweather_observation_fetches_total", "counter",
+                "Current-conditions fetches by whether they returned a new observation.",
+                count, location=location, result=result,
+            )
+        writer.sample(
+            "accuweather_skipped_state_writes_total", "counter",
+            "Entity updates skipped because a refresh returned unchanged data.",
+            metrics.skipped_state_writes, location=location,
+        )
+        writer.sample(
+            "accuweather_redirects_total", "counter",
+            "Page fetches that were redirected.",
+            coordinator.canonical_urls.redirects, location=location,
+        )
+        writer.sample(
+            "accuweather_shed_refreshes_total", "counter",
+            "Refreshes that skipped low-priority pages because the host was busy.",
+            metrics.shed_refreshes, location=location,
+        )
+        writer.sample(
+            "accuweather_outside_refresh_requests_total", "counter",
+            "Requests made between refreshes (forecast reads, services).",
+            metrics.outside_refresh.requests, location=location,
+        )
+        for endpoint_name, endpoint in sorted(metrics.endpoints.items()):
+            labels = {"location": location, "endpoint": endpoint_name}
+            for status, count in sorted(
+                endpoint.statuses.items(), key=lambda item: str(item[0])
+            ):
+                writer.sample(
+                    "accuweather_requests_total", "counter",
+                    "HTTP requests by response status (error: no response).",
+                    count, **labels, status=str(status),
+                )
+            writer.sample(
+                "accuweather_retries_total", "counter", "Retried requests.",
+                endpoint.retries, **labels,
+            )
+            writer.sample(
+                "accuweather_shed_pages_total", "counter",
+                "Page fetches skipped because the host was busy.",
+                endpoint.shed, **labels,
+            )
+            writer.sample(
+                "accuweather_response_bytes_total", "counter",
+                "Response body bytes read.", endpoint.bytes, **labels,
+            )
+            writer.histogram(
+                "accuweather_fetch_ttfb_seconds",
+                "Time from request start to response headers.",
+                endpoint.ttfb_ms, 0.001, **labels,
+            )
+            writer.histogram(
+                "accuweather_fetch_download_seconds", "Time to read the response body.",
+                endpoint.download_ms, 0.001, **labels,
+            )
+            writer.histogram(
+                "accuweather_parse_seconds", "Time to parse a page.",
+                endpoint.parse_ms, 0.001, **labels,
+            )
+    lag_p90 = LOAD_MONITOR.lag_ms.percentile(90)
+    if lag_p90 is not None:
+        writer.sample(
+            "accuweather_event_loop_lag_seconds", "gauge",
+            "90th percentile event loop lag over the load monitor window.",
+            lag_p90 / 1000,
+        )
+    if (cpu := LOAD_MONITOR.cpu_ratio) is not None:
+        writer.sample(
+            "accuweather_process_cpu_ratio", "gauge",
+            "Process CPU use over the load monitor window (1 = one core).", cpu,
+        )
+    for cache, stats in sorted(CACHE_STATS.items()):
+        writer.sample(
+            "accuweather_cache_hits_total", "counter", "Cache hits.",
+            stats.hits, cache=cache,
+        )
+        writer.sample(
+            "accuweather_cache_misses_total", "counter", "Cache misses.",
+            stats.misses, cache=cache,
+        )
+    return writer.render()
+
+
+class AccuWeatherMetricsView(HomeAssistantView):
+    """Serve the integration's metrics in Prometheus text format."""
+
+    url = "/api/accuweather/metrics"
+    name = "api:accuweather:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the current metrics."""
+        body = render_metrics(self.hass.data.get(DOMAIN, {}).values())
+        return web.Response(body=body.encode(), headers={"Content-Type": CONTENT_TYPE})
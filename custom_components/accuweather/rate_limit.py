@@ -0,0 +1,34 @@
+"""Concurrency and spacing limits for requests made in parallel."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from .const import EXTRA_PAGE_CONCURRENCY, EXTRA_PAGE_SPACING
+
+
+class RateLimiter:
+    """At most `concurrency` holders at once, entering at least `spacing` s apart."""
+
+    def __init__(self, concurrency: int, spacing: float) -> None:
+        """Initialize with no holders."""
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._spacing = spacing
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._spacing
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+# Shared by every location: pages fetched concurrently (the further hourly
+# and daily pages of a longer horizon)
+PAGE_LIMITER = RateLimiter(EXTRA_PAGE_CONCURRENCY, EXTRA_PAGE_SPACING)
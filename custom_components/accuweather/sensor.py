@@ -1,6 +1,7 @@
 """Sensor platform for AccuWeather integration."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
 import re
 from typing import Any
@@ -14,16 +15,24 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
     UnitOfLength,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN, INTERPOLATION_SENSOR_RESOLUTION, PAGE_HOURLY, SIGNAL_REFRESH_FINISHED,
+)
 from .coordinator import AccuWeatherDataUpdateCoordinator
 from .device import get_device_info
 
@@ -172,6 +181,98 @@ SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+# Fetch/parse cost of the last refresh, from coordinator.fetch_metrics
+DIAGNOSTIC_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="refresh_requests",
+        name="Requests per Refresh",
+        icon="mdi:web",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="refresh_bytes",
+        name="Data per Refresh",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="refresh_parse_time",
+        name="Parse Time",
+        icon="mdi:code-tags",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="shed_refreshes",
+        name="Load-Shed Refreshes",
+        icon="mdi:speedometer-slow",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+
+# Hourly forecast values interpolated to the current time (see
+# interpolation.py). Disabled by default: while enabled they keep the hourly
+# forecast fetched every refresh.
+INTERPOLATED_SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="interpolated_temperature",
+        name="Forecast Temperature Now",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="interpolated_apparent_temperature",
+        name="Forecast RealFeel Now",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="interpolated_precipitation_probability",
+        name="Forecast Precipitation Probability Now",
+        icon="mdi:weather-rainy",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="interpolated_humidity",
+        name="Forecast Humidity Now",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        entity_registry_enabled_default=False,
+    ),
+    SensorEntityDescription(
+        key="interpolated_wind_speed",
+        name="Forecast Wind Speed Now",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        entity_registry_enabled_default=False,
+    ),
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -186,6 +287,10 @@ async def async_setup_entry(
     # Add static sensor types
     for description in SENSOR_TYPES:
         entities.append(AccuWeatherSensorEntity(coordinator, description))
+    for description in DIAGNOSTIC_SENSOR_TYPES:
+        entities.append(AccuWeatherDiagnosticSensorEntity(coordinator, description))
+    for description in INTERPOLATED_SENSOR_TYPES:
+        entities.append(AccuWeatherInterpolatedSensorEntity(coordinator, description))
     
     # Add dynamic health activity sensors
     health_count = 0
@@ -398,6 +503,10 @@ class AccuWeatherSensorEntity(CoordinatorEntity[AccuWeatherDataUpdateCoordinator
                     "realfeel": minutecast.get("realfeel"),
                     "current_time": minutecast.get("current_time"),
                     "forecast_type": minutecast.get("forecast_type"),
+                    "minutes_until_precipitation": minutecast.get("minutes_until_precipitation"),
+                    "minutes_until_dry": minutecast.get("minutes_until_dry"),
+                    "precipitation_start": minutecast.get("precipitation_start"),
+                    "precipitation_end": minutecast.get("precipitation_end"),
                 })
         
         return attrs
@@ -462,3 +571,163 @@ class AccuWeatherHealthSensorEntity(CoordinatorEntity[AccuWeatherDataUpdateCoord
                     }
         
         return {"location_key": self.coordinator.location_key}
+
+
+class AccuWeatherDiagnosticSensorEntity(SensorEntity):
+    """Fetch and parse cost of the coordinator's last refresh.
+
+    Not a coordinator listener: the coordinator skips its listeners when a
+    refresh returns unchanged data, but these values change every refresh.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        coordinator: AccuWeatherDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_name = f"AccuWeather {coordinator.location_name} {description.name}"
+        self._attr_unique_id = f"accuweather_{coordinator.location_key}_{description.key}"
+        self._attr_device_info = get_device_info(coordinator.location_key, coordinator.location_name)
+
+    async def async_added_to_hass(self) -> None:
+        """Update after every refresh."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_REFRESH_FINISHED.format(self.coordinator.location_key),
+                self._handle_refresh_finished,
+            )
+        )
+
+    @callback
+    def _handle_refresh_finished(self) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Stay available when a refresh fails; that is when these matter."""
+        return self.coordinator.fetch_metrics.refreshes > 0
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the value for the last refresh."""
+        last = self.coordinator.fetch_metrics.last_refresh
+        key = self.entity_description.key
+        if key == "refresh_duration":
+            return round(last.duration_s, 2)
+        if key == "refresh_requests":
+            return last.requests
+        if key == "refresh_bytes":
+            return round(last.bytes / 1000, 1)
+        if key == "refresh_parse_time":
+            return round(last.parse_ms, 1)
+        if key == "shed_refreshes":
+            return self.coordinator.fetch_metrics.shed_refreshes
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return rolling percentiles and the per-endpoint breakdown."""
+        metrics = self.coordinator.fetch_metrics
+        key = self.entity_description.key
+        if key == "refresh_duration":
+            attrs: dict[str, Any] = {"refreshes": metrics.refreshes}
+            for stat, value in metrics.refresh_s.as_dict().items():
+                if stat != "count":
+                    attrs[f"{stat}_s"] = value
+            for page_type, endpoint in metrics.endpoints.items():
+                attrs[f"{page_type}_ttfb_p50_ms"] = endpoint.ttfb_ms.as_dict().get("p50")
+                attrs[f"{page_type}_download_p50_ms"] = endpoint.download_ms.as_dict().get("p50")
+            return attrs
+        if key == "refresh_requests":
+            return {
+                f"{page_type}_retries": endpoint.retries
+                for page_type, endpoint in metrics.endpoints.items()
+            }
+        if key == "refresh_parse_time":
+            return {
+                f"{page_type}_parse_p50_ms": endpoint.parse_ms.as_dict().get("p50")
+                for page_type, endpoint in metrics.endpoints.items()
+            }
+        if key == "shed_refreshes":
+            return {
+                "last_shed": metrics.last_refresh.shed,
+                "last_reason": metrics.last_refresh.shed_reason,
+                **{
+                    f"{page_type}_shed": endpoint.shed
+                    for page_type, endpoint in metrics.endpoints.items()
+                    if endpoint.shed
+                },
+            }
+        return {}
+
+
+class AccuWeatherInterpolatedSensorEntity(
+    CoordinatorEntity[AccuWeatherDataUpdateCoordinator], SensorEntity
+):
+    """An hourly forecast field interpolated to the current time.
+
+    Reads the grid the coordinator's HourlySeries computes once per hourly
+    forecast change, and moves to the next grid point on a timer.
+    """
+
+    def __init__(
+        self,
+        coordinator: AccuWeatherDataUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._field = description.key.removeprefix("interpolated_")
+        self._attr_name = f"AccuWeather {coordinator.location_name} {description.name}"
+        self._attr_unique_id = f"accuweather_{coordinator.location_key}_{description.key}"
+        self._attr_device_info = get_device_info(coordinator.location_key, coordinator.location_name)
+
+    async def async_added_to_hass(self) -> None:
+        """Keep the hourly forecast fetched and follow the grid."""
+        await super().async_added_to_hass()
+        # Only enabled sensors get here, so NumPy is not loaded for disabled ones
+        await self.coordinator.async_load_interpolation()
+        self.async_on_remove(self.coordinator.async_add_forecast_listener(PAGE_HOURLY))
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._handle_grid_step,
+                timedelta(seconds=INTERPOLATION_SENSOR_RESOLUTION),
+            )
+        )
+        if self.coordinator.hourly_series is None:
+            # Not fetched by the last refresh: load it now rather than next refresh
+            self.hass.async_create_task(self._async_load_hourly())
+
+    async def _async_load_hourly(self) -> None:
+        await self.coordinator.async_forecast(PAGE_HOURLY)
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_grid_step(self, _now: datetime) -> None:
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the forecast value for the current grid point."""
+        series = self.coordinator.hourly_series
+        if series is None:
+            return None
+        return series.grid_value(self._field, dt_util.now())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the span of the hourly forecast interpolated from."""
+        series = self.coordinator.hourly_series
+        attrs: dict[str, Any] = {"location_key": self.coordinator.location_key}
+        if series is not None:
+            attrs["forecast_start"] = series.start.isoformat()
+            attrs["forecast_end"] = series.end.isoformat()
+        return attrs
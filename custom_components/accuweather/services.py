@@ -0,0 +1,204 @@
+"""Services for the AccuWeather integration."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DRY_RUN,
+    ATTR_END,
+    ATTR_FIELDS,
+    ATTR_LOCATIONS,
+    ATTR_PROFILER,
+    ATTR_RESOLUTION,
+    ATTR_START,
+    ATTR_TIMES,
+    ATTR_TOP_N,
+    ATTR_TRACE_MEMORY,
+    BULK_IMPORT_MAX_ITEMS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    INTERPOLATED_FIELDS,
+    INTERPOLATION_DEFAULT_RESOLUTION,
+    INTERPOLATION_MAX_POINTS,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    PAGE_HOURLY,
+    SERVICE_IMPORT_LOCATIONS,
+    SERVICE_INTERPOLATE_FORECAST,
+    SERVICE_PROFILE_REFRESH,
+)
+from .coordinator import AccuWeatherDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_PROFILER, default="cprofile"): vol.In(
+            ["cprofile", "sampling"]
+        ),
+        vol.Optional(ATTR_TOP_N, default=25): vol.All(
+            vol.Coerce(int), vol.Range(min=5, max=200)
+        ),
+        vol.Optional(ATTR_TRACE_MEMORY, default=True): cv.boolean,
+    }
+)
+
+IMPORT_LOCATIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_LOCATIONS): vol.All(
+            cv.ensure_list, [cv.string], vol.Length(min=1, max=BULK_IMPORT_MAX_ITEMS)
+        ),
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)
+        ),
+        vol.Optional(CONF_ADAPTIVE_POLLING, default=DEFAULT_ADAPTIVE_POLLING): cv.boolean,
+        vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+    }
+)
+
+INTERPOLATE_FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Exclusive(ATTR_TIMES, "when"): vol.All(
+            cv.ensure_list, [cv.datetime], vol.Length(min=1, max=INTERPOLATION_MAX_POINTS)
+        ),
+        vol.Exclusive(ATTR_START, "when"): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_RESOLUTION, default=INTERPOLATION_DEFAULT_RESOLUTION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=180)
+        ),
+        vol.Optional(ATTR_FIELDS): vol.All(
+            cv.ensure_list, [vol.In(list(INTERPOLATED_FIELDS))]
+        ),
+    }
+)
+
+
+def _as_aware(value: datetime) -> datetime:
+    """Return a service datetime, taking one without a time zone as local time."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return value
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str) -> AccuWeatherDataUpdateCoordinator:
+    """Return the coordinator of a loaded AccuWeather config entry."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if coordinator is None:
+        raise HomeAssistantError(f"AccuWeather entry {entry_id} is not loaded")
+    return coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services (once per Home Assistant instance)."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        return
+
+    async def async_profile_refresh_service(call: ServiceCall) -> ServiceResponse:
+        """Profile one refresh of an entry and return where the results went."""
+        # Imported here so profiling code costs nothing until it is used
+        from .profiler import ProfilerBusyError, async_profile_refresh
+
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        try:
+            result = await async_profile_refresh(
+                hass,
+                coordinator,
+                profiler=call.data[ATTR_PROFILER],
+                top_n=call.data[ATTR_TOP_N],
+                trace_memory=call.data[ATTR_TRACE_MEMORY],
+            )
+        except ProfilerBusyError as err:
+            raise HomeAssistantError(str(err)) from err
+        return asdict(result)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh_service,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_import_locations_service(call: ServiceCall) -> ServiceResponse:
+        """Set up many locations at once and report what happened to each."""
+        from .bulk_import import async_import_locations
+
+        report = await async_import_locations(
+            hass,
+            call.data[ATTR_LOCATIONS],
+            update_interval=call.data[CONF_UPDATE_INTERVAL],
+            adaptive_polling=call.data[CONF_ADAPTIVE_POLLING],
+            dry_run=call.data[ATTR_DRY_RUN],
+        )
+        _LOGGER.info("AccuWeather bulk import: %s", report.counts)
+        return asdict(report)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_LOCATIONS,
+        async_import_locations_service,
+        schema=IMPORT_LOCATIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_interpolate_forecast_service(call: ServiceCall) -> ServiceResponse:
+        """Return hourly forecast fields interpolated to the requested times."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        await coordinator.async_load_interpolation()
+        await coordinator.async_forecast(PAGE_HOURLY)
+        series = coordinator.hourly_series
+        if series is None:
+            raise HomeAssistantError("No hourly forecast to interpolate")
+
+        if ATTR_TIMES in call.data:
+            timestamps = series.timestamps(
+                [_as_aware(value) for value in call.data[ATTR_TIMES]]
+            )
+        else:
+            start = _as_aware(call.data.get(ATTR_START) or dt_util.now())
+            end = _as_aware(call.data[ATTR_END]) if ATTR_END in call.data else series.end
+            resolution = timedelta(minutes=call.data[ATTR_RESOLUTION])
+            if end < start:
+                raise HomeAssistantError("end is before start")
+            if (end - start) / resolution >= INTERPOLATION_MAX_POINTS:
+                raise HomeAssistantError(
+                    f"More than {INTERPOLATION_MAX_POINTS} points; use a coarser resolution"
+                )
+            timestamps = series.sample(start, end, resolution)
+
+        values = series.at(timestamps, call.data.get(ATTR_FIELDS))
+        return {
+            "forecast_start": series.start.isoformat(),
+            "forecast_end": series.end.isoformat(),
+            "forecast": series.as_rows(timestamps, values),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INTERPOLATE_FORECAST,
+        async_interpolate_forecast_service,
+        schema=INTERPOLATE_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -2,16 +2,41 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import codecs
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
 import re
+import time
 import unicodedata
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+import zlib
 
 import aiohttp
-from bs4 import BeautifulSoup
 
-from .const import AUTOCOMPLETE_URL, BASE_URL, CONDITION_MAP, CONDITION_MAP_VI
+try:
+    import brotli
+except ImportError:  # optional, as in aiohttp; br is then not requested
+    brotli = None
+
+from .const import (
+    AUTOCOMPLETE_TIMEOUT, AUTOCOMPLETE_URL, CONDITION_MAP, CONDITION_MAP_VI,
+    PAGE_AIR, PAGE_CURRENT, PAGE_DAILY, PAGE_HEALTH, PAGE_HOURLY, PAGE_MINUTECAST,
+)
+from . import css_selectors as sel
+from .canonical_urls import CanonicalUrls, default_url
+from .embedded import (
+    CURRENT_NEEDLE, DAILY_NEEDLE, HOURLY_NEEDLE,
+    extract_current, extract_daily, extract_hourly, iter_assigned_json,
+)
+from .fetch_metrics import CACHE_STATS, FetchMetrics
+from .minutecast import MINUTECAST_NO_DATA, extract_minutecast
+from .parser_monitor import PARSER_MONITOR
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +50,40 @@ MAX_RETRY_DELAY = 30.0     # seconds (cap for exponential backoff)
 CONNECT_TIMEOUT = 15
 READ_TIMEOUT = 20
 
+# Streaming reads: pages are read in chunks and the response is closed as
+# soon as the page type's end marker arrives. The markup the DOM parsers use
+# sits above the footer; below it are only footer links, ads and trackers.
+# Health and MinuteCast read the whole body because their data lives in
+# scripts near the end of the page.
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes
+# Bodies are read undecompressed (auto_decompress=False) so byte counts are
+# what crossed the wire; _read_body decompresses them itself. deflate is not
+# requested: servers send it both zlib-wrapped and raw.
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+# After the end marker, a rest of the body up to this many wire bytes is
+# read and discarded so the connection is kept alive; a longer (or unknown)
+# rest closes the connection instead (see benchmarks/bench_stream.py).
+STREAM_DRAIN_MAX_BYTES = 64 * 1024
+PAGE_END_MARKERS: dict[str, str] = {
+    PAGE_CURRENT: "<footer",
+    PAGE_DAILY: "<footer",
+    PAGE_HOURLY: "<footer",
+    PAGE_AIR: "<footer",
+}
+# Embedded payloads (see embedded.py) may follow the footer, so on these
+# pages reading goes on past the end marker until the script holding the
+# needle has closed. A page type whose full body had no needle stops at the
+# marker again, and is read in full once more every PAYLOAD_RECHECK_INTERVAL.
+PAGE_PAYLOAD_NEEDLES: dict[str, str] = {
+    PAGE_CURRENT: CURRENT_NEEDLE,
+    PAGE_DAILY: DAILY_NEEDLE,
+    PAGE_HOURLY: HOURLY_NEEDLE,
+}
+PAYLOAD_RECHECK_INTERVAL = 3600  # seconds
+_SCRIPT_END = "</script"
+# Page type -> monotonic time a full body was read without its needle
+_payload_missing: dict[str, float] = {}
+
 
 def slugify(text: str) -> str:
     """Convert Vietnamese location name to URL slug.
@@ -43,6 +102,56 @@ def slugify(text: str) -> str:
     return slug
 
 
+@dataclass
+class StreamStats:
+    """Body bytes read per page type, to measure what early termination saves."""
+
+    fetches: int = 0
+    early_stops: int = 0
+    # Wire (possibly compressed) bytes read up to the end marker or the end
+    bytes_read: int = 0
+    # The same bytes after decompression
+    bytes_decoded: int = 0
+    # Rest of early-stopped bodies read only to keep the connection alive
+    bytes_drained: int = 0
+    # Rest of early-stopped bodies never downloaded; only known when the
+    # server sends a Content-Length
+    bytes_skipped: int = 0
+    # Reads that went on past the end marker to an embedded payload
+    read_past_marker: int = 0
+
+
+STREAM_STATS: defaultdict[str, StreamStats] = defaultdict(StreamStats)
+
+HOURLY_PAGE_CACHE = "hourly_page"
+
+# MinuteCast fallbacks over the raw HTML; tags may sit between value and unit.
+# Only needed when the page lacks the embedded data, so they are left to
+# re's own cache to compile on first use rather than at import.
+_MINUTECAST_PHRASE_PATTERN = r'\\&quot;Phrase\\&quot;:\\&quot;([^\\]+)\\&quot;'
+_MINUTECAST_TEMP_PATTERN = r'>\s*(\d+)°(?:\s|<[^>]*>)*C\b'
+_MINUTECAST_REALFEEL_PATTERN = r'RealFeel®?(?:\s|<[^>]*>)*(\d+)°'
+_MINUTECAST_TIME_PATTERN = r'>\s*(\d{1,2}:\d{2})\s*<'
+
+
+def load_html_parser() -> None:
+    """Import bs4 and soupsieve, the bulk of this integration's import time.
+
+    They are only imported by the first parse that needs a DOM, so loading
+    the integration stays cheap; call this from an executor first so that
+    import does not happen on the event loop.
+    """
+    import bs4  # noqa: F401
+    import soupsieve  # noqa: F401
+
+
+def _make_soup(html: str) -> BeautifulSoup:
+    """Parse html with bs4's built-in html.parser tree builder."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, 'html.parser')
+
+
 def get_headers(referer: str | None = None) -> dict[str, str]:
     """Get default headers for requests."""
     headers = {
@@ -55,7 +164,7 @@ def get_headers(referer: str | None = None) -> dict[str, str]:
             "image/avif,image/webp,image/apng,*/*;q=0.8"
         ),
         "Accept-Language": "vi-VN,vi;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
         "Sec-Fetch-Dest": "document",
@@ -70,17 +179,166 @@ def get_headers(referer: str | None = None) -> dict[str, str]:
     return headers
 
 
+class UndecodableBodyError(aiohttp.ClientPayloadError):
+    """A body in an encoding that was not requested, or that does not decode.
+
+    The same request would get the same body, so it is not retried.
+    """
+
+
+def _decompressor(content_encoding: str) -> Callable[[bytes], bytes] | None:
+    """Return a chunk decompressor for a Content-Encoding (None: identity)."""
+    encoding = content_encoding.strip().lower()
+    if encoding in ("", "identity"):
+        return None
+    if encoding in ("gzip", "x-gzip"):
+        # 32 + MAX_WBITS: accept both the gzip and the zlib header
+        return zlib.decompressobj(32 + zlib.MAX_WBITS).decompress
+    if encoding == "br" and brotli is not None:
+        decompressor = brotli.Decompressor()
+        # Brotli has process(), brotlipy decompress()
+        return getattr(decompressor, "process", None) or decompressor.decompress
+    raise UndecodableBodyError(f"Unsupported Content-Encoding {content_encoding!r}")
+
+
+async def _stop_reading(
+    response: aiohttp.ClientResponse, stats: StreamStats, bytes_read: int
+) -> int:
+    """Give up the rest of a body once the end marker is in; return bytes drained.
+
+    A short rest is drained, which keeps the keep-alive connection for the
+    next request; a long or unknown one closes the connection instead.
+    Content-Length counts wire bytes, as bodies are read undecompressed.
+    """
+    content_length = response.content_length
+    remaining = content_length - bytes_read if content_length is not None else None
+    if remaining is not None and remaining <= STREAM_DRAIN_MAX_BYTES:
+        drained = 0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            drained += len(chunk)
+        response.release()
+        stats.bytes_drained += drained
+        return drained
+    response.close()
+    if remaining is not None:
+        stats.bytes_skipped += max(remaining, 0)
+    return 0
+
+
+def _payload_needle(page_type: str | None) -> str | None:
+    """Return the needle to read up to past the end marker, if any."""
+    needle = PAGE_PAYLOAD_NEEDLES.get(page_type) if page_type else None
+    if needle is None:
+        return None
+    missing = _payload_missing.get(page_type)
+    if missing is not None and time.monotonic() - missing < PAYLOAD_RECHECK_INTERVAL:
+        return None
+    return needle
+
+
+async def _read_body(
+    response: aiohttp.ClientResponse,
+    page_type: str | None,
+    metrics: FetchMetrics | None = None,
+) -> str:
+    """Read and decode a response body, stopping early at the page's end marker.
+
+    The response must have been requested with auto_decompress=False: the
+    body is decompressed here, then decoded incrementally with the declared
+    charset (UTF-8 when none is sent), which skips aiohttp's charset
+    detection over the whole page. Once the end marker is seen (and the
+    script holding the page's embedded payload, see PAGE_PAYLOAD_NEEDLES)
+    the rest is not decoded, and not downloaded unless draining it is
+    cheaper (see _stop_reading). Byte counts in STREAM_STATS and metrics are
+    wire bytes.
+    """
+    end_marker = PAGE_END_MARKERS.get(page_type) if page_type else None
+    needle = _payload_needle(page_type) if end_marker else None
+    overlap = max(len(end_marker or ""), len(needle or ""), len(_SCRIPT_END)) - 1
+    marker_seen = needle_seen = False
+    stats = STREAM_STATS[page_type or "other"]
+    stats.fetches += 1
+    started = time.perf_counter()
+
+    decompress = _decompressor(response.headers.get(aiohttp.hdrs.CONTENT_ENCODING, ""))
+    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(
+        errors="replace"
+    )
+    parts: list[str] = []
+    tail = ""
+    bytes_read = bytes_decoded = drained = 0
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+        bytes_read += len(chunk)
+        if decompress is not None:
+            try:
+                chunk = decompress(chunk)
+            except Exception as err:  # zlib.error, brotli.error
+                raise UndecodableBodyError(
+                    f"Undecodable {response.headers.get(aiohttp.hdrs.CONTENT_ENCODING)} "
+                    f"body: {err}"
+                ) from err
+        bytes_decoded += len(chunk)
+        text = decoder.decode(chunk)
+        parts.append(text)
+        if end_marker is None:
+            continue
+        # Keep the end of the previous chunk so a marker split across two
+        # chunks is still found.
+        window = tail + text
+        if needle is not None:
+            start = 0 if needle_seen else window.find(needle)
+            if start != -1:
+                needle_seen = True
+                if window.find(_SCRIPT_END, start) != -1:
+                    # The payload's script is complete
+                    needle = None
+        if not marker_seen and end_marker in window:
+            marker_seen = True
+            if needle is not None:
+                stats.read_past_marker += 1
+        if marker_seen and needle is None:
+            stats.early_stops += 1
+            drained = await _stop_reading(response, stats, bytes_read)
+            _LOGGER.debug(
+                "Stopped reading %s after %d bytes (Content-Length %s, drained %d)",
+                response.url, bytes_read, response.content_length, drained,
+            )
+            break
+        tail = window[-overlap:]
+    else:
+        parts.append(decoder.decode(b"", final=True))
+        if needle is not None and not needle_seen:
+            _payload_missing[page_type] = time.monotonic()
+    if needle_seen:
+        _payload_missing.pop(page_type, None)
+    stats.bytes_read += bytes_read
+    stats.bytes_decoded += bytes_decoded
+    if metrics is not None:
+        metrics.record_download(
+            page_type or "other", time.perf_counter() - started, bytes_read + drained
+        )
+    return "".join(parts)
+
+
 async def _fetch_with_retry(
     session: aiohttp.ClientSession,
     url: str,
     headers: dict[str, str],
+    page_type: str | None = None,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
 ) -> str | None:
     """Fetch a URL with retry on transient HTTP errors and connection errors.
 
     Body is read inside the async-with block to ensure the connection stays alive
-    while reading. Returns the HTML text on success, None on failure.
+    while reading. When page_type has an end marker, reading stops once it
+    arrives (see _read_body). Returns the HTML text on success, None on failure.
+    Timings, bytes and retries are recorded in metrics when given; redirects
+    and missing pages are reported to urls when given.
     """
     for attempt in range(1, RETRY_COUNT + 1):
+        if attempt > 1 and metrics is not None:
+            metrics.record_retry(page_type or "other")
         try:
             client_timeout = aiohttp.ClientTimeout(
                 total=None,
@@ -89,12 +347,21 @@ async def _fetch_with_retry(
                 sock_connect=CONNECT_TIMEOUT,
             )
             async with session.get(
-                url, headers=headers, timeout=client_timeout
+                url, headers=headers, timeout=client_timeout,
+                trace_request_ctx={"page_type": page_type},
+                # Decompressed in _read_body, so wire bytes can be counted
+                auto_decompress=False,
             ) as response:
+                if urls is not None and page_type is not None:
+                    urls.record_response(page_type, url, response)
                 if response.status == 200:
-                    return await response.text()
+                    return await _read_body(response, page_type, metrics)
                 if response.status in RETRY_HTTP_ERRORS:
                     delay = min(INITIAL_RETRY_DELAY * (2 ** (attempt - 1)), MAX_RETRY_DELAY)
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        # Server-requested wait (429/503), still capped
+                        delay = min(max(delay, float(retry_after)), MAX_RETRY_DELAY)
                     _LOGGER.debug(
                         "HTTP %d for %s (attempt %d/%d), retrying in %.1fs...",
                         response.status, url, attempt, RETRY_COUNT, delay,
@@ -107,6 +374,9 @@ async def _fetch_with_retry(
                     response.status, url, attempt, RETRY_COUNT,
                 )
                 return None
+        except UndecodableBodyError as e:
+            _LOGGER.debug("%s for %s, not retrying", e, url)
+            return None
         except asyncio.TimeoutError:
             delay = min(INITIAL_RETRY_DELAY * (2 ** (attempt - 1)), MAX_RETRY_DELAY)
             _LOGGER.debug(
@@ -143,32 +413,52 @@ async def _fetch_with_retry(
     return None
 
 
-async def get_location_keys(session: aiohttp.ClientSession, query: str) -> list[tuple[str, str, str]]:
-    """Get location keys from AccuWeather."""
+def _page_url(
+    urls: CanonicalUrls | None, location_key: str, location_slug: str, page_type: str
+) -> str:
+    """Return a page's canonical URL when known, else the one built from the slug."""
+    if urls is not None:
+        return urls.url(page_type)
+    return default_url(location_key, location_slug, page_type)
+
+
+async def get_location_keys(
+    session: aiohttp.ClientSession, query: str
+) -> list[tuple[str, str, str]] | None:
+    """Get location keys from AccuWeather.
+
+    Returns (key, name, long name) tuples, or None when the request failed
+    or timed out after AUTOCOMPLETE_TIMEOUT seconds.
+    """
     params = {
         "query": query,
         "language": "vi"
     }
     headers = get_headers()
     headers["Accept"] = "application/json, text/javascript, */*; q=0.01"
-    
+    timeout = aiohttp.ClientTimeout(total=AUTOCOMPLETE_TIMEOUT)
+
     try:
-        async with session.get(AUTOCOMPLETE_URL, params=params, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data and isinstance(data, list):
-                    results = []
-                    for item in data:
-                        key = item.get("key")
-                        name = item.get("localizedName") 
-                        long_name = item.get("longName")
-                        if key and name:
-                            results.append((key, name, long_name))
-                    return results
+        async with session.get(
+            AUTOCOMPLETE_URL, params=params, headers=headers, timeout=timeout
+        ) as response:
+            if response.status != 200:
+                _LOGGER.debug("get_location_keys: HTTP %d", response.status)
+                return None
+            data = await response.json()
     except Exception as e:
         _LOGGER.debug("get_location_keys: %s: %s", type(e).__name__, e)
-    
-    return []
+        return None
+
+    results = []
+    if data and isinstance(data, list):
+        for item in data:
+            key = item.get("key")
+            name = item.get("localizedName")
+            long_name = item.get("longName")
+            if key and name:
+                results.append((key, name, long_name))
+    return results
 
 
 def extract_numeric_value(text: str | None) -> float | None:
@@ -253,10 +543,21 @@ def map_condition_to_ha(condition: str | None) -> str:
 
 
 async def parse_weather_html(html: str) -> dict[str, Any] | None:
-    """Parse current weather HTML (converted from get_weather.py)."""
+    """Parse current weather HTML (converted from get_weather.py).
+
+    The embedded JSON payload is tried first; the DOM scrape is the fallback.
+    """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        card = soup.select_one('.current-weather-card')
+        data = extract_current(html, map_condition_to_ha)
+        if data is not None:
+            _LOGGER.debug(
+                "parse_weather_html: embedded JSON temp=%s phrase='%s'",
+                data["temperature"], data["phrase"]
+            )
+            return data
+
+        soup = _make_soup(html)
+        card = sel.CURRENT_CARD.select_one(soup)
         if not card:
             _LOGGER.debug(
                 "parse_weather_html: .current-weather-card NOT found "
@@ -266,22 +567,22 @@ async def parse_weather_html(html: str) -> dict[str, Any] | None:
             return None
         
         # Time
-        time_element = card.select_one('.card-header .sub')
+        time_element = sel.CURRENT_TIME.select_one(card)
         time_val = time_element.text.strip() if time_element else None
         
         # Temperature
-        temp_element = card.select_one('.display-temp')
+        temp_element = sel.CURRENT_TEMP.select_one(card)
         temp_val = temp_element.text.strip() if temp_element else None
         temp_numeric = convert_temp_to_numeric(temp_val) if temp_val else None
         
         # Weather phrase/condition
-        phrase_element = card.select_one('.phrase')
+        phrase_element = sel.PHRASE.select_one(card)
         phrase_val = phrase_element.text.strip() if phrase_element else None
         condition = map_condition_to_ha(phrase_val)
         
         # RealFeel
         realfeel = realfeel_shade = None
-        extra = card.select_one('.current-weather-extra')
+        extra = sel.CURRENT_EXTRA.select_one(card)
         if extra:
             realfeel_divs = extra.find_all('div')
             if len(realfeel_divs) > 0:
@@ -291,9 +592,9 @@ async def parse_weather_html(html: str) -> dict[str, Any] | None:
         
         # Details
         details = {}
-        for item in card.select('.current-weather-details .detail-item'):
-            label = item.select_one('div:nth-child(1)')
-            value = item.select_one('div:nth-child(2)')
+        for item in sel.CURRENT_DETAIL_ITEMS.select(card):
+            label = sel.FIRST_DIV.select_one(item)
+            value = sel.SECOND_DIV.select_one(item)
             if label and value:
                 details[label.text.strip()] = value.text.strip()
         
@@ -324,17 +625,27 @@ async def parse_weather_html(html: str) -> dict[str, Any] | None:
         return None
 
 
-async def get_current_weather(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> dict[str, Any] | None:
+async def get_current_weather(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+) -> dict[str, Any] | None:
     """Get current weather data (converted from get_weather.py)."""
-    url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/current-weather/{location_key}"
+    url = _page_url(urls, location_key, location_slug, PAGE_CURRENT)
     headers = get_headers()
 
-    html = await _fetch_with_retry(session, url, headers)
+    html = await _fetch_with_retry(session, url, headers, PAGE_CURRENT, metrics, urls)
     if html is None:
         return None
 
     try:
+        parse_started = time.perf_counter()
         data = await parse_weather_html(html)
+        if metrics is not None:
+            metrics.record_parse(PAGE_CURRENT, parse_started, data)
+        PARSER_MONITOR.record(PAGE_CURRENT, html, data is not None)
         if data is None:
             _LOGGER.debug(
                 "get_current_weather: parse returned None (HTML structure changed?). URL: %s",
@@ -347,19 +658,26 @@ async def get_current_weather(session: aiohttp.ClientSession, location_key: str,
 
 
 async def parse_daily_html(html: str) -> list[dict[str, Any]]:
-    """Parse daily forecast HTML (converted from get_daily.py)."""
+    """Parse daily forecast HTML (converted from get_daily.py).
+
+    The embedded JSON payload is tried first; the DOM scrape is the fallback.
+    """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        data = extract_daily(html, map_condition_to_ha)
+        if data is not None:
+            return data
+
+        soup = _make_soup(html)
         daily = []
-        for wrapper in soup.select('.daily-wrapper'):
-            card = wrapper.select_one('.daily-forecast-card')
-            content = wrapper.select_one('.half-day-card-content')
+        for wrapper in sel.DAILY_WRAPPERS.select(soup):
+            card = sel.DAILY_CARD.select_one(wrapper)
+            content = sel.DAILY_CONTENT.select_one(wrapper)
             if not card or not content:
                 continue
             
             # Extract date from two <span> inside <h2 class="date">
             date = None
-            date_h2 = card.select_one('.info h2.date')
+            date_h2 = sel.DAILY_DATE_H2.select_one(card)
             if date_h2:
                 spans = date_h2.find_all('span')
                 if len(spans) >= 2:
@@ -367,10 +685,10 @@ async def parse_daily_html(html: str) -> list[dict[str, Any]]:
             
             # Fallback: try .date as before
             if not date:
-                date_tag = card.select_one('.date')
+                date_tag = sel.DATE.select_one(card)
                 date = date_tag.get_text(strip=True) if date_tag else None
             
-            precip = card.select_one('.precip')
+            precip = sel.PRECIP.select_one(card)
             precip_val = None
             if precip:
                 # Only get the text node, ignore SVG
@@ -379,25 +697,25 @@ async def parse_daily_html(html: str) -> list[dict[str, Any]]:
                         precip_val = extract_numeric_value(t.strip())
                         break
             
-            phrase = content.select_one('.phrase')
+            phrase = sel.PHRASE.select_one(content)
             phrase_val = phrase.get_text(strip=True) if phrase else None
             condition = map_condition_to_ha(phrase_val)
             
             # Extract high/low temp
             high = low = None
-            temp = card.select_one('.temp')
+            temp = sel.TEMP.select_one(card)
             if temp:
-                high_span = temp.select_one('.high')
-                low_span = temp.select_one('.low')
+                high_span = sel.HIGH.select_one(temp)
+                low_span = sel.LOW.select_one(temp)
                 high = convert_temp_to_numeric(high_span.get_text(strip=True)) if high_span else None
                 low = convert_temp_to_numeric(low_span.get_text(strip=True)) if low_span else None
             
             # Extract all details from panels
             details = {}
-            for panel in content.select('.panels .left, .panels .right'):
-                for p in panel.select('p.panel-item'):
+            for panel in sel.DAILY_PANELS.select(content):
+                for p in sel.PANEL_ITEMS.select(panel):
                     label = str(p.contents[0]).strip() if p.contents else None
-                    value = p.select_one('.value')
+                    value = sel.VALUE.select_one(p)
                     if label and value:
                         details[label] = value.text.strip()
             
@@ -422,17 +740,36 @@ async def parse_daily_html(html: str) -> list[dict[str, Any]]:
         return []
 
 
-async def get_daily_forecast(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> list[dict[str, Any]]:
-    """Get daily forecast data (converted from get_daily.py)."""
-    url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/daily-weather-forecast/{location_key}"
+async def get_daily_forecast(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+    page: int = 1,
+) -> list[dict[str, Any]]:
+    """Get daily forecast data (converted from get_daily.py).
+
+    `page` > 1 reads the further pages of a longer horizon (?page=N); those
+    are neither learnt from as canonical URLs nor parser health samples.
+    """
+    url = _page_url(urls, location_key, location_slug, PAGE_DAILY)
+    if page > 1:
+        url = f"{url}?page={page}"
+        urls = None
     headers = get_headers()
 
-    html = await _fetch_with_retry(session, url, headers)
+    html = await _fetch_with_retry(session, url, headers, PAGE_DAILY, metrics, urls)
     if html is None:
         return []
 
     try:
+        parse_started = time.perf_counter()
         data = await parse_daily_html(html)
+        if metrics is not None:
+            metrics.record_parse(PAGE_DAILY, parse_started, data)
+        if page == 1:
+            PARSER_MONITOR.record(PAGE_DAILY, html, bool(data))
         _LOGGER.debug(
             "get_daily_forecast: parsed %d days from %s", len(data), url
         )
@@ -442,34 +779,100 @@ async def get_daily_forecast(session: aiohttp.ClientSession, location_key: str,
         return []
 
 
+def _day_month(day: dict[str, Any]) -> tuple[int, int] | None:
+    """Return (day, month) of a daily item's "Th 5 18/9"-style date."""
+    match = re.search(r"(\d+)/(\d+)", day.get("datetime") or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def merge_daily_forecasts(*pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Concatenate daily pages in order, dropping days an earlier page had."""
+    merged: list[dict[str, Any]] = []
+    seen: set[tuple[int, int]] = set()
+    for days in pages:
+        for day in days:
+            key = _day_month(day)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            merged.append(day)
+    return merged
+
+
+def _parse_hourly_item(item: Tag) -> tuple[dict[str, Tag], dict[str, str]]:
+    """Collect one hourly accordion item's fields in a single walk of its subtree.
+
+    Equivalent to select_one() for '.hourly-card-subcontaint .date div',
+    '.temp.metric', '.real-feel__text', '.phrase' and '.precip' (first match
+    in document order), plus the label/value pair of every <p> inside any
+    '.panel'. Nested panels (e.g. under '.hourly-content-container') are
+    visited once, so each pair is extracted once.
+    """
+    from bs4 import Tag
+
+    fields: dict[str, Tag] = {}
+    details: dict[str, str] = {}
+    resolved: set[int] = set()
+    # Each entry: (tag, inside .hourly-card-subcontaint, inside its .date,
+    # inside a .panel, the enclosing panel <p> still waiting for its .value)
+    stack: list[tuple[Tag, bool, bool, bool, Tag | None]] = [
+        (child, False, False, False, None)
+        for child in reversed(item.contents)
+        if isinstance(child, Tag)
+    ]
+    while stack:
+        tag, in_sub, in_date, in_panel, pending_p = stack.pop()
+        classes = tag.get('class') or ()
+
+        if in_date and tag.name == 'div' and 'hour' not in fields:
+            fields['hour'] = tag
+        if 'temp' in classes and 'metric' in classes:
+            fields.setdefault('temp', tag)
+        if 'real-feel__text' in classes:
+            fields.setdefault('realfeel', tag)
+        if 'phrase' in classes:
+            fields.setdefault('phrase', tag)
+        if 'precip' in classes:
+            fields.setdefault('precip', tag)
+
+        if pending_p is not None and 'value' in classes and id(pending_p) not in resolved:
+            # Only the first .value inside a <p> counts, as with select_one()
+            resolved.add(id(pending_p))
+            label = str(pending_p.contents[0]).strip()
+            if label:
+                details[label] = tag.text.strip()
+        elif in_panel and tag.name == 'p' and tag.contents:
+            pending_p = tag
+
+        child_sub = in_sub or 'hourly-card-subcontaint' in classes
+        child_date = in_date or (in_sub and 'date' in classes)
+        child_panel = in_panel or 'panel' in classes
+        for child in reversed(tag.contents):
+            if isinstance(child, Tag):
+                stack.append((child, child_sub, child_date, child_panel, pending_p))
+    return fields, details
+
+
 async def parse_hourly_html(html: str) -> list[dict[str, Any]]:
-    """Parse hourly forecast HTML (converted from get_hourly.py)."""
+    """Parse hourly forecast HTML (converted from get_hourly.py).
+
+    The embedded JSON payload is tried first; the DOM scrape is the fallback.
+    """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        data = extract_hourly(html, map_condition_to_ha)
+        if data is not None:
+            return data
+
+        soup = _make_soup(html)
         hourly = []
-        for item in soup.select('.accordion-item.hour'):
-            hour = item.select_one('.hourly-card-subcontaint .date div')
-            temp = item.select_one('.temp.metric')
-            realfeel = item.select_one('.real-feel__text')
-            phrase = item.select_one('.phrase')
-            precip = item.select_one('.precip')
-            
-            # Collect all <p> label/value pairs from all .panel blocks in this hour
-            details = {}
-            for panel in item.select('.panel'):
-                for p in panel.select('p'):
-                    label = str(p.contents[0]).strip() if p.contents else None
-                    value = p.select_one('.value')
-                    if label and value:
-                        details[label] = value.text.strip()
-            
-            # Also collect from all .hourly-content-container .panel blocks
-            for content in item.select('.hourly-content-container .panel'):
-                for p in content.select('p'):
-                    label = str(p.contents[0]).strip() if p.contents else None
-                    value = p.select_one('.value')
-                    if label and value:
-                        details[label] = value.text.strip()
+        for item in sel.HOURLY_ITEMS.select(soup):
+            fields, details = _parse_hourly_item(item)
+            hour = fields.get('hour')
+            temp = fields.get('temp')
+            realfeel = fields.get('realfeel')
+            phrase = fields.get('phrase')
+            precip = fields.get('precip')
             
             phrase_val = phrase.text.strip() if phrase else None
             condition = map_condition_to_ha(phrase_val)
@@ -495,17 +898,49 @@ async def parse_hourly_html(html: str) -> list[dict[str, Any]]:
         return []
 
 
-async def get_hourly_forecast(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> list[dict[str, Any]]:
-    """Get hourly forecast data (converted from get_hourly.py)."""
-    url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/hourly-weather-forecast/{location_key}"
+async def get_hourly_forecast(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+    day: int = 1,
+    parsed: dict[int, tuple[bytes, list[dict[str, Any]]]] | None = None,
+) -> list[dict[str, Any]]:
+    """Get hourly forecast data (converted from get_hourly.py).
+
+    `day` > 1 reads the further pages of a longer horizon (?day=N); those
+    are neither learnt from as canonical URLs nor parser health samples.
+    `parsed` maps day -> (body digest, result) of earlier fetches; a body
+    identical to the last one of its day is not parsed again.
+    """
+    url = _page_url(urls, location_key, location_slug, PAGE_HOURLY)
+    if day > 1:
+        url = f"{url}?day={day}"
+        urls = None
     headers = get_headers()
 
-    html = await _fetch_with_retry(session, url, headers)
+    html = await _fetch_with_retry(session, url, headers, PAGE_HOURLY, metrics, urls)
     if html is None:
         return []
 
+    digest = hashlib.blake2b(html.encode(), digest_size=16).digest()
+    if parsed is not None:
+        cached = parsed.get(day)
+        if cached is not None and cached[0] == digest:
+            CACHE_STATS[HOURLY_PAGE_CACHE].hits += 1
+            return cached[1]
+        CACHE_STATS[HOURLY_PAGE_CACHE].misses += 1
+
     try:
+        parse_started = time.perf_counter()
         data = await parse_hourly_html(html)
+        if metrics is not None:
+            metrics.record_parse(PAGE_HOURLY, parse_started, data)
+        if day == 1:
+            PARSER_MONITOR.record(PAGE_HOURLY, html, bool(data))
+        if parsed is not None and data:
+            parsed[day] = (digest, data)
         _LOGGER.debug(
             "get_hourly_forecast: parsed %d hours from %s", len(data), url
         )
@@ -515,22 +950,95 @@ async def get_hourly_forecast(session: aiohttp.ClientSession, location_key: str,
         return []
 
 
+def _hour_of_day(text: str | None) -> int | None:
+    """Return the hour of an hourly item's "14:00" / "2 CH" / "2 PM" time."""
+    match = re.match(r"\s*(\d{1,2})(?::\d{2})?\s*([A-Za-z]{2})?", text or "")
+    if not match:
+        return None
+    hour = int(match.group(1))
+    suffix = (match.group(2) or "").upper()
+    if suffix in ("CH", "PM") and hour < 12:
+        hour += 12
+    elif suffix in ("SA", "AM") and hour == 12:
+        hour = 0
+    return hour if hour < 24 else None
+
+
+def merge_hourly_forecasts(pages: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Merge hourly pages into one series ordered by time, without repeats.
+
+    Items only carry a time of day, so hours are counted from the first
+    page's first item: within a page an hour earlier than the previous one
+    is on the next day, and each further page starts at the first matching
+    hour after the previous page's start. Pages must be consecutive, so the
+    series stops at the first empty page; earlier pages win for an hour
+    several pages have.
+    """
+    by_hour: dict[int, dict[str, Any]] = {}
+    page_start = -1
+    for items in pages:
+        if not items:
+            break
+        first = _hour_of_day(items[0].get("datetime"))
+        if first is None:
+            break
+        offset = page_start + 1 + (first - page_start - 1) % 24
+        page_start = offset
+        previous = first
+        for item in items:
+            hour = _hour_of_day(item.get("datetime"))
+            if hour is None:
+                continue
+            offset += (hour - previous) % 24
+            previous = hour
+            by_hour.setdefault(offset, item)
+    return [by_hour[offset] for offset in sorted(by_hour)]
+
+
+def hourly_times(items: list[dict[str, Any]], now: datetime) -> list[datetime | None]:
+    """Return the start time of each hourly item (None where it is unreadable).
+
+    The first item is placed at the occurrence of its hour nearest to
+    `now`, later ones are counted on from it as merge_hourly_forecasts
+    does. Without a readable first hour, items are taken as consecutive
+    hours from the current one.
+    """
+    base = now.replace(minute=0, second=0, microsecond=0)
+    first = _hour_of_day(items[0].get("datetime")) if items else None
+    if first is None:
+        return [base + timedelta(hours=i) for i in range(len(items))]
+    offset = (first - base.hour) % 24
+    if offset > 12:
+        offset -= 24
+    previous = first
+    times: list[datetime | None] = []
+    for item in items:
+        hour = _hour_of_day(item.get("datetime"))
+        if hour is None:
+            times.append(None)
+            continue
+        offset += (hour - previous) % 24
+        previous = hour
+        times.append(base + timedelta(hours=offset))
+    return times
+
+
 async def parse_air_html(html: str) -> dict[str, Any]:
     """Parse air quality HTML (converted from get_air.py)."""
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        aqi_cat = soup.select_one('.air-quality-card .category')
-        aqi_desc = soup.select_one('.air-quality-card .statement')
+        soup = _make_soup(html)
+        aqi_cat = sel.AIR_CATEGORY.select_one(soup)
+        aqi_desc = sel.AIR_STATEMENT.select_one(soup)
         
         pollutants = {}
-        for pol in soup.select('.air-quality-pollutant'):
+        for pol in sel.AIR_POLLUTANTS.select(soup):
             qa = pol.get('data-qa', '')
             name = str(qa).replace('airQualityPollutant', '') if qa else None
             aqi = None
             value = None
             unit = None
             
-            aqi_el = pol.select('h3.column')
+            aqi_el = sel.AIR_POLLUTANT_AQI.select(pol)
             if aqi_el and len(aqi_el) > 0:
                 aqi = extract_numeric_value(aqi_el[0].get_text(strip=True))
             
@@ -553,17 +1061,29 @@ async def parse_air_html(html: str) -> dict[str, Any]:
         return {'category': None, 'description': None, 'pollutants': {}}
 
 
-async def get_air_quality(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> dict[str, Any]:
+async def get_air_quality(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+) -> dict[str, Any]:
     """Get air quality data (converted from get_air.py)."""
-    url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/air-quality-index/{location_key}"
+    url = _page_url(urls, location_key, location_slug, PAGE_AIR)
     headers = get_headers()
 
-    html = await _fetch_with_retry(session, url, headers)
+    html = await _fetch_with_retry(session, url, headers, PAGE_AIR, metrics, urls)
     if html is None:
         return {"category": None, "description": None, "pollutants": {}}
 
     try:
+        parse_started = time.perf_counter()
         data = await parse_air_html(html)
+        if metrics is not None:
+            metrics.record_parse(PAGE_AIR, parse_started, data)
+        PARSER_MONITOR.record(
+            PAGE_AIR, html, bool(data.get("category") or data.get("pollutants"))
+        )
         pollutant_count = len(data.get("pollutants", {}))
         _LOGGER.debug(
             "get_air_quality: parsed %d pollutants from %s", pollutant_count, url
@@ -588,25 +1108,15 @@ async def parse_health_html(html: str, group_slug: str = '') -> list[dict[str, A
     try:
         result: list[dict[str, Any]] = []
 
-        # Find ALL indexListData instances in the page
-        index_list_matches = re.findall(
-            r'var indexListData\s*=\s*(\[.*?\]);', html, re.DOTALL
-        )
-
-        if not index_list_matches:
-            _LOGGER.debug(
-                'parse_health_html: no indexListData found, returning empty list'
-            )
-            return result
-
-        for json_str in index_list_matches:
-            try:
-                data = json.loads(json_str)
-            except json.JSONDecodeError:
+        # Decode ALL indexListData assignments in one pass over the page
+        sections = 0
+        for data in iter_assigned_json(html, 'indexListData'):
+            if not isinstance(data, list):
                 _LOGGER.debug(
-                    'parse_health_html: failed to decode indexListData JSON, skipping'
+                    'parse_health_html: indexListData is not a list, skipping'
                 )
                 continue
+            sections += 1
 
             for item in data:
                 result.append({
@@ -625,9 +1135,15 @@ async def parse_health_html(html: str, group_slug: str = '') -> list[dict[str, A
                     'categoryGroup': group_slug,
                 })
 
+        if not sections:
+            _LOGGER.debug(
+                'parse_health_html: no indexListData found, returning empty list'
+            )
+            return result
+
         _LOGGER.debug(
             'parse_health_html: parsed %d health activities from %d sections',
-            len(result), len(index_list_matches)
+            len(result), sections
         )
         return result
 
@@ -636,7 +1152,13 @@ async def parse_health_html(html: str, group_slug: str = '') -> list[dict[str, A
         return []
 
 
-async def crawl_all_health_activities(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> dict[str, list[dict[str, Any]]]:
+async def crawl_all_health_activities(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+) -> dict[str, list[dict[str, Any]]]:
     """Crawl all health activities by category (converted from get_all_health.py).
 
     AccuWeather redesigned the site - all activities are listed on the main
@@ -676,10 +1198,16 @@ async def crawl_all_health_activities(session: aiohttp.ClientSession, location_k
 
     # Chỉ crawl trang health-activities chính, KHÔNG crawl subpages (404)
     try:
-        main_url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/health-activities/{location_key}"
-        html = await _fetch_with_retry(session, main_url, headers)
+        main_url = _page_url(urls, location_key, location_slug, PAGE_HEALTH)
+        html = await _fetch_with_retry(
+            session, main_url, headers, PAGE_HEALTH, metrics, urls
+        )
         if html:
+            parse_started = time.perf_counter()
             activities = await parse_health_html(html, 'health')
+            if metrics is not None:
+                metrics.record_parse(PAGE_HEALTH, parse_started, activities)
+            PARSER_MONITOR.record(PAGE_HEALTH, html, bool(activities))
 
             for activity in activities:
                 slug = activity.get('slug', '')
@@ -699,17 +1227,32 @@ async def crawl_all_health_activities(session: aiohttp.ClientSession, location_k
     return groups
 
 
-async def get_minutecast_data(session: aiohttp.ClientSession, location_key: str, location_slug: str) -> dict[str, Any] | None:
+async def get_minutecast_data(
+    session: aiohttp.ClientSession,
+    location_key: str,
+    location_slug: str,
+    metrics: FetchMetrics | None = None,
+    urls: CanonicalUrls | None = None,
+) -> dict[str, Any] | None:
     """Get MinuteCast data (minute-by-minute precipitation forecast)."""
-    url = f"{BASE_URL}/vi/vn/{location_slug}/{location_key}/minute-weather-forecast/{location_key}"
+    url = _page_url(urls, location_key, location_slug, PAGE_MINUTECAST)
     headers = get_headers()
 
-    html = await _fetch_with_retry(session, url, headers)
+    html = await _fetch_with_retry(session, url, headers, PAGE_MINUTECAST, metrics, urls)
     if html is None:
         return None
 
     try:
+        parse_started = time.perf_counter()
         data = await parse_minutecast_html(html)
+        if metrics is not None:
+            metrics.record_parse(PAGE_MINUTECAST, parse_started, data)
+        PARSER_MONITOR.record(
+            PAGE_MINUTECAST,
+            html,
+            data.get("current_temperature") is not None
+            or data.get("current_condition") is not None,
+        )
         _LOGGER.debug(
             "get_minutecast_data: summary='%s' from %s",
             data.get("summary", "")[:50], url
@@ -721,25 +1264,36 @@ async def get_minutecast_data(session: aiohttp.ClientSession, location_key: str,
 
 
 async def parse_minutecast_html(html: str) -> dict[str, Any]:
-    """Parse MinuteCast HTML to extract precipitation forecast."""
+    """Parse MinuteCast HTML to extract precipitation forecast.
+
+    The embedded minute-by-minute payload is read first (see minutecast.py).
+    The DOM is only built when it carries no current conditions, and the
+    fallbacks search the raw HTML instead of the whole document's text.
+    """
+    empty_window = {
+        'minutes_until_precipitation': None,
+        'minutes_until_dry': None,
+        'precipitation_start': None,
+        'precipitation_end': None,
+        'series': None,
+    }
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        embedded = extract_minutecast(html)
+        if embedded is not None and embedded["current_temperature"] is not None:
+            return embedded
+
+        soup = _make_soup(html)
         
         # Find MinuteCast summary - the main precipitation forecast text
         summary = None
-        summary_selectors = [
-            '.minute-cast-chart .summary',
-            '.minute-cast-chart',
-            '.minutecast-summary',
-            '.chart-summary'
-        ]
-        
-        for selector in summary_selectors:
-            summary_element = soup.select_one(selector)
+        for selector in sel.MINUTECAST_SUMMARIES:
+            summary_element = selector.select_one(soup)
             if summary_element:
                 summary = summary_element.get_text(strip=True)
                 if summary:  # Only break if we actually got text
                     break
+        if not summary and embedded is not None:
+            summary = embedded["summary"]
         
         # Extract current weather info from the page
         current_temp = None
@@ -748,21 +1302,15 @@ async def parse_minutecast_html(html: str) -> dict[str, Any]:
         current_time = None
         
         # Look for current weather section
-        current_weather_selectors = [
-            '.current-weather',
-            '.minute-cast-current', 
-            '.current-conditions'
-        ]
-        
         current_section = None
-        for selector in current_weather_selectors:
-            current_section = soup.select_one(selector)
+        for selector in sel.MINUTECAST_CURRENT_SECTIONS:
+            current_section = selector.select_one(soup)
             if current_section:
                 break
         
         if current_section:
             # Extract temperature from current weather section
-            temp_element = current_section.select_one('.temp, .temperature')
+            temp_element = sel.MINUTECAST_TEMP.select_one(current_section)
             if temp_element:
                 temp_text = temp_element.get_text(strip=True)
                 temp_match = re.search(r'(\d+)°', temp_text)
@@ -770,12 +1318,12 @@ async def parse_minutecast_html(html: str) -> dict[str, Any]:
                     current_temp = int(temp_match.group(1))
             
             # Extract condition from current weather section
-            condition_element = current_section.select_one('.phrase, .condition, .weather-phrase')
+            condition_element = sel.MINUTECAST_CONDITION.select_one(current_section)
             if condition_element:
                 current_condition = condition_element.get_text(strip=True)
             
             # Extract RealFeel from current weather section
-            realfeel_element = current_section.select_one('.realfeel, .real-feel')
+            realfeel_element = sel.MINUTECAST_REALFEEL.select_one(current_section)
             if realfeel_element:
                 realfeel_text = realfeel_element.get_text(strip=True)
                 realfeel_match = re.search(r'(\d+)°', realfeel_text)
@@ -783,47 +1331,52 @@ async def parse_minutecast_html(html: str) -> dict[str, Any]:
                     realfeel = int(realfeel_match.group(1))
             
             # Extract time from current weather section
-            time_element = current_section.select_one('.time, .current-time')
+            time_element = sel.MINUTECAST_TIME.select_one(current_section)
             if time_element:
                 current_time = time_element.get_text(strip=True)
         
-        # Fallback: search in full page text if current section not found
-        if not current_temp or not realfeel or not current_time or not current_condition:
-            body_text = soup.get_text()
-            
-            # Try to extract condition from JSON data in the page (HTML encoded)
-            if not current_condition:
-                # Look for pattern: \&quot;Phrase\&quot;:\&quot;Some text\&quot;
-                phrase_match = re.search(r'\\&quot;Phrase\\&quot;:\\&quot;([^\\]+)\\&quot;', html)
-                if phrase_match:
-                    current_condition = phrase_match.group(1)
-            
-            # Temperature fallback
-            if not current_temp:
-                temp_match = re.search(r'(\d+)°\s*C', body_text)
-                if temp_match:
-                    current_temp = int(temp_match.group(1))
-            
-            # RealFeel fallback  
-            if not realfeel:
-                realfeel_match = re.search(r'RealFeel®?\s*(\d+)°', body_text)
-                if realfeel_match:
-                    realfeel = int(realfeel_match.group(1))
-            
-            # Time fallback
-            if not current_time:
-                time_match = re.search(r'\d{2}:\d{2}', body_text)
-                if time_match:
-                    current_time = time_match.group(0)
+        # Fallback: search the raw HTML (never the whole document's text);
+        # the patterns allow tags between a value and its unit.
+        if not current_condition and embedded is not None:
+            current_condition = embedded["current_condition"]
+
+        if not current_condition:
+            # Look for pattern: \&quot;Phrase\&quot;:\&quot;Some text\&quot;
+            phrase_match = re.search(_MINUTECAST_PHRASE_PATTERN, html)
+            if phrase_match:
+                current_condition = phrase_match.group(1)
         
-        return {
-            'summary': summary or 'Không có dữ liệu MinuteCast',
+        # Temperature fallback
+        if not current_temp:
+            temp_match = re.search(_MINUTECAST_TEMP_PATTERN, html)
+            if temp_match:
+                current_temp = int(temp_match.group(1))
+        
+        # RealFeel fallback  
+        if not realfeel:
+            realfeel_match = re.search(_MINUTECAST_REALFEEL_PATTERN, html)
+            if realfeel_match:
+                realfeel = int(realfeel_match.group(1))
+        
+        # Time fallback: a text node that is only a clock time
+        if not current_time:
+            time_match = re.search(_MINUTECAST_TIME_PATTERN, html)
+            if time_match:
+                current_time = time_match.group(1)
+        
+        result = {
+            'summary': summary or MINUTECAST_NO_DATA,
             'current_temperature': current_temp,
             'current_condition': current_condition,
             'realfeel': realfeel,
             'current_time': current_time,
             'forecast_type': 'minutecast'
         }
+        if embedded is not None:
+            result.update({key: embedded[key] for key in empty_window})
+        else:
+            result.update(empty_window)
+        return result
         
     except Exception as e:
         _LOGGER.debug("parse_minutecast_html: %s: %s", type(e).__name__, e)
@@ -833,5 +1386,6 @@ async def parse_minutecast_html(html: str) -> dict[str, Any]:
             'current_condition': None,
             'realfeel': None,
             'current_time': None,
-            'forecast_type': 'minutecast'
+            'forecast_type': 'minutecast',
+            **empty_window,
         }
@@ -25,14 +25,15 @@ from homeassistant.components.weather import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPressure, UnitOfSpeed, UnitOfTemperature, UnitOfLength
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, PAGE_DAILY, PAGE_HOURLY
 from .coordinator import AccuWeatherDataUpdateCoordinator
 from .device import get_device_info
+from .utils import hourly_times
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +66,36 @@ class AccuWeatherEntity(CoordinatorEntity[AccuWeatherDataUpdateCoordinator], Wea
         self._attr_name = f"AccuWeather {coordinator.location_name}"
         self._attr_unique_id = f"accuweather_{coordinator.location_key}"
         self._attr_device_info = get_device_info(coordinator.location_key, coordinator.location_name)
+        # Forecast type -> removes this entity's forecast listener on the coordinator
+        self._forecast_listener_removers: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def _async_subscription_started(self, forecast_type: str) -> None:
+        """Have the coordinator fetch a forecast page while it is subscribed to."""
+        page_type = {"daily": PAGE_DAILY, "hourly": PAGE_HOURLY}.get(forecast_type)
+        if page_type is not None:
+            self._forecast_listener_removers[forecast_type] = (
+                self.coordinator.async_add_forecast_listener(page_type)
+            )
+
+    @callback
+    def _async_subscription_ended(self, forecast_type: str) -> None:
+        """Stop fetching a forecast page nobody subscribes to any more."""
+        if remove := self._forecast_listener_removers.pop(forecast_type, None):
+            remove()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Release the forecast listeners of subscriptions still open."""
+        await super().async_will_remove_from_hass()
+        for remove in self._forecast_listener_removers.values():
+            remove()
+        self._forecast_listener_removers.clear()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state and push the refreshed forecasts to subscribers."""
+        super()._handle_coordinator_update()
+        self.hass.async_create_task(self.async_update_listeners(None))
 
     @property
     def condition(self) -> str | None:
@@ -246,10 +277,10 @@ class AccuWeatherEntity(CoordinatorEntity[AccuWeatherDataUpdateCoordinator], Wea
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
-        if not self.coordinator.data or "daily_forecast" not in self.coordinator.data:
+        if not self.coordinator.data:
             return None
         
-        daily_data = self.coordinator.data["daily_forecast"]
+        daily_data = await self.coordinator.async_forecast(PAGE_DAILY)
         if not daily_data:
             return None
         
@@ -312,21 +343,19 @@ class AccuWeatherEntity(CoordinatorEntity[AccuWeatherDataUpdateCoordinator], Wea
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast."""
-        if not self.coordinator.data or "hourly_forecast" not in self.coordinator.data:
+        if not self.coordinator.data:
             return None
         
-        hourly_data = self.coordinator.data["hourly_forecast"]
+        hourly_data = await self.coordinator.async_forecast(PAGE_HOURLY)
         if not hourly_data:
             return None
         
         forecasts = []
-        base_date = dt_util.now().replace(minute=0, second=0, microsecond=0)
-        
-        for i, hour in enumerate(hourly_data):
-            # Calculate datetime for this hour
-            forecast_date = base_date.replace(hour=(base_date.hour + i) % 24)
-            if base_date.hour + i >= 24:
-                forecast_date = forecast_date.replace(day=forecast_date.day + 1)
+        for hour, forecast_date in zip(
+            hourly_data, hourly_times(hourly_data, dt_util.now())
+        ):
+            if forecast_date is None:
+                continue
             
             forecast = Forecast(
                 datetime=forecast_date.isoformat(),